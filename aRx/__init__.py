@@ -5,22 +5,61 @@ A library to make asynchronous reactive programming in python easy to use.
 Its main purpose is to provide a framework for reactive programming built
 following python's standard on top of asyncio module's constructs.
 
+Subpackages are only imported when first accessed.
+
 This Source Code Form is subject to the terms of the Mozilla Public
 License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
 # Internal
-from importlib.metadata import version
+import typing as T
+from importlib import import_module
+
+if T.TYPE_CHECKING:
+    # Project
+    from . import (
+        codecs,
+        errors,
+        streams,
+        namespace,
+        observers,
+        operators,
+        protocols,
+        operations,
+        predicates,
+        observables,
+    )
+
+# Single source of the package version, read by setup.cfg
+__version__ = "3.0.0b2"
+
+_SUBMODULES = frozenset(
+    (
+        "codecs",
+        "errors",
+        "streams",
+        "namespace",
+        "observers",
+        "operators",
+        "protocols",
+        "operations",
+        "predicates",
+        "observables",
+    )
+)
+
+
+def __getattr__(name: str) -> T.Any:
+    if name in _SUBMODULES:
+        # import_module also binds the submodule to this package, so this is only called once
+        return import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-try:
-    __version__: str = version(__name__)
-except Exception:  # pragma: no cover
-    # Internal
-    import traceback
-    from warnings import warn
+def __dir__() -> T.List[str]:
+    return sorted(set(globals()) | _SUBMODULES)
 
-    warn(f"Failed to set version due to:\n{traceback.format_exc()}", ImportWarning)
-    __version__ = "0.0a0"
 
 __all__ = ("__version__",)
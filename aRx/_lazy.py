@@ -0,0 +1,49 @@
+"""Lazy
+
+Helpers to defer the import of a package's members until they are first accessed.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import sys
+import typing as T
+from importlib import import_module
+
+
+def lazy_exports(
+    package: str, exports: T.Mapping[str, str]
+) -> T.Tuple[T.Callable[[str], T.Any], T.Callable[[], T.List[str]]]:
+    """Create module level ``__getattr__`` and ``__dir__`` that import members on demand.
+
+    Arguments:
+        package: Name of the package exporting the members.
+        exports: Map of member names to the relative name of the module defining them.
+
+    Returns:
+        ``__getattr__`` and ``__dir__`` implementations for the package.
+
+    """
+
+    def __getattr__(name: str) -> T.Any:
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        value = getattr(import_module(module, package), name)
+
+        # Cache member in package namespace, so this is only called once per member
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__() -> T.List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+__all__ = ("lazy_exports",)
@@ -0,0 +1,162 @@
+"""Codecs
+
+Serialization formats, for use with :class:`~aRx.operators.Encode` and
+:class:`~aRx.operators.Decode`.
+
+Each codec converts single values, or whole batches of values at once, to and from their
+serialized form. Batches are encoded together into a single contiguous buffer.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from abc import ABCMeta, abstractmethod
+from pickle import HIGHEST_PROTOCOL, PickleBuffer, dumps, loads
+from struct import Struct
+
+# Buffer types accepted when decoding
+Buffer = T.Union[bytes, bytearray, memoryview]
+
+
+class Encoded(T.NamedTuple):
+    """Pickled data, together with the buffers that were kept out of it."""
+
+    data: bytes
+    buffers: T.Tuple[PickleBuffer, ...] = ()
+
+    @property
+    def nbytes(self) -> int:
+        """Total size, in bytes, of data and buffers."""
+        return len(self.data) + sum(buffer.raw().nbytes for buffer in self.buffers)
+
+
+class Codec(metaclass=ABCMeta):
+    """Base class for codecs."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def encode(self, value: T.Any) -> T.Any:
+        """Serialize a single value."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, data: T.Any) -> T.Any:
+        """Deserialize a single value, encoded by :meth:`encode`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def encode_many(self, values: T.Iterable[T.Any]) -> T.Any:
+        """Serialize a batch of values together."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode_many(self, data: T.Any) -> T.List[T.Any]:
+        """Deserialize a batch of values, encoded by :meth:`encode_many`."""
+        raise NotImplementedError
+
+
+class PickleCodec(Codec):
+    """Codec for arbitrary values, based on pickle.
+
+    With out_of_band, objects that support pickle protocol 5 buffers, like NumPy arrays or
+    payloads wrapped in a :class:`~pickle.PickleBuffer`, aren't copied into the pickled data.
+    Their buffers are referenced, instead, by the resulting :class:`Encoded`, which must be given
+    back whole to :meth:`decode`. Otherwise values are encoded to bytes.
+    """
+
+    __slots__ = ("_protocol", "_out_of_band")
+
+    def __init__(self, protocol: int = HIGHEST_PROTOCOL, *, out_of_band: bool = True) -> None:
+        """PickleCodec constructor.
+
+        Arguments:
+            protocol: Pickle protocol used.
+            out_of_band: Whether to keep buffers out of the pickled data, requires protocol 5.
+
+        """
+        if out_of_band and protocol < 5:
+            raise ValueError("PickleCodec out of band buffers require pickle protocol 5")
+
+        self._protocol = protocol
+        self._out_of_band = out_of_band
+
+    def encode(self, value: T.Any) -> T.Union[bytes, Encoded]:
+        if not self._out_of_band:
+            return dumps(value, protocol=self._protocol)
+
+        buffers: T.List[PickleBuffer] = []
+        data = dumps(value, protocol=self._protocol, buffer_callback=buffers.append)
+        return Encoded(data, tuple(buffers))
+
+    def decode(self, data: T.Union[Buffer, Encoded]) -> T.Any:
+        if isinstance(data, Encoded):
+            return loads(data.data, buffers=data.buffers)
+
+        return loads(data)
+
+    def encode_many(self, values: T.Iterable[T.Any]) -> T.Union[bytes, Encoded]:
+        return self.encode(values if isinstance(values, list) else list(values))
+
+    def decode_many(self, data: T.Union[Buffer, Encoded]) -> T.List[T.Any]:
+        values = self.decode(data)
+        if not isinstance(values, list):
+            raise TypeError("PickleCodec data doesn't hold a batch of values")
+
+        return values
+
+
+class StructCodec(Codec):
+    """Codec for records of a fixed schema, described by a :mod:`struct` format.
+
+    Records are encoded from, and decoded to, tuples of fields, or instances of factory when
+    given, such as a NamedTuple. Batches are packed back to back, each record at a fixed offset,
+    in a single preallocated buffer, and unpacked directly from the given buffer.
+    """
+
+    __slots__ = ("_struct", "_factory")
+
+    def __init__(self, format: str, factory: T.Optional[T.Callable[..., T.Any]] = None) -> None:
+        """StructCodec constructor.
+
+        Arguments:
+            format: Struct format of each record.
+            factory: Callable that builds a value from the unpacked fields of a record.
+
+        """
+        self._struct = Struct(format)
+        self._factory = factory
+
+    @property
+    def size(self) -> int:
+        """Size, in bytes, of each encoded record."""
+        return self._struct.size
+
+    def encode(self, value: T.Iterable[T.Any]) -> bytes:
+        return self._struct.pack(*value)
+
+    def decode(self, data: Buffer) -> T.Any:
+        fields = self._struct.unpack(data)
+        return fields if self._factory is None else self._factory(*fields)
+
+    def encode_many(self, values: T.Iterable[T.Iterable[T.Any]]) -> bytearray:
+        batch = values if isinstance(values, (list, tuple)) else list(values)
+
+        size = self._struct.size
+        pack_into = self._struct.pack_into
+        buffer = bytearray(size * len(batch))
+        for offset, value in zip(range(0, len(buffer), size), batch):
+            pack_into(buffer, offset, *value)
+
+        return buffer
+
+    def decode_many(self, data: Buffer) -> T.List[T.Any]:
+        records = self._struct.iter_unpack(data)
+        factory = self._factory
+        return list(records) if factory is None else [factory(*fields) for fields in records]
+
+
+__all__ = ("Codec", "Encoded", "PickleCodec", "StructCodec", "Buffer")
@@ -52,6 +52,16 @@ class ObserverClosedError(ObserverError):
     pass
 
 
+class ObservationTimeoutError(ARxError, TimeoutError):
+    """aRx error used by :class:`~aRx.operators.Timeout`.
+
+    Signalize when data took longer than allowed to arrive or to be handled.
+
+    """
+
+    pass
+
+
 class SingleStreamError(ARxError):
     """aRx error exclusive to :class:`~aRx.streams.single_stream.SingleStream`."""
 
@@ -64,4 +74,5 @@ __all__ = (
     "SingleStreamError",
     "ObserverClosedError",
     "ConsumerClosedError",
+    "ObservationTimeoutError",
 )
@@ -13,12 +13,56 @@ from dataclasses import InitVar, field, dataclass
 _ref_map: T.MutableMapping[int, object] = WeakValueDictionary()
 
 
+class _ChainIndex:
+    """Closest namespace for each action, type and reference, within a section of a chain.
+
+    Only the namespaces of its own section are held, lookups they can't resolve are delegated to
+    the index of the preceding section, and their results are cached along the way.
+    """
+
+    __slots__ = ("base", "refs", "types", "actions")
+
+    def __init__(self, base: T.Optional["_ChainIndex"] = None) -> None:
+        self.base = base
+        self.refs: T.Dict[int, T.Optional["Namespace"]] = {}
+        self.types: T.Dict[T.Type[T.Any], T.Optional["Namespace"]] = {}
+        self.actions: T.Dict[str, T.Optional["Namespace"]] = {}
+
+    def add(self, namespace: "Namespace") -> None:
+        ref = namespace.ref
+        if ref is not None:
+            self.refs[id(ref)] = namespace
+        self.types[namespace.type] = namespace
+        self.actions[namespace.action] = namespace
+
+    def get(self, table: str, key: T.Hashable) -> T.Optional["Namespace"]:
+        """Retrieve the closest namespace matching key, in the given table, along the chain."""
+        missed = []
+        index: T.Optional[_ChainIndex] = self
+        while index is not None:
+            entries: T.Dict[T.Any, T.Optional["Namespace"]] = getattr(index, table)
+            if key in entries:
+                result = entries[key]
+                break
+
+            missed.append(entries)
+            index = index.base
+        else:
+            result = None
+
+        for entries in missed:
+            entries[key] = result
+
+        return result
+
+
 @dataclass
 class Namespace:
     obj: InitVar[object]
     type: T.Type[T.Any] = field(init=False)
     action: str
     previous: T.Optional["Namespace"] = None
+    _index: T.Optional[_ChainIndex] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self, obj: object) -> None:
         _ref_map[self.id] = obj
@@ -54,32 +98,65 @@ class Namespace:
         """
         return self.previous is None
 
-    @staticmethod
-    def _search_strategies(
-        item: T.Union[str, object, T.Type[T.Any]]
-    ) -> T.Callable[["Namespace"], bool]:
-        if isinstance(item, str):
-            return lambda namespace: namespace.action != item
-        elif isinstance(item, type):
-            return lambda namespace: namespace.type != item
-        else:
-            return lambda namespace: namespace.ref is not item
+    def _chain_index(self) -> _ChainIndex:
+        """Build, or retrieve, the index for the chain ending at this namespace.
 
-    def search(self, item: T.Union[str, object, T.Type[T.Any]]) -> T.Optional["Namespace"]:
-        """Search the chain for a namespace that matches the given item.
+        The index only holds the namespaces up to the closest one in the chain that was already
+        indexed, and shares the index of that one, so each link is only indexed once no matter
+        how many chains branch from it.
 
         Returns:
-            First namespace match
+            Index of the chain.
 
         """
-        strategy = self._search_strategies(item)
+        if self._index is not None:
+            return self._index
+
+        pending = []
+        namespace: T.Optional[Namespace] = self
+        while namespace is not None and namespace._index is None:
+            pending.append(namespace)
+            namespace = namespace.previous
+
+        index = _ChainIndex(None if namespace is None else namespace._index)
+
+        # Closer namespaces must take precedence, so they are added last
+        for namespace in reversed(pending):
+            index.add(namespace)
+
+        self._index = index
+
+        return index
+
+    def _linear_search(self, item: object) -> T.Optional["Namespace"]:
         namespace: T.Optional[Namespace] = self
 
-        while namespace and strategy(namespace):
+        while namespace and namespace.ref is not item:
             namespace = namespace.previous
 
         return namespace
 
+    def search(self, item: T.Union[str, object, T.Type[T.Any]]) -> T.Optional["Namespace"]:
+        """Search the chain for a namespace that matches the given item.
+
+        Returns:
+            First namespace match
+
+        """
+        index = self._chain_index()
+
+        if isinstance(item, str):
+            return index.get("actions", item)
+        elif isinstance(item, type):
+            return index.get("types", item)
+
+        namespace = index.get("refs", id(item))
+        if namespace is None or namespace.ref is item:
+            return namespace
+
+        # Indexed reference died and its id was reused by item, fallback to walking the chain
+        return self._linear_search(item)
+
     def __contains__(self, item: T.Union[str, object, T.Type[T.Any]]) -> bool:
         return self.search(item) is not None
 
@@ -8,9 +8,25 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+# Internal
+import typing as T
+
 # Project
-from .observable import Observable
-from .from_iterable import FromIterable
-from .from_async_iterable import FromAsyncIterable
+from .._lazy import lazy_exports
+
+if T.TYPE_CHECKING:
+    # Project
+    from .observable import Observable
+    from .from_iterable import FromIterable
+    from .from_async_iterable import FromAsyncIterable
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Observable": ".observable",
+        "FromIterable": ".from_iterable",
+        "FromAsyncIterable": ".from_async_iterable",
+    },
+)
 
 __all__ = ("FromAsyncIterable", "FromIterable", "Observable")
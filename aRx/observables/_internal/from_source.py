@@ -8,7 +8,7 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Internal
 import typing as T
 from abc import abstractmethod
-from asyncio import Task, get_running_loop
+from asyncio import Task, wait, get_running_loop
 
 # External
 from async_tools.abstract import AsyncABCMeta
@@ -28,7 +28,8 @@ L = T.TypeVar("L")
 
 
 class FromSource(T.Generic[K, L], Observable[K], metaclass=AsyncABCMeta):
-    __slots__ = ("_task", "_source", "_observer", "_namespace")
+    # Namespace keeps a weak reference to its object
+    __slots__ = ("_task", "_source", "_observer", "_namespace", "__weakref__")
 
     def __init__(self, source: L, **kwargs: T.Any) -> None:
         """FromAsyncIterable constructor.
@@ -76,6 +77,12 @@ class FromSource(T.Generic[K, L], Observable[K], metaclass=AsyncABCMeta):
         self._task = None
         self._observer = None
 
+    async def join(self) -> None:
+        """Wait until all data from source was pushed, or the observation was disposed."""
+        task = self._task
+        if task is not None:
+            await wait((task,))
+
     @abstractmethod
     async def _worker(self) -> None:
         raise NotImplementedError
@@ -19,6 +19,8 @@ K = T.TypeVar("K")
 class FromAsyncIterable(FromSource[K, T.AsyncIterator[K]]):
     """Observable that uses an async iterable as data source."""
 
+    __slots__ = ()
+
     def __init__(self, async_iterable: T.AsyncIterable[K], **kwargs: T.Any) -> None:
         """FromAsyncIterable constructor.
 
@@ -9,8 +9,15 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import typing as T
 
 # Project
+from ..observers import Observer
 from ._internal.from_source import FromSource
 
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+    from ..protocols import ObserverProtocol
+
+
 # Generic Types
 K = T.TypeVar("K")
 
@@ -18,6 +25,8 @@ K = T.TypeVar("K")
 class FromIterable(FromSource[K, T.Iterator[K]]):
     """Observable that uses an iterable as data source."""
 
+    __slots__ = ()
+
     def __init__(self, iterable: T.Iterable[K], **kwargs: T.Any) -> None:
         """FromIterable constructor.
 
@@ -31,14 +40,57 @@ class FromIterable(FromSource[K, T.Iterator[K]]):
     async def _worker(self) -> None:
         assert self._observer is not None
 
+        await self._feed(self._observer)
+
+    def _push(
+        self, observer: "ObserverProtocol[K]"
+    ) -> T.Generator[T.Awaitable[T.Any], None, None]:
+        """Push data from source into observer, synchronously whenever possible.
+
+        Yields every awaitable that must be awaited before more data is pushed. Exceptions raised
+        while awaiting them must be thrown back into the generator, so they reach observer.
+
+        Arguments:
+            observer: Observer to which data is pushed.
+
+        """
+        send: T.Callable[[K, "Namespace"], T.Optional[T.Awaitable[T.Any]]] = (
+            observer.send if isinstance(observer, Observer) else observer.asend
+        )
+
         try:
             for data in self._source:
-                if self._observer.closed:
+                if observer.closed:
                     break
 
-                await self._observer.asend(data, self._namespace)
+                awaitable = send(data, self._namespace)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del data
+
+                if awaitable is not None:
+                    yield awaitable
         except Exception as exc:
-            await self._observer.athrow(exc, self._namespace)
+            yield observer.athrow(exc, self._namespace)
+
+    async def _feed(self, observer: "ObserverProtocol[K]") -> None:
+        """Push all data from source into observer.
+
+        Data is sent synchronously for as long as observer doesn't need to await anything.
+
+        Arguments:
+            observer: Observer to which data is pushed.
+
+        """
+        pusher = self._push(observer)
+        awaitable = next(pusher, None)
+        while awaitable is not None:
+            try:
+                await awaitable
+            except Exception as exc:
+                awaitable = pusher.throw(exc)
+            else:
+                awaitable = next(pusher, None)
 
 
 __all__ = ("FromIterable",)
@@ -14,7 +14,8 @@ from async_tools.abstract import AsyncABCMeta
 
 # Project
 from ..protocols import TransformerProtocol
-from ..operations import pipe, sink
+from ..operations import pipe, sink, batches, iterate
+from ..protocols.conformance import conforms
 
 if T.TYPE_CHECKING:
     # Project
@@ -37,15 +38,35 @@ class Observable(T.Generic[K], metaclass=AsyncABCMeta):
     and must be implemented in the magic method :meth:`~.Observable.__observe__`.
     """
 
+    __slots__ = ()
+
     def __gt__(self, observer: "ObserverProtocol[K]") -> sink[K]:
         return sink(self, observer)
 
     def __or__(self, transformer: TransformerProtocol[K, L]) -> pipe[K, L]:
-        if not isinstance(transformer, TransformerProtocol):
+        if not conforms(transformer, TransformerProtocol):
             raise TypeError("Argument must be an object that implements the TransformerProtocol")
 
         return pipe(self, transformer)
 
+    def __aiter__(self) -> T.AsyncIterator[K]:
+        return iterate(self)
+
+    def batches(
+        self, max_size: int, max_wait: T.Optional[float] = None
+    ) -> T.AsyncIterator[T.List[K]]:
+        """Iterate asynchronously over lists of the data emitted by this observable.
+
+        Arguments:
+            max_size: Maximum amount of values in each list.
+            max_wait: Maximum time, in seconds, to wait for a list to be filled.
+
+        Returns:
+            Asynchronous iterator over lists of the emitted data.
+
+        """
+        return batches(self, max_size, max_wait)
+
     @abstractmethod
     async def __observe__(self, observer: "ObserverProtocol[K]") -> None:
         """Interface through which observers are registered to observe the data flow.
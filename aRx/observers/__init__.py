@@ -8,10 +8,27 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+# Internal
+import typing as T
+
 # Project
-from .consumer import Consumer
-from .observer import Observer
-from .iterator_observer import IteratorObserver
-from .anonymous_observer import AnonymousObserver
+from .._lazy import lazy_exports
+
+if T.TYPE_CHECKING:
+    # Project
+    from .consumer import Consumer
+    from .observer import Observer
+    from .iterator_observer import IteratorObserver
+    from .anonymous_observer import AnonymousObserver
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Consumer": ".consumer",
+        "Observer": ".observer",
+        "IteratorObserver": ".iterator_observer",
+        "AnonymousObserver": ".anonymous_observer",
+    },
+)
 
 __all__ = ("Observer", "Consumer", "AnonymousObserver", "IteratorObserver")
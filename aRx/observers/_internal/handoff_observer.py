@@ -0,0 +1,180 @@
+"""HandoffObserver
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Future, wait, get_running_loop
+from collections import deque
+
+# Project
+from ..observer import Observer
+
+if T.TYPE_CHECKING:
+    # Project
+    from ...namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+# Default amount of values held before the producer is made to wait for the consumer
+DEFAULT_HANDOFF_SIZE: T.Final = 64
+
+
+def _wakeup(future: T.Optional["Future[None]"]) -> None:
+    if future is not None and not future.done():
+        future.set_result(None)
+
+
+class HandoffObserver(Observer[K]):
+    """Observer that hands data over to a single consumer through a bounded buffer.
+
+    The consumer is only woken up when it is waiting for data and the producer is only made to
+    wait when the buffer is full, so no wakeup happens while both keep up with each other.
+    """
+
+    __slots__ = ("_buffer", "_maxsize", "_error", "_getter", "_putter", "_released")
+
+    def __init__(self, maxsize: int = DEFAULT_HANDOFF_SIZE, **kwargs: T.Any) -> None:
+        """HandoffObserver constructor.
+
+        Arguments:
+            maxsize: Amount of values held before the producer is made to wait.
+            kwargs: Keyword parameters for super.
+
+        """
+        if maxsize < 1:
+            raise ValueError("HandoffObserver maxsize must be positive")
+
+        super().__init__(**kwargs)
+
+        # Private
+        self._buffer: T.Deque[K] = deque()
+        self._error: T.Optional[Exception] = None
+        self._getter: T.Optional["Future[None]"] = None
+        self._putter: T.Optional["Future[None]"] = None
+        self._maxsize = maxsize
+        self._released = False
+
+    @property
+    def pending(self) -> bool:
+        """Property that indicates if there is data available to the consumer."""
+        return bool(self._buffer)
+
+    def _send(self, value: K, _: "Namespace") -> T.Optional[T.Awaitable[None]]:
+        if self._released:
+            # Consumer is gone, nothing to handoff to
+            return None
+
+        buffer = self._buffer
+        buffer.append(value)
+
+        getter = self._getter
+        if getter is not None:
+            self._getter = None
+            _wakeup(getter)
+
+        return None if len(buffer) < self._maxsize else self._wait_space()
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        awaitable = self._send(value, namespace)
+        if awaitable is not None:
+            await awaitable
+
+    async def _athrow(self, exc: Exception, _: "Namespace") -> bool:
+        self._error = exc
+        _wakeup(self._getter)
+        return True
+
+    async def _aclose(self) -> None:
+        _wakeup(self._getter)
+        _wakeup(self._putter)
+
+    async def _wait_space(self) -> None:
+        while len(self._buffer) >= self._maxsize and not self._released:
+            putter = self._putter
+            if putter is None or putter.done():
+                putter = self._putter = get_running_loop().create_future()
+
+            await putter
+
+    def _wait_getter(self) -> "Future[None]":
+        getter = self._getter = get_running_loop().create_future()
+        return getter
+
+    async def wait(self) -> bool:
+        """Wait until there is data available to the consumer.
+
+        Raises:
+            Exception: Any exception thrown at this observer, once all prior data was consumed.
+
+        Returns:
+            Boolean indicating if there is data available, or if this observer is exhausted.
+
+        """
+        while not self._buffer:
+            error = self._error
+            if error is not None:
+                self._error = None
+                raise error
+
+            if self.closed:
+                return False
+
+            await self._wait_getter()
+
+        return True
+
+    async def fill(self, size: int, timeout: float) -> None:
+        """Give the producer up to timeout seconds to make size values available.
+
+        Arguments:
+            size: Amount of values desired.
+            timeout: Maximum time to wait, in seconds.
+
+        """
+        # A full buffer can't grow any further
+        size = min(size, self._maxsize)
+        if len(self._buffer) >= size or self.closed:
+            return
+
+        loop = get_running_loop()
+        deadline = loop.time() + timeout
+        while len(self._buffer) < size and not (self.closed or self._error):
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+
+            await wait((self._wait_getter(),), timeout=timeout)
+
+    def pop(self) -> K:
+        """Hand the oldest available value over to the consumer."""
+        value = self._buffer.popleft()
+        _wakeup(self._putter)
+        return value
+
+    def pop_many(self, size: int) -> T.List[K]:
+        """Hand up to size of the oldest available values over to the consumer."""
+        buffer = self._buffer
+        if len(buffer) <= size:
+            values = list(buffer)
+            buffer.clear()
+        else:
+            popleft = buffer.popleft
+            values = [popleft() for _ in range(size)]
+
+        _wakeup(self._putter)
+        return values
+
+    def release(self) -> None:
+        """Signal that the consumer is gone, discarding any pending or future data."""
+        self._released = True
+        self._buffer.clear()
+        _wakeup(self._putter)
+
+
+__all__ = ("HandoffObserver", "DEFAULT_HANDOFF_SIZE")
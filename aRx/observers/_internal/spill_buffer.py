@@ -0,0 +1,145 @@
+"""SpillBuffer
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from io import BytesIO
+from pickle import HIGHEST_PROTOCOL, load, dumps, loads
+from struct import Struct
+from tempfile import TemporaryFile
+
+# Default amount of items pickled together in each chunk written to disk
+DEFAULT_SPILL_CHUNK: T.Final = 256
+
+# Amount of items, and size in bytes of the payload, of each chunk
+_HEADER = Struct("<QQ")
+
+
+class SpillBuffer:
+    """First in, first out buffer that keeps its items in an append only temporary file.
+
+    Items are pickled as they are appended, so an item that can't be pickled is refused right
+    away. They are written in chunks of chunk_size, each to the end of the file with a single
+    write, and read back sequentially, one whole chunk at a time. The file is truncated once all
+    items were read, so disk usage is bounded by the largest backlog.
+
+    File access is blocking, it's meant to be cheap enough to run in the event loop thread, as
+    it only happens once per chunk.
+    """
+
+    __slots__ = (
+        "_file",
+        "_length",
+        "_pending",
+        "_written",
+        "_read_pos",
+        "_directory",
+        "_write_pos",
+        "_chunk_size",
+    )
+
+    def __init__(
+        self, directory: T.Optional[str] = None, chunk_size: int = DEFAULT_SPILL_CHUNK
+    ) -> None:
+        """SpillBuffer constructor.
+
+        Arguments:
+            directory: Directory where the temporary file is created, defaults to the system's.
+            chunk_size: Amount of items pickled together in each chunk.
+
+        """
+        if chunk_size < 1:
+            raise ValueError("SpillBuffer chunk_size must be positive")
+
+        # The file is only created when the first chunk is written
+        self._file: T.Optional[T.BinaryIO] = None
+        self._length = 0
+        # Pickled items not yet written to the file, they are newer than any item in it
+        self._pending: T.List[bytes] = []
+        # Items held in the file
+        self._written = 0
+        self._read_pos = 0
+        self._directory = directory
+        self._write_pos = 0
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def written(self) -> int:
+        """Amount of items held in the file, as opposed to the ones waiting to fill a chunk."""
+        return self._written
+
+    def append(self, item: T.Any) -> None:
+        """Add item to the end of the buffer.
+
+        Raises:
+            Exception: Any error raised when pickling item, which isn't added.
+
+        """
+        pending = self._pending
+        pending.append(dumps(item, protocol=HIGHEST_PROTOCOL))
+        self._length += 1
+
+        if len(pending) >= self._chunk_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._file is None:
+            self._file = T.cast(T.BinaryIO, TemporaryFile(dir=self._directory))
+
+        pending, self._pending = self._pending, []
+        payload = b"".join(pending)
+
+        file = self._file
+        file.seek(self._write_pos)
+        file.write(_HEADER.pack(len(pending), len(payload)) + payload)
+        self._write_pos = file.tell()
+        self._written += len(pending)
+
+    def popchunk(self) -> T.List[T.Any]:
+        """Remove and retrieve the oldest items, at most a chunk of them.
+
+        Returns:
+            Oldest items in order, empty when there are none.
+
+        """
+        file = self._file
+        if file is None or self._read_pos == self._write_pos:
+            pending, self._pending = self._pending, []
+            chunk = [loads(data) for data in pending]
+        else:
+            file.seek(self._read_pos)
+            count, size = _HEADER.unpack(file.read(_HEADER.size))
+            # Each item is a pickle of its own, so they can't share an unpickler memo
+            payload = BytesIO(file.read(size))
+            chunk = [load(payload) for _ in range(count)]
+            self._read_pos = file.tell()
+            self._written -= count
+
+            if self._read_pos == self._write_pos:
+                # Everything written was read back, reclaim disk space
+                file.truncate(0)
+                self._read_pos = self._write_pos = 0
+
+        self._length -= len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        """Discard all items and remove the temporary file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        self._length = 0
+        self._pending = []
+        self._written = 0
+        self._read_pos = self._write_pos = 0
+
+
+__all__ = ("SpillBuffer", "DEFAULT_SPILL_CHUNK")
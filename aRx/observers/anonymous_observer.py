@@ -8,6 +8,7 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Internal
 import typing as T
 from asyncio import get_running_loop
+from inspect import isawaitable
 
 # External
 from async_tools import attempt_await
@@ -58,6 +59,8 @@ class AnonymousObserver(Observer[K]):
     listening to a source.
     """
 
+    __slots__ = ("_asend_impl", "_athrow_impl", "_aclose_impl")
+
     @T.overload
     def __init__(
         self,
@@ -98,13 +101,18 @@ class AnonymousObserver(Observer[K]):
         self._athrow_impl = setup_default_athrow() if athrow is None else athrow
         self._aclose_impl = default_aclose if aclose is None else aclose
 
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        result = self._asend_impl(value, namespace)
+        return result if isawaitable(result) else None
+
     async def _asend(self, value: K, namespace: "Namespace") -> None:
-        awaitable = self._asend_impl(value, namespace)
+        awaitable = self._send(value, namespace)
 
         # Remove reference early to avoid keeping large objects in memory
         del value
 
-        await attempt_await(awaitable)
+        if awaitable is not None:
+            await awaitable
 
     async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
         return await attempt_await(self._athrow_impl(exc, namespace))
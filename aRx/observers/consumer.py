@@ -23,24 +23,29 @@ K = T.TypeVar("K")
 
 
 class Consumer(Observer[K]):
+    __slots__ = ("result",)
+
     def __init__(self, **kwargs: T.Any) -> None:
         super().__init__(keep_alive=False, **kwargs)
 
         self.result: "Future[K]" = get_running_loop().create_future()
 
-    async def _asend(self, value: K, _: "Namespace") -> None:
+    def _send(self, value: K, _: "Namespace") -> None:
         if self.result.done():
             return
 
         self.result.set_result(value)
+        self._complete()
 
-        # Use exception as shorthand for closing consumer
-        raise ConsumerClosedError
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        self._send(value, namespace)
 
     async def _athrow(self, exc: Exception, _: "Namespace") -> bool:
         if not self.result.done():
             self.result.set_exception(exc)
-        return True
+
+        self._complete()
+        return False
 
     async def _aclose(self) -> None:
         if not self.result.done():
@@ -12,6 +12,7 @@ from collections import deque
 
 # Project
 from .observer import Observer
+from ._internal.spill_buffer import DEFAULT_SPILL_CHUNK, SpillBuffer
 
 if T.TYPE_CHECKING:
     # Project
@@ -23,30 +24,76 @@ K = T.TypeVar("K")
 
 
 class IteratorObserver(Observer[K], T.AsyncIterator[K]):
-    """An async observers that can be iterated asynchronously."""
+    """An async observers that can be iterated asynchronously.
 
-    def __init__(self, **kwargs: T.Any) -> None:
+    In spill mode, when spill_threshold is given, data received while spill_threshold values are
+    already queued in memory is pickled to a temporary file instead, and read back in order as
+    the queue is consumed. This bounds memory usage when the consumer falls behind.
+
+    .. Note::
+
+        Spilling reads and writes the file synchronously, blocking the event loop while each
+        chunk is transferred. Use a local, fast spill_directory and size spill_chunk_size so a
+        chunk transfer stays short.
+    """
+
+    __slots__ = ("_queue", "_spill", "_counter", "_control", "_threshold")
+
+    def __init__(
+        self,
+        *,
+        spill_threshold: T.Optional[int] = None,
+        spill_directory: T.Optional[str] = None,
+        spill_chunk_size: int = DEFAULT_SPILL_CHUNK,
+        **kwargs: T.Any,
+    ) -> None:
         """IteratorObserver constructor
 
         Arguments:
+            spill_threshold: Amount of values queued in memory before spilling to disk.
+            spill_directory: Directory for the spill file, defaults to the system's temporary.
+            spill_chunk_size: Amount of values pickled together when spilling.
             kwargs: Keyword parameters for super.
         """
+        if spill_threshold is not None and spill_threshold < 1:
+            raise ValueError("IteratorObserver spill_threshold must be positive")
 
         super().__init__(**kwargs)
 
         # Private
         self._queue: T.Deque[T.Tuple[bool, T.Union[K, Exception]]] = deque()
+        self._spill = (
+            None if spill_threshold is None else SpillBuffer(spill_directory, spill_chunk_size)
+        )
         self._counter = 0
         self._control: T.Optional["Future[bool]"] = None
+        self._threshold = spill_threshold
+
+    @property
+    def spilled(self) -> int:
+        """Amount of values currently held on disk."""
+        return 0 if self._spill is None else self._spill.written
 
     @property
     def _next_value(self) -> T.Tuple[bool, T.Union[K, Exception]]:
         """Shortcut to self._queue"""
-        return self._queue.popleft()
+        queue = self._queue
+        value = queue.popleft()
+
+        spill = self._spill
+        if not queue and spill:
+            # Spilled values are always newer than those in memory, so refill queue from them
+            queue.extend(spill.popchunk())
+
+        return value
 
     @_next_value.setter
     def _next_value(self, value: T.Tuple[bool, T.Union[K, Exception]]) -> None:
-        self._queue.append(value)
+        spill = self._spill
+        if spill is not None and (spill or len(self._queue) >= T.cast(int, self._threshold)):
+            spill.append(value)
+        else:
+            self._queue.append(value)
 
         if self._control and not self._control.done():
             self._control.set_result(True)
@@ -54,10 +101,13 @@ class IteratorObserver(Observer[K], T.AsyncIterator[K]):
     def __aiter__(self) -> T.AsyncIterator[K]:
         return self
 
-    async def _asend(self, value: K, _: "Namespace") -> None:
+    def _send(self, value: K, _: "Namespace") -> None:
         self._counter += 1
         self._next_value = (False, value)
 
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        self._send(value, namespace)
+
     async def _athrow(self, err: Exception, _: "Namespace") -> bool:
         self._next_value = (True, err)
         return True
@@ -71,6 +121,9 @@ class IteratorObserver(Observer[K], T.AsyncIterator[K]):
 
         while not self._queue:
             if self.closed:
+                if self._spill is not None:
+                    self._spill.close()
+
                 raise StopAsyncIteration()
 
             if self._control is None or (await self._control and not self.closed):
@@ -9,7 +9,6 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import typing as T
 from abc import abstractmethod
 from asyncio import Future, get_running_loop
-from contextlib import contextmanager
 
 # External
 from async_tools.abstract import BasicRepr, AsyncABCMeta
@@ -23,26 +22,45 @@ K = T.TypeVar("K")
 L = T.TypeVar("L")
 
 
-class Observer(
-    BasicRepr,
-    T.Generic[K],
-    T.AsyncContextManager["Observer[K]"],
-    metaclass=AsyncABCMeta,
-):
+class Observer(BasicRepr, T.Generic[K], metaclass=AsyncABCMeta):
     """Observer abstract class.
 
     An abstract implementation of the ObserverProtocol that defines some basis for the data flow,
     exception handling. Custom behaviour must be implemented in _asend, _athrow, _aclose.
+
+    Observers able to handle data without awaiting can also implement _send, which allows data to
+    flow through them synchronously.
+
+    Observers are async context managers, closed on exit. They don't inherit from
+    :class:`typing.AsyncContextManager`, as it lacks ``__slots__`` and would give every instance
+    a ``__dict__``.
     """
 
     __slots__ = (
         "keep_alive",
         "_closed",
+        "_completed",
         "_close_guard",
         "_propagation_count",
         "_propagation_guard",
+        # Namespaces hold weak references to the observers they represent
+        "__weakref__",
     )
 
+    # Whether _send implements the input handling, instead of just deferring to _asend
+    _sync_capable: T.ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: T.Any) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore
+
+        # A _send implementation is only used when it isn't shadowed by a more specialized _asend
+        mro = cls.__mro__
+        send_owner = next(klass for klass in mro if "_send" in vars(klass))
+        asend_owner = next(klass for klass in mro if "_asend" in vars(klass))
+        cls._sync_capable = send_owner is not Observer and mro.index(send_owner) <= mro.index(
+            asend_owner
+        )
+
     def __init__(self, *, keep_alive: bool = False, **kwargs: T.Any) -> None:
         """Observer constructor.
 
@@ -56,6 +74,7 @@ class Observer(
 
         # Internal
         self._closed = False
+        self._completed = False
         self._close_guard = False
         self._propagation_count = 0
         self._propagation_guard: T.Optional["Future[None]"] = None
@@ -92,6 +111,20 @@ class Observer(
         """
         raise NotImplementedError
 
+    def _send(self, value: K, namespace: Namespace) -> T.Optional[T.Awaitable[None]]:
+        """Synchronous counterpart of :meth:`_asend`.
+
+        Arguments:
+            value: Input data.
+            namespace: Namespace to identify propagation origin.
+
+        Returns:
+            None when the input data was handled, otherwise an awaitable that must be awaited to
+            finish handling it.
+
+        """
+        return self._asend(value, namespace)
+
     @abstractmethod
     async def _athrow(self, exc: Exception, namespace: Namespace) -> bool:
         """Method responsible for handling any exceptions.
@@ -108,23 +141,126 @@ class Observer(
         """Method responsible for handling the logic necessary to close the observers."""
         raise NotImplementedError
 
-    @contextmanager
-    def _propagating(self) -> T.Generator[None, None, None]:
-        """Context manager to keep track of any ongoing asend or athrow operations."""
-        self._propagation_count += 1
+    def snapshot(self) -> T.Any:
+        """Capture the internal state of this observer, so it can be restored after a restart.
 
-        try:
-            yield
-        finally:
-            self._propagation_count -= 1
-            if self._propagation_guard and self._propagation_count == 0:
-                self._propagation_guard.set_result(None)
+        Returns:
+            Picklable state, or None when this observer has no state to be kept.
+
+        """
+        return None
+
+    def restore(self, state: T.Any) -> None:
+        """Restore the internal state of this observer, must be called before any input.
+
+        Arguments:
+            state: State previously returned by :meth:`snapshot`.
+
+        """
+
+    def _propagated(self) -> bool:
+        """Keep track of ongoing asend or athrow operations, must be called when one finishes.
+
+        Returns:
+            Whether the observer completed and must be closed now that nothing is propagating.
+
+        """
+        self._propagation_count -= 1
+        if self._propagation_count > 0:
+            return False
+
+        guard = self._propagation_guard
+        if guard is not None:
+            # Release aclose waiting for remaining propagations
+            self._propagation_guard = None
+            guard.set_result(None)
+
+        return self._completed and not self._closed
+
+    def _complete(self) -> None:
+        """Signal that this observer is done and must close once it finishes propagating.
+
+        Meant to be called from inside :meth:`_asend` or :meth:`_athrow`. Any further input is
+        refused and, as soon as the last ongoing propagation ends, the observer is closed directly
+        by it, without the need of raising an exception or scheduling a task.
+        """
+        self._completed = True
+        self._close_guard = True
 
     @property
     def closed(self) -> bool:
         """Property that indicates if this observers is closed or not."""
         return self._closed
 
+    def send(
+        self, data: K, namespace: T.Optional[Namespace] = None
+    ) -> T.Optional[T.Awaitable[T.Any]]:
+        """Interface through which data is inputted synchronously, whenever possible.
+
+        Same as :meth:`asend`, but data is handled right away for as long as this observers, and
+        the ones it redirects data to, don't need to await anything.
+
+        Arguments:
+            data: Data to be inputted.
+            namespace: Namespace to identify propagation origin.
+
+        Raises:
+            ObserverClosedError: If observers is closed.
+
+        Returns:
+            None when data was handled, otherwise an awaitable that must be awaited to finish
+            handling it.
+
+        """
+        if self.closed or self._close_guard:
+            raise ObserverClosedError(self)
+
+        if not self._sync_capable:
+            # Nothing can be handled right away, asend already tracks the whole propagation
+            return self.asend(data, namespace)
+
+        namespace = Namespace(self, "asend", namespace)
+        self._propagation_count += 1
+
+        try:
+            awaitable = self._send(data, namespace)
+        except Exception as exc:
+            # Propagation ends here, as athrow tracks its own
+            if self._propagated():
+                return self._finish_throw(exc, namespace)
+
+            return self.athrow(exc, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del data
+
+        if awaitable is not None:
+            return self._finish_send(awaitable, namespace)
+
+        if self._propagated():
+            return self.aclose()
+
+        return None
+
+    async def _finish_send(self, awaitable: T.Awaitable[None], namespace: Namespace) -> None:
+        try:
+            try:
+                await awaitable
+            except Exception as exc:
+                # Any exception raised during the handling of the input data will be thrown to
+                # the observers for it to handle.
+                await self.athrow(exc, namespace)
+        finally:
+            if self._propagated():
+                await self.aclose()
+
+    async def _finish_throw(self, exc: Exception, namespace: Namespace) -> None:
+        # Observer completed while failing to handle its input, report the failure then close
+        try:
+            await self.athrow(exc, namespace)
+        finally:
+            await self.aclose()
+
     async def asend(self, data: K, namespace: T.Optional[Namespace] = None) -> None:
         """Interface through which data is inputted.
 
@@ -136,11 +272,25 @@ class Observer(
             ObserverClosedError: If observers is closed.
 
         """
+        if self._sync_capable:
+            awaitable = self.send(data, namespace)
+
+            # Remove reference early to avoid keeping large objects in memory
+            del data
+
+            if awaitable is not None:
+                await awaitable
+
+            return
+
         if self.closed or self._close_guard:
             raise ObserverClosedError(self)
 
-        with self._propagating():
-            namespace = Namespace(self, "asend", namespace)
+        namespace = Namespace(self, "asend", namespace)
+        self._propagation_count += 1
+
+        try:
+            # Await the input handling directly, so no coroutine is wrapped around it
             awaitable = self._asend(data, namespace)
 
             # Remove reference early to avoid keeping large objects in memory
@@ -148,10 +298,13 @@ class Observer(
 
             try:
                 await awaitable
-            except Exception as ex:
+            except Exception as exc:
                 # Any exception raised during the handling of the input data will be thrown to
                 # the observers for it to handle.
-                await self.athrow(ex, namespace)
+                await self.athrow(exc, namespace)
+        finally:
+            if self._propagated():
+                await self.aclose()
 
     async def athrow(self, main_exc: Exception, namespace: T.Optional[Namespace] = None) -> None:
         """Interface through which exceptions are inputted.
@@ -172,18 +325,23 @@ class Observer(
         if (self.closed and not from_asend) or self._close_guard:
             raise ObserverClosedError(self)
 
-        with self._propagating():
+        self._propagation_count += 1
+        try:
             awaitable = self._athrow(main_exc, Namespace(self, "athrow", namespace))
 
             try:
-                self._close_guard = await awaitable
+                if await awaitable:
+                    self._close_guard = True
             except Exception:
                 self._close_guard = True
                 raise
             finally:
-                if self._close_guard and not self.closed:
+                if self._close_guard and not (self.closed or self._completed):
                     # Must use create_task to avoid deadlock
                     get_running_loop().create_task(self.aclose())
+        finally:
+            if self._propagated():
+                await self.aclose()
 
     async def aclose(self) -> bool:
         """Close observers.
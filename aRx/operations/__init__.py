@@ -9,8 +9,49 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+# Internal
+import typing as T
+
 # Project
-from .pipe_op import pipe
-from .sink_op import sink
-from .concat_op import concat
-from .observe_op import observe
+from .._lazy import lazy_exports
+
+if T.TYPE_CHECKING:
+    # Project
+    from .join_op import join
+    from .pipe_op import pipe
+    from .sink_op import sink
+    from .concat_op import concat
+    from .iterate_op import batches, iterate
+    from .observe_op import observe
+    from .run_sync_op import run_sync
+    from .checkpoint_op import checkpoint
+    from .merge_sorted_op import merge_sorted
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "join": ".join_op",
+        "pipe": ".pipe_op",
+        "sink": ".sink_op",
+        "concat": ".concat_op",
+        "batches": ".iterate_op",
+        "iterate": ".iterate_op",
+        "observe": ".observe_op",
+        "run_sync": ".run_sync_op",
+        "checkpoint": ".checkpoint_op",
+        "merge_sorted": ".merge_sorted_op",
+    },
+)
+
+__all__ = (
+    "join",
+    "pipe",
+    "sink",
+    "concat",
+    "batches",
+    "iterate",
+    "observe",
+    "run_sync",
+    "checkpoint",
+    "merge_sorted",
+)
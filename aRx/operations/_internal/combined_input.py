@@ -0,0 +1,81 @@
+"""CombinedInput
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Project
+from ...observers import Observer
+
+if T.TYPE_CHECKING:
+    # Project
+    from ...namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Combiner(T.Protocol):
+    """Stream that combines the data of multiple sources, each fed by a :class:`CombinedInput`."""
+
+    @property
+    def closed(self) -> bool:
+        ...
+
+    async def athrow(self, main_exc: Exception, namespace: T.Optional["Namespace"] = None) -> None:
+        ...
+
+    async def receive(self, index: int, value: T.Any, namespace: "Namespace") -> None:
+        """Handle value received from the source at index."""
+        ...
+
+    async def exhaust(self, index: int) -> None:
+        """Register that the source at index won't emit any more data."""
+        ...
+
+
+class CombinedInput(Observer[K]):
+    """Observer that feeds the data of one source into the stream combining it with others."""
+
+    __slots__ = ("_index", "_combiner")
+
+    def __init__(self, combiner: Combiner, index: int) -> None:
+        """CombinedInput constructor.
+
+        Arguments:
+            combiner: Stream combining the data of this input.
+            index: Position of the source fed by this input.
+
+        """
+        super().__init__()
+
+        # Private
+        self._index = index
+        self._combiner = combiner
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        combiner = self._combiner
+        if combiner.closed:
+            # No one to combine data to anymore
+            self._complete()
+            return
+
+        await combiner.receive(self._index, value, namespace)
+
+    async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
+        combiner = self._combiner
+        if not combiner.closed:
+            await combiner.athrow(exc, namespace)
+
+        return False
+
+    async def _aclose(self) -> None:
+        await self._combiner.exhaust(self._index)
+
+
+__all__ = ("Combiner", "CombinedInput")
@@ -0,0 +1,48 @@
+"""close_on_exhaustion
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..observe_op import observe
+
+
+async def close_on_exhaustion(observation: "observe[T.Any]") -> None:
+    """Close the first observer of observation once its source has pushed all of its data.
+
+    Closing it cascades down any pipe, so the observers at its end learn that no more data is
+    coming, once everything before it was propagated. Only finite sources, like
+    :class:`~aRx.observables.FromIterable`, are ever exhausted, for any other source this waits
+    forever, so it must run in a task that is cancelled when the observation ends.
+
+    Arguments:
+        observation: Observation, or pipeline, whose source is watched.
+
+    """
+    # Project
+    from ...observables._internal.from_source import FromSource
+
+    # Walk back to the observation of the source itself
+    previous: T.Optional["observe[T.Any]"] = observation
+    while previous is not None:
+        observation = previous
+        previous = getattr(observation, "_previous", None)
+
+    source = observation._observable
+    if not isinstance(source, FromSource):
+        return
+
+    await source.join()
+
+    observer = observation._observer
+    if source._observer is observer and not observer.closed:
+        await observer.aclose()
+
+
+__all__ = ("close_on_exhaustion",)
@@ -0,0 +1,127 @@
+"""checkpoint
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import os
+import typing as T
+from pickle import HIGHEST_PROTOCOL, dump, load
+from asyncio import Task, CancelledError, sleep, get_running_loop
+from contextlib import suppress
+
+if T.TYPE_CHECKING:
+    # Internal
+    from types import TracebackType
+
+    # Project
+    from ..observers import Observer
+
+
+class checkpoint:
+    """Persist the state of observers to a local file, so a restarted pipeline can resume.
+
+    Observers are identified by name, as their identity doesn't survive a restart. Entering the
+    context restores the state saved in path, if any, so it must be done before the pipeline
+    receives data. The state is saved on exit, every interval seconds while inside the context,
+    when given, and on demand through :meth:`save`.
+
+    .. Note::
+
+        Only the state of the given observers is saved, data being propagated when a checkpoint
+        is taken, or emitted after it, is not.
+    """
+
+    __slots__ = ("_path", "_task", "_interval", "_observers")
+
+    def __init__(
+        self,
+        path: str,
+        observers: T.Mapping[str, "Observer[T.Any]"],
+        *,
+        interval: T.Optional[float] = None,
+    ) -> None:
+        """checkpoint constructor.
+
+        Arguments:
+            path: File where the state is saved.
+            observers: Observers whose state is saved, by name.
+            interval: Period, in seconds, between automatic saves.
+
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError("checkpoint interval must be positive")
+
+        # Internal
+        self._path = path
+        self._task: T.Optional["Task[None]"] = None
+        self._interval = interval
+        self._observers = observers
+
+    def save(self) -> None:
+        """Save the current state of observers, replacing the previous checkpoint atomically."""
+        states = {}
+        for name, observer in self._observers.items():
+            state = observer.snapshot()
+            if state is not None:
+                states[name] = state
+
+        temp_path = f"{self._path}.tmp"
+        with open(temp_path, "wb") as file:
+            dump(states, file, protocol=HIGHEST_PROTOCOL)
+
+        os.replace(temp_path, self._path)
+
+    def load(self) -> bool:
+        """Restore the state of observers from the last checkpoint.
+
+        Returns:
+            Whether there was a checkpoint to restore from.
+
+        """
+        try:
+            with open(self._path, "rb") as file:
+                states = load(file)
+        except FileNotFoundError:
+            return False
+
+        for name, observer in self._observers.items():
+            if name in states:
+                observer.restore(states[name])
+
+        return True
+
+    async def _periodic(self, interval: float) -> None:
+        while True:
+            await sleep(interval)
+            self.save()
+
+    async def __aenter__(self) -> "checkpoint":
+        self.load()
+
+        if self._interval is not None:
+            self._task = get_running_loop().create_task(self._periodic(self._interval))
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: T.Optional[T.Type[BaseException]],
+        exc_value: T.Optional[BaseException],
+        traceback: T.Optional["TracebackType"],
+    ) -> bool:
+        task = self._task
+        if task is not None:
+            self._task = None
+            task.cancel()
+            with suppress(CancelledError):
+                await task
+
+        self.save()
+
+        return False
+
+
+__all__ = ("checkpoint",)
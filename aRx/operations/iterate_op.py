@@ -0,0 +1,118 @@
+"""iterate
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import get_running_loop
+
+# Project
+from ._internal.exhaustion import close_on_exhaustion
+from ..observers._internal.handoff_observer import DEFAULT_HANDOFF_SIZE, HandoffObserver
+
+if T.TYPE_CHECKING:
+    # Project
+    from .sink_op import sink
+    from ..protocols import ObserverProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class _Sinkable(T.Protocol[K]):
+    def __gt__(self, observer: "ObserverProtocol[K]") -> "sink[K]":
+        ...
+
+
+async def iterate(
+    source: _Sinkable[K], *, maxsize: int = DEFAULT_HANDOFF_SIZE
+) -> T.AsyncGenerator[K, None]:
+    """Iterate asynchronously over the data emitted by an observable, or pipe.
+
+    Observation starts with the iteration and ends when it is over, or interrupted. Iteration is
+    over once source is exhausted, or closes the observer at its end.
+
+    Arguments:
+        source: Observable, or pipe, to be iterated.
+        maxsize: Amount of values held before source is made to wait for the consumer.
+
+    Returns:
+        Asynchronous iterator over the emitted data.
+
+    """
+    handoff: HandoffObserver[K] = HandoffObserver(maxsize)
+
+    observation = source > handoff
+    async with observation:
+        watcher = get_running_loop().create_task(close_on_exhaustion(observation))
+        try:
+            while handoff.pending or await handoff.wait():
+                yield handoff.pop()
+        finally:
+            watcher.cancel()
+            handoff.release()
+
+
+async def _batches(
+    source: _Sinkable[K], max_size: int, max_wait: T.Optional[float], maxsize: int
+) -> T.AsyncGenerator[T.List[K], None]:
+    handoff: HandoffObserver[K] = HandoffObserver(maxsize)
+
+    observation = source > handoff
+    async with observation:
+        watcher = get_running_loop().create_task(close_on_exhaustion(observation))
+        try:
+            while handoff.pending or await handoff.wait():
+                if max_wait is not None:
+                    await handoff.fill(max_size, max_wait)
+
+                yield handoff.pop_many(max_size)
+        finally:
+            watcher.cancel()
+            handoff.release()
+
+
+def batches(
+    source: _Sinkable[K],
+    max_size: int,
+    max_wait: T.Optional[float] = None,
+    *,
+    maxsize: T.Optional[int] = None,
+) -> T.AsyncIterator[T.List[K]]:
+    """Iterate asynchronously over lists of the data emitted by an observable, or pipe.
+
+    Each list holds the data available at the time, up to max_size values, which amortises the
+    cost of awaiting each value individually.
+
+    Arguments:
+        source: Observable, or pipe, to be iterated.
+        max_size: Maximum amount of values in each list.
+        max_wait: Maximum time, in seconds, to wait for a list to be filled after its first value
+            is available. Defaults to not waiting.
+        maxsize: Amount of values held before source is made to wait for the consumer. Defaults
+            to the greater of max_size and the default handoff size.
+
+    Raises:
+        ValueError: If max_size isn't positive or max_wait is negative.
+
+    Returns:
+        Asynchronous iterator over lists of the emitted data.
+
+    """
+    if max_size < 1:
+        raise ValueError("batches max_size must be positive")
+
+    if max_wait is not None and max_wait < 0:
+        raise ValueError("batches max_wait can't be negative")
+
+    if maxsize is None:
+        maxsize = max(max_size, DEFAULT_HANDOFF_SIZE)
+
+    return _batches(source, max_size, max_wait, maxsize)
+
+
+__all__ = ("iterate", "batches")
@@ -0,0 +1,171 @@
+"""join
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import get_running_loop
+from collections import deque
+
+# Project
+from ..streams import SingleStream
+from .observe_op import observe
+from ._internal.combined_input import CombinedInput
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+    from ..protocols import ObservableProtocol
+    from ..observables import Observable
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+class _JoinSide:
+    """Values recently received from one side of the join, bucketed by key."""
+
+    __slots__ = ("key", "order", "buckets")
+
+    def __init__(self, key: T.Callable[[T.Any], T.Hashable]) -> None:
+        self.key = key
+        # Arrival time and key of every value held, in arrival order
+        self.order: T.Deque[T.Tuple[float, T.Hashable]] = deque()
+        self.buckets: T.Dict[T.Hashable, T.Deque[T.Tuple[float, T.Any]]] = {}
+
+    def expire(self, threshold: float) -> None:
+        order = self.order
+        buckets = self.buckets
+        while order and order[0][0] <= threshold:
+            _, key = order.popleft()
+
+            # Buckets are also in arrival order, so the expired value is the oldest one
+            bucket = buckets[key]
+            bucket.popleft()
+            if not bucket:
+                del buckets[key]
+
+    def add(self, time: float, key: T.Hashable, value: T.Any) -> None:
+        self.order.append((time, key))
+
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = deque()
+
+        bucket.append((time, value))
+
+    def clear(self) -> None:
+        self.order.clear()
+        self.buckets.clear()
+
+
+class _WindowedJoin(SingleStream[T.Tuple[K, L]]):
+    """Stream that emits pairs of values, with equal keys, received within window of each other."""
+
+    __slots__ = ("_left", "_right", "_window", "_inputs", "_remaining")
+
+    def __init__(
+        self,
+        left_key: T.Callable[[K], T.Hashable],
+        right_key: T.Callable[[L], T.Hashable],
+        window: float,
+    ) -> None:
+        super().__init__()
+
+        # Private
+        self._left = _JoinSide(left_key)
+        self._right = _JoinSide(right_key)
+        self._window = window
+        self._inputs: T.Tuple[CombinedInput[K], CombinedInput[L]] = (
+            CombinedInput(self, 0),
+            CombinedInput(self, 1),
+        )
+        # Sides that may still emit data
+        self._remaining = 2
+
+    async def receive(self, index: int, value: T.Any, namespace: "Namespace") -> None:
+        """Pair value with the values, from the other side, that share its key."""
+        left = index == 0
+        time = get_running_loop().time()
+        threshold = time - self._window
+
+        this, other = (self._left, self._right) if left else (self._right, self._left)
+        this.expire(threshold)
+        other.expire(threshold)
+
+        key = this.key(value)
+        this.add(time, key, value)
+
+        # Copy matches, as the bucket may change while pairs are emitted
+        matches = tuple(other.buckets.get(key, ()))
+        for _, match in matches:
+            if self.closed:
+                break
+
+            await self._aredirect((value, match) if left else (match, value), namespace)
+
+    async def exhaust(self, index: int) -> None:
+        """Register that the side at index won't emit any more data."""
+        self._remaining -= 1
+        if self._remaining == 0 and not self.closed:
+            await self.aclose()
+
+    async def _aclose(self) -> None:
+        self._left.clear()
+        self._right.clear()
+
+        await super()._aclose()
+
+
+async def join(
+    left: "ObservableProtocol[K]",
+    right: "ObservableProtocol[L]",
+    *,
+    key: T.Callable[[T.Any], T.Hashable],
+    window: float,
+    right_key: T.Optional[T.Callable[[L], T.Hashable]] = None,
+) -> "Observable[T.Tuple[K, L]]":
+    """Join the values of two observables, with equal keys, received within window of each other.
+
+    Values are kept in per key buckets, and expire in arrival order once older than window, so
+    the retained state is bounded by the window times the rate of values.
+
+    Arguments:
+        left: Observable whose values are first in each pair.
+        right: Observable whose values are second in each pair.
+        key: Function extracting the join key from each value.
+        window: Maximum time, in seconds, between the arrival of joined values.
+        right_key: Function extracting the join key from right values. Defaults to key.
+
+    Raises:
+        ValueError: If window isn't positive.
+
+    Returns:
+        Observable emitting a (left, right) tuple for each match.
+
+    """
+    if window <= 0:
+        raise ValueError("join window must be positive")
+
+    joined: _WindowedJoin[K, L] = _WindowedJoin(
+        key, key if right_key is None else right_key, window
+    )
+
+    left_input, right_input = joined._inputs
+    await observe(left, left_input)
+
+    try:
+        await observe(right, right_input)
+    except Exception:
+        await observe(left, left_input).dispose()
+        raise
+
+    return joined
+
+
+__all__ = ("join",)
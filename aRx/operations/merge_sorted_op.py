@@ -0,0 +1,233 @@
+"""merge_sorted
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from heapq import heappop, heappush
+from asyncio import Task, Future, current_task, get_running_loop
+from collections import deque
+
+# Project
+from ..streams import SingleStream
+from .observe_op import observe
+from ._internal.exhaustion import close_on_exhaustion
+from ._internal.combined_input import CombinedInput
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+    from ..protocols import ObservableProtocol
+    from ..observables import Observable
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+# Default amount of values buffered per source before it is made to wait
+DEFAULT_LOOKAHEAD: T.Final = 16
+
+
+class _MergeInput(CombinedInput[K]):
+    """Observer that buffers the data of one of the merged sources."""
+
+    __slots__ = ("_space", "buffer", "exhausted", "_lookahead")
+
+    def __init__(self, merge: "_SortedMerge[K]", index: int, lookahead: int) -> None:
+        super().__init__(merge, index)
+
+        # Public
+        # Each value is buffered along with its key and namespace
+        self.buffer: T.Deque[T.Tuple[T.Any, K, "Namespace"]] = deque()
+        self.exhausted = False
+
+        # Private
+        self._space: T.Optional["Future[None]"] = None
+        self._lookahead = lookahead
+
+    def pop(self) -> T.Tuple[T.Any, K, "Namespace"]:
+        value = self.buffer.popleft()
+
+        space = self._space
+        if space is not None and not space.done():
+            space.set_result(None)
+
+        return value
+
+    async def hold(self) -> None:
+        """Hold source until the merge catches up with it."""
+        buffer = self.buffer
+        while len(buffer) >= self._lookahead and not self._combiner.closed:
+            space = self._space
+            if space is None or space.done():
+                space = self._space = get_running_loop().create_future()
+
+            await space
+
+    async def _aclose(self) -> None:
+        self.exhausted = True
+        await super()._aclose()
+
+    def release(self) -> None:
+        """Discard all buffered data, releasing the source if it is waiting."""
+        self.buffer.clear()
+
+        space = self._space
+        if space is not None and not space.done():
+            space.set_result(None)
+
+
+class _SortedMerge(SingleStream[K]):
+    """Stream that emits the data of multiple sorted sources in global order."""
+
+    __slots__ = ("_key", "_heap", "_inputs", "_watchers", "_starving", "_remaining", "_draining")
+
+    def __init__(self, count: int, key: T.Callable[[K], T.Any], lookahead: int) -> None:
+        super().__init__()
+
+        # Private
+        self._key = key
+        self._heap: T.List[T.Tuple[T.Any, int]] = []
+        self._inputs: T.Tuple[_MergeInput[K], ...] = tuple(
+            _MergeInput(self, index, lookahead) for index in range(count)
+        )
+        # Tasks detecting the exhaustion of each source
+        self._watchers: T.List["Task[None]"] = []
+        # Sources that may still emit data, but have nothing buffered
+        self._starving = count
+        # Sources that may still emit data
+        self._remaining = count
+        self._draining = False
+
+    async def receive(self, index: int, value: K, namespace: "Namespace") -> None:
+        """Buffer value from the source at index, and emit whatever data it unblocks."""
+        # Key is computed before buffering, so a failing key leaves the merge state untouched
+        key = self._key(value)
+
+        source = self._inputs[index]
+        buffer = source.buffer
+        buffer.append((key, value, namespace))
+        if len(buffer) == 1:
+            # Source had nothing buffered, value is its new head
+            heappush(self._heap, (key, index))
+            self._starving -= 1
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        await self.drain()
+
+        await source.hold()
+
+    async def exhaust(self, index: int) -> None:
+        """Register that the source at index won't emit any more data."""
+        self._remaining -= 1
+        if not self._inputs[index].buffer:
+            self._starving -= 1
+
+        await self.drain()
+
+    async def drain(self) -> None:
+        """Emit data for as long as the smallest value among all sources is known."""
+        if self._draining:
+            # Whoever is draining will pick up any new data
+            return
+
+        self._draining = True
+        try:
+            heap = self._heap
+            inputs = self._inputs
+            while heap and self._starving == 0 and not self.closed:
+                _, index = heappop(heap)
+                source = inputs[index]
+                _, value, namespace = source.pop()
+
+                buffer = source.buffer
+                if buffer:
+                    heappush(heap, (buffer[0][0], index))
+                elif not source.exhausted:
+                    self._starving += 1
+
+                await self._aredirect(value, namespace)
+
+                # Remove reference early to avoid keeping large objects in memory
+                del value
+        finally:
+            self._draining = False
+
+        if self._remaining == 0 and not (heap or self.closed):
+            await self.aclose()
+
+    def watch(self, observation: observe[K]) -> None:
+        """Exhaust the source observed by observation as soon as it runs out of data."""
+        self._watchers.append(get_running_loop().create_task(close_on_exhaustion(observation)))
+
+    async def _aclose(self) -> None:
+        task = current_task()
+        for watcher in self._watchers:
+            if watcher is not task:
+                watcher.cancel()
+
+        self._watchers.clear()
+        self._heap.clear()
+        for source in self._inputs:
+            source.release()
+
+        await super()._aclose()
+
+
+async def merge_sorted(
+    *observables: "ObservableProtocol[K]",
+    key: T.Optional[T.Callable[[K], T.Any]] = None,
+    lookahead: int = DEFAULT_LOOKAHEAD,
+) -> "Observable[K]":
+    """Merge observables, whose data is already sorted, into a globally sorted observable.
+
+    A value is only emitted once every source that may still emit data has a value buffered, so
+    the smallest one is known. Sources completing at different times are supported, a source
+    completes when the merge input observing it is closed, or, for sources like
+    :class:`~aRx.observables.FromIterable`, when it runs out of data.
+
+    Arguments:
+        observables: Sorted observables to be merged.
+        key: Function extracting the comparison key from each value. Defaults to the value itself.
+        lookahead: Amount of values buffered per source before it is made to wait.
+
+    Raises:
+        ValueError: If no observables are given or lookahead isn't positive.
+
+    Returns:
+        Observable emitting the data of all observables in sorted order.
+
+    """
+    if not observables:
+        raise ValueError("merge_sorted requires at least one observable")
+
+    if lookahead < 1:
+        raise ValueError("merge_sorted lookahead must be positive")
+
+    merge: _SortedMerge[K] = _SortedMerge(
+        len(observables), (lambda value: value) if key is None else key, lookahead
+    )
+
+    observed: T.List[observe[K]] = []
+    try:
+        for observable, source in zip(observables, merge._inputs):
+            observation = observe(observable, source)
+            await observation
+            observed.append(observation)
+    except Exception:
+        for observation in observed:
+            await observation.dispose()
+        raise
+
+    for observation in observed:
+        merge.watch(observation)
+
+    return merge
+
+
+__all__ = ("merge_sorted",)
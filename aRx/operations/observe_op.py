@@ -20,9 +20,9 @@ if T.TYPE_CHECKING:
 K = T.TypeVar("K")
 
 
-class observe(
-    T.Generic[K], T.Awaitable["ObserverProtocol[K]"], T.AsyncContextManager["ObserverProtocol[K]"]
-):
+class observe(T.Generic[K], T.Awaitable["ObserverProtocol[K]"]):
+    __slots__ = ("_observer", "_observable", "_keep_alive")
+
     def __init__(
         self,
         observable: "ObservableProtocol[K]",
@@ -46,13 +46,17 @@ class observe(
 
     async def __aenter__(self) -> "ObserverProtocol[K]":
         try:
-            await self._observable.__observe__(self._observer)
+            await self._register()
         except Exception as exc:
             if not await self.__aexit__(type(exc), exc, exc.__traceback__):
                 raise
 
         return self._observer
 
+    def _register(self) -> T.Awaitable[None]:
+        """Register observer into the observable."""
+        return self._observable.__observe__(self._observer)
+
     async def __aexit__(
         self,
         exc_type: T.Optional[T.Type[BaseException]],
@@ -31,6 +31,8 @@ M = T.TypeVar("M")
 
 
 class pipe(observe[K], T.Generic[K, L]):
+    __slots__ = ("_previous", "_transformer")
+
     def __init__(
         self,
         observable: ObservableProtocol[K],
@@ -51,6 +53,30 @@ class pipe(observe[K], T.Generic[K, L]):
     def __gt__(self, observer: ObserverProtocol[L]) -> sink[L]:
         return sink(self._transformer, observer, previous_pipe=self)
 
+    def __aiter__(self) -> T.AsyncIterator[L]:
+        # Project
+        from .iterate_op import iterate
+
+        return iterate(self)
+
+    def batches(
+        self, max_size: int, max_wait: T.Optional[float] = None
+    ) -> T.AsyncIterator[T.List[L]]:
+        """Iterate asynchronously over lists of the data emitted by this pipe.
+
+        Arguments:
+            max_size: Maximum amount of values in each list.
+            max_wait: Maximum time, in seconds, to wait for a list to be filled.
+
+        Returns:
+            Asynchronous iterator over lists of the emitted data.
+
+        """
+        # Project
+        from .iterate_op import batches
+
+        return batches(self, max_size, max_wait)
+
     def __await__(self) -> T.Generator[None, None, TransformerProtocolWithOperators[K, L]]:
         yield from super().__await__()
         return self._transformer
@@ -0,0 +1,181 @@
+"""run_sync
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import AbstractEventLoop, wait, sleep, all_tasks, new_event_loop, get_running_loop
+
+if T.TYPE_CHECKING:
+    # Project
+    from .pipe_op import pipe
+    from .sink_op import sink
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+def _loop_bound(stage: T.Union["sink[T.Any]", "pipe[T.Any, T.Any]"]) -> bool:
+    # Project
+    from ..observers import Observer
+
+    # Observers that aren't sync capable may depend on the running loop from the start
+    return any(
+        isinstance(member, Observer) and not member._sync_capable
+        for member in (stage._observable, stage._observer)
+    )
+
+
+async def _resume(iterator: T.Generator[T.Any, None, K], yielded: T.Any) -> K:
+    # Do the same as an asyncio.Task would with a suspended coroutine
+    while True:
+        if yielded is None:
+            # Bare yield, only relinquishes control to the event loop
+            await sleep(0)
+        else:
+            # The coroutine itself retrieves the future result when resumed
+            await wait((yielded,))
+
+        try:
+            yielded = iterator.send(None)
+        except StopIteration as stop:
+            return T.cast(K, stop.value)
+
+
+class _Runner:
+    """Run awaitables in place, only creating an event loop once one is actually needed.
+
+    Exceptions that reach the loop exception handler, such as the ones observers at the end of
+    the pipeline don't handle, are kept so they can be raised to the caller.
+    """
+
+    __slots__ = ("loop", "error")
+
+    def __init__(self) -> None:
+        self.loop: T.Optional[AbstractEventLoop] = None
+        self.error: T.Optional[Exception] = None
+
+    def _handle_exception(self, loop: AbstractEventLoop, context: T.Dict[str, T.Any]) -> None:
+        exc = context.get("exception")
+        if self.error is None and isinstance(exc, Exception):
+            self.error = exc
+        else:
+            loop.default_exception_handler(context)
+
+    def _get_loop(self) -> AbstractEventLoop:
+        if self.loop is None:
+            self.loop = new_event_loop()
+            self.loop.set_exception_handler(self._handle_exception)
+
+        return self.loop
+
+    def step(self, awaitable: T.Awaitable[K]) -> K:
+        """Run awaitable to completion, synchronously for as long as it doesn't suspend."""
+        if self.loop is not None:
+            return self.run(awaitable)
+
+        iterator = awaitable.__await__()
+        try:
+            yielded = iterator.send(None)
+        except StopIteration as stop:
+            return T.cast(K, stop.value)
+
+        # Awaitable suspended, fallback to the event loop to finish it
+        return self.run(_resume(iterator, yielded))
+
+    def run(self, awaitable: T.Awaitable[K]) -> K:
+        """Run awaitable to completion in the event loop, alongside any task it schedules."""
+        loop = self._get_loop()
+        result = loop.run_until_complete(awaitable)
+
+        # Execute any task scheduled meanwhile
+        tasks = all_tasks(loop)
+        while tasks:
+            loop.run_until_complete(wait(tasks))
+            tasks = all_tasks(loop)
+
+        return result
+
+    def close(self) -> None:
+        loop = self.loop
+        if loop is None:
+            return
+
+        self.loop = None
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+def run_sync(pipeline: "sink[T.Any]") -> None:
+    """Execute a pipeline sourced by a FromIterable without an event loop.
+
+    Data is pushed synchronously through observers that don't need to await anything, which avoids
+    creating a coroutine per element and stage. Whenever an awaitable shows up, execution falls
+    back to an event loop, created on demand, until it is done. Observers that aren't sync capable,
+    such as :class:`~aRx.operators.Timeout`, are always observed and fed in the event loop.
+
+    Arguments:
+        pipeline: Pipeline to be executed.
+
+    Raises:
+        TypeError: If pipeline isn't sourced by a FromIterable.
+        RuntimeError: If called when an event loop is already running.
+        Exception: First exception not handled by the pipeline observers.
+
+    """
+    # Project
+    from ..observables import FromIterable
+
+    try:
+        get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("run_sync() cannot be called from a running event loop")
+
+    stages: T.List[T.Union["sink[T.Any]", "pipe[T.Any, T.Any]"]] = []
+    stage: T.Optional[T.Union["sink[T.Any]", "pipe[T.Any, T.Any]"]] = pipeline
+    while stage is not None:
+        stages.append(stage)
+        stage = stage._previous
+
+    root = stages.pop()
+    source = root._observable
+    if not isinstance(source, FromIterable):
+        raise TypeError("run_sync() requires a pipeline sourced by a FromIterable")
+
+    runner = _Runner()
+    try:
+        try:
+            # Observe every stage but the source, which is fed directly
+            for stage in stages:
+                if _loop_bound(stage):
+                    runner.run(stage._register())
+                else:
+                    runner.step(stage._register())
+
+            pusher = source._push(root._observer)
+            awaitable = next(pusher, None)
+            while awaitable is not None:
+                try:
+                    runner.run(awaitable)
+                except Exception as exc:
+                    awaitable = pusher.throw(exc)
+                else:
+                    awaitable = next(pusher, None)
+        finally:
+            runner.step(pipeline.__aexit__(None, None, None))
+    finally:
+        runner.close()
+
+    if runner.error is not None:
+        raise runner.error
+
+
+__all__ = ("run_sync",)
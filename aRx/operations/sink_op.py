@@ -25,6 +25,8 @@ K = T.TypeVar("K")
 
 
 class sink(observe[K]):
+    __slots__ = ("_previous",)
+
     def __init__(
         self,
         observable: "ObservableProtocol[K]",
@@ -32,12 +32,74 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+# Internal
+import typing as T
+
 # Project
-from .map import Map
-from .max import Max
-from .min import Min
-from .skip import Skip
-from .stop import Stop
-from .take import Take
-from .filter import Filter
-from .assertion import Assert
+from .._lazy import lazy_exports
+
+if T.TYPE_CHECKING:
+    # Project
+    from .map import Map
+    from .max import Max
+    from .min import Min
+    from .skip import Skip
+    from .stop import Stop
+    from .take import Take
+    from .decode import Decode
+    from .encode import Encode
+    from .filter import Filter
+    from .timeout import Timeout
+    from .assertion import Assert
+    from .rate_limit import RateLimit
+    from .sample_rate import SampleRate
+    from .sliding_window import SlidingWindow
+    from .approx_quantiles import ApproxQuantiles
+    from .reservoir_sample import ReservoirSample
+    from .event_time_window import EventTimeWindow
+    from .approx_distinct_count import ApproxDistinctCount
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Map": ".map",
+        "Max": ".max",
+        "Min": ".min",
+        "Skip": ".skip",
+        "Stop": ".stop",
+        "Take": ".take",
+        "Filter": ".filter",
+        "Decode": ".decode",
+        "Encode": ".encode",
+        "Timeout": ".timeout",
+        "Assert": ".assertion",
+        "RateLimit": ".rate_limit",
+        "SampleRate": ".sample_rate",
+        "SlidingWindow": ".sliding_window",
+        "EventTimeWindow": ".event_time_window",
+        "ReservoirSample": ".reservoir_sample",
+        "ApproxQuantiles": ".approx_quantiles",
+        "ApproxDistinctCount": ".approx_distinct_count",
+    },
+)
+
+__all__ = (
+    "Map",
+    "Max",
+    "Min",
+    "Skip",
+    "Stop",
+    "Take",
+    "Filter",
+    "Assert",
+    "Decode",
+    "Encode",
+    "Timeout",
+    "RateLimit",
+    "SampleRate",
+    "SlidingWindow",
+    "ReservoirSample",
+    "EventTimeWindow",
+    "ApproxQuantiles",
+    "ApproxDistinctCount",
+)
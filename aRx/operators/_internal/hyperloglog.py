@@ -0,0 +1,95 @@
+"""HyperLogLog
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from math import log
+
+# Project
+from .stable_hash import Hashable, stable_hash
+
+# Value of 2 ** -rank for every possible rank of a 64 bits hash
+_INVERSE_POWERS: T.Final = tuple(2.0**-rank for rank in range(66))
+
+
+class HyperLogLog:
+    """Estimate the number of distinct values added to it, using fixed memory.
+
+    The sketch uses 2 ** precision one byte registers, with a standard error of about
+    1.04 / sqrt(2 ** precision). Sketches with the same precision can be merged, which results in
+    the same estimate as adding all their values into a single sketch.
+    """
+
+    __slots__ = ("_precision", "_registers")
+
+    def __init__(self, precision: int = 14) -> None:
+        """HyperLogLog constructor.
+
+        Arguments:
+            precision: Number of bits used to address the registers, between 4 and 18.
+
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+
+        # Internal
+        self._precision = precision
+        self._registers = bytearray(1 << precision)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    def add(self, key: Hashable) -> None:
+        """Add key to the sketch.
+
+        Arguments:
+            key: Value to be counted.
+
+        """
+        bits = 64 - self._precision
+        hashed = stable_hash(key)
+        index = hashed >> bits
+        # Position of the leftmost 1 bit in the remaining bits
+        rank = bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
+
+        registers = self._registers
+        if rank > registers[index]:
+            registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Merge other sketch into this one.
+
+        Arguments:
+            other: Sketch to be merged.
+
+        Raises:
+            ValueError: If sketches don't share the same precision.
+
+        """
+        if other._precision != self._precision:
+            raise ValueError("Can't merge HyperLogLog sketches of different precision")
+
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def count(self) -> int:
+        """Estimate the number of distinct keys added to the sketch."""
+        registers = self._registers
+        size = len(registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(map(_INVERSE_POWERS.__getitem__, registers))
+
+        if estimate <= 2.5 * size:
+            # Small range correction, use linear counting while there are empty registers
+            zeros = registers.count(0)
+            if zeros:
+                estimate = size * log(size / zeros)
+
+        return round(estimate)
+
+
+__all__ = ("HyperLogLog",)
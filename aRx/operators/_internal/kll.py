@@ -0,0 +1,154 @@
+"""KLL
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from math import ceil
+from bisect import bisect_left
+from random import Random
+from itertools import accumulate
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class KLLSketch(T.Generic[K]):
+    """Estimate quantiles of the values added to it, using memory logarithmic to their number.
+
+    Values are kept in a hierarchy of compactors, where each value in level h stands for 2 ** h
+    values. Once full, a level is sorted and half its values, alternately picked, are promoted to
+    the next one. Sketches with the same k can be merged.
+    """
+
+    __slots__ = ("_k", "_size", "_count", "_random", "_capacity", "_compactors")
+
+    def __init__(self, k: int = 200, *, seed: T.Any = None) -> None:
+        """KLLSketch constructor.
+
+        Arguments:
+            k: Capacity of the top level, bigger values give better precision and use more memory.
+            seed: Seed for the random choice of which values are promoted.
+
+        """
+        if k < 2:
+            raise ValueError("KLLSketch k must be at least 2")
+
+        # Internal
+        self._k = k
+        self._size = 0
+        self._count = 0
+        self._random = Random(seed)
+        self._capacity = 0
+        self._compactors: T.List[T.List[K]] = []
+        self._grow()
+
+    def __len__(self) -> int:
+        """Number of values added to the sketch."""
+        return self._count
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    def _level_capacity(self, level: int) -> int:
+        depth = len(self._compactors) - level - 1
+        return int(ceil(self._k * (2 / 3) ** depth)) + 1
+
+    def _grow(self) -> None:
+        self._compactors.append([])
+        self._capacity = sum(map(self._level_capacity, range(len(self._compactors))))
+
+    def _compress(self) -> None:
+        for level, compactor in enumerate(self._compactors):
+            if len(compactor) < self._level_capacity(level):
+                continue
+
+            if level + 1 >= len(self._compactors):
+                self._grow()
+
+            compactor.sort()
+            promoted = compactor[self._random.getrandbits(1) :: 2]
+            self._compactors[level + 1].extend(promoted)
+            self._size -= len(compactor) - len(promoted)
+            compactor.clear()
+
+            if self._size < self._capacity:
+                break
+
+    def add(self, value: K) -> None:
+        """Add value to the sketch.
+
+        Arguments:
+            value: Value to be accounted for.
+
+        """
+        self._compactors[0].append(value)
+        self._size += 1
+        self._count += 1
+
+        if self._size >= self._capacity:
+            self._compress()
+
+    def merge(self, other: "KLLSketch[K]") -> None:
+        """Merge other sketch into this one.
+
+        Arguments:
+            other: Sketch to be merged.
+
+        Raises:
+            ValueError: If sketches don't share the same k.
+
+        """
+        if other._k != self._k:
+            raise ValueError("Can't merge KLLSketch sketches of different k")
+
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+
+        for compactor, values in zip(self._compactors, other._compactors):
+            compactor.extend(values)
+
+        self._size = sum(map(len, self._compactors))
+        self._count += other._count
+
+        while self._size >= self._capacity:
+            self._compress()
+
+    def quantiles(self, ranks: T.Sequence[float]) -> T.List[K]:
+        """Estimate the values at the given ranks.
+
+        Arguments:
+            ranks: Ranks, between 0 and 1, of the desired values.
+
+        Raises:
+            ValueError: If the sketch is empty.
+
+        Returns:
+            Estimated values, in the same order as ranks.
+
+        """
+        if not self._count:
+            raise ValueError("Can't estimate quantiles of an empty KLLSketch")
+
+        weighted = sorted(
+            (
+                (value, 1 << level)
+                for level, compactor in enumerate(self._compactors)
+                for value in compactor
+            ),
+            key=lambda entry: entry[0],  # type: ignore
+        )
+        cumulative = list(accumulate(weight for _, weight in weighted))
+        total = cumulative[-1]
+
+        last = len(weighted) - 1
+
+        # First value whose cumulative weight reaches each rank
+        return [weighted[min(bisect_left(cumulative, rank * total), last)][0] for rank in ranks]
+
+
+__all__ = ("KLLSketch",)
@@ -0,0 +1,87 @@
+"""PeriodicEstimate
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from abc import abstractmethod
+
+# Project
+from ...streams.single_stream import SingleStreamBase
+
+if T.TYPE_CHECKING:
+    # Project
+    from ...namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+L = T.TypeVar("L")
+
+
+class PeriodicEstimate(SingleStreamBase[K, L]):
+    """Base for operators that summarize the values received into an estimate.
+
+    The estimate is emitted on close and, when every is given, after each every values.
+    """
+
+    __slots__ = ("_every", "_pending", "_namespace")
+
+    def __init__(self, *, every: T.Optional[int] = None, **kwargs: T.Any) -> None:
+        """PeriodicEstimate constructor.
+
+        Arguments:
+            every: Amount of values received between emissions.
+            kwargs: Keyword parameters for super.
+
+        """
+        if every is not None and every < 1:
+            raise ValueError(f"{type(self).__name__} every must be positive")
+
+        super().__init__(**kwargs)
+
+        self._every = every
+        # Values received since the last emission
+        self._pending = 0
+        self._namespace: T.Optional["Namespace"] = None
+
+    @abstractmethod
+    def _add(self, value: L) -> None:
+        """Account value into the estimate."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _estimate(self) -> K:
+        """Compute the current estimate."""
+        raise NotImplementedError
+
+    def _send(self, value: L, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        self._add(value)
+
+        self._pending += 1
+        if self._pending != self._every:
+            self._namespace = namespace
+            return None
+
+        self._pending = 0
+        self._namespace = None
+        return self._redirect(self._estimate(), namespace)
+
+    async def _aclose(self) -> None:
+        if self._pending:
+            assert self._namespace is not None
+
+            awaitable = self._aredirect(self._estimate(), self._namespace)
+
+            self._pending = 0
+            self._namespace = None
+
+            await awaitable
+
+        await super()._aclose()
+
+
+__all__ = ("PeriodicEstimate",)
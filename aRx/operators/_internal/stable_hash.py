@@ -0,0 +1,48 @@
+"""stable_hash
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from hashlib import blake2b
+
+HASH_SPACE: T.Final = 2**64
+"""Number of distinct values returned by :func:`stable_hash`."""
+
+Hashable = T.Union[str, int, bytes, bytearray, memoryview]
+
+
+def stable_hash(key: Hashable, secret: bytes = b"") -> int:
+    """Hash key into 64 bits, consistently across processes.
+
+    Unlike the builtin hash, whose result for str and bytes changes between processes, this allows
+    results computed in different processes to be compared and combined. The type of key is part
+    of the hash, so equivalent keys of different types, like 1 and "1", hash differently.
+
+    Arguments:
+        key: Value to be hashed.
+        secret: Key for the hash function, different secrets produce unrelated hashes.
+
+    Raises:
+        TypeError: If key isn't str, int or bytes-like.
+
+    Returns:
+        Integer in the range [0, HASH_SPACE).
+
+    """
+    if isinstance(key, str):
+        data = b"s" + key.encode()
+    elif isinstance(key, int):
+        data = b"i" + str(key).encode()
+    elif isinstance(key, (bytes, bytearray, memoryview)):
+        data = b"b" + bytes(key)
+    else:
+        raise TypeError(f"Can't hash {type(key).__name__}, must be str, int or bytes")
+
+    return int.from_bytes(blake2b(data, digest_size=8, key=secret).digest(), "little")
+
+
+__all__ = ("HASH_SPACE", "Hashable", "stable_hash")
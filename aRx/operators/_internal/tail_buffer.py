@@ -0,0 +1,111 @@
+"""TailBuffer
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Generic Types
+K = T.TypeVar("K")
+
+EMPTY: T.Final = object()
+"""Marker returned by :meth:`TailBuffer.push` when no value was evicted."""
+
+
+class TailBuffer(T.Generic[K]):
+    """Fixed capacity ring buffer that retains only the last values pushed into it.
+
+    All slots are allocated upfront, so memory usage is bound by the capacity regardless of how many
+    values flow through it.
+    """
+
+    __slots__ = ("_slots", "_capacity", "_head", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        """TailBuffer constructor.
+
+        Arguments:
+            capacity: Maximum number of values retained.
+
+        """
+        if capacity < 0:
+            raise ValueError("TailBuffer capacity can't be negative")
+
+        # Internal
+        self._slots: T.List[T.Any] = [EMPTY] * capacity
+        self._capacity = capacity
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def full(self) -> bool:
+        """Whether any further push will evict the oldest value."""
+        return self._size == self._capacity
+
+    def push(self, value: K) -> T.Union[K, object]:
+        """Append value to the buffer.
+
+        Arguments:
+            value: Value to be retained.
+
+        Returns:
+            The oldest value, evicted to make space for the new one, or :data:`EMPTY`.
+
+        """
+        capacity = self._capacity
+        if capacity == 0:
+            return value
+
+        if self._size < capacity:
+            self._slots[(self._head + self._size) % capacity] = value
+            self._size += 1
+            return EMPTY
+
+        head = self._head
+        evicted = self._slots[head]
+        self._slots[head] = value
+        self._head = (head + 1) % capacity
+
+        return T.cast(K, evicted)
+
+    def values(self) -> T.List[K]:
+        """Retrieve all values in the buffer, without removing them.
+
+        Returns:
+            Retained values, from oldest to newest.
+
+        """
+        end = self._head + self._size
+        if end <= self._capacity:
+            return self._slots[self._head : end]
+
+        return self._slots[self._head :] + self._slots[: end - self._capacity]
+
+    def drain(self) -> T.List[K]:
+        """Remove all values from the buffer at once.
+
+        Returns:
+            Retained values, from oldest to newest.
+
+        """
+        values = self.values()
+        self.clear()
+
+        return values
+
+    def clear(self) -> None:
+        """Release all retained values, keeping the allocated slots."""
+        if self._size:
+            self._slots[:] = [EMPTY] * self._capacity
+
+        self._head = 0
+        self._size = 0
+
+
+__all__ = ("EMPTY", "TailBuffer")
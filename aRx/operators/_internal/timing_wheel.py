@@ -0,0 +1,187 @@
+"""TimingWheel
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from math import ceil
+from asyncio import TimerHandle, AbstractEventLoop, get_running_loop
+from weakref import WeakKeyDictionary
+
+DEFAULT_SIZE: T.Final = 512
+DEFAULT_RESOLUTION: T.Final = 0.01
+
+_wheels: "WeakKeyDictionary[AbstractEventLoop, TimingWheel]" = WeakKeyDictionary()
+
+
+class Timer:
+    """Handle to a callback scheduled in a :class:`TimingWheel`."""
+
+    __slots__ = ("_args", "_tick", "_wheel", "_callback", "fired", "cancelled")
+
+    def __init__(
+        self,
+        wheel: "TimingWheel",
+        tick: int,
+        callback: T.Callable[..., T.Any],
+        args: T.Tuple[T.Any, ...],
+    ) -> None:
+        # Public
+        self.fired = False
+        self.cancelled = False
+
+        # Internal
+        self._args = args
+        self._tick = tick
+        self._wheel = wheel
+        self._callback = callback
+
+    def cancel(self) -> None:
+        """Cancel the callback, in constant time.
+
+        The timer is only removed from the wheel when its slot is next visited.
+        """
+        if self.fired or self.cancelled:
+            return
+
+        self.cancelled = True
+        wheel = self._wheel
+        wheel._live -= 1
+        if wheel._live == 0 and wheel._handle is not None:
+            # No timer left to fire, stop ticking
+            wheel._handle.cancel()
+            wheel._handle = None
+
+        # Drop references early, as the timer may be kept in the wheel for a while
+        self._args = ()
+        self._callback = _noop
+
+
+def _noop(*_: T.Any) -> None:
+    pass
+
+
+class TimingWheel:
+    """Hashed timing wheel, coalescing timers into a single loop callback per tick.
+
+    Timers are hashed into one of size slots by the tick in which they expire, so scheduling and
+    cancelling are constant time operations. The loop callback is only kept scheduled while there
+    are live timers. Timers fire with a precision of resolution seconds, and never early.
+    """
+
+    __slots__ = ("_size", "_live", "_slots", "_handle", "_current", "_resolution")
+
+    def __init__(
+        self, *, size: int = DEFAULT_SIZE, resolution: float = DEFAULT_RESOLUTION
+    ) -> None:
+        """TimingWheel constructor.
+
+        Arguments:
+            size: Number of slots in the wheel.
+            resolution: Duration of a tick, in seconds.
+
+        """
+        if size < 1:
+            raise ValueError("TimingWheel size must be positive")
+
+        if resolution <= 0:
+            raise ValueError("TimingWheel resolution must be positive")
+
+        # Internal
+        self._size = size
+        self._live = 0
+        self._slots: T.List[T.List[Timer]] = [[] for _ in range(size)]
+        self._handle: T.Optional[TimerHandle] = None
+        self._current = 0
+        self._resolution = resolution
+
+    def __len__(self) -> int:
+        """Number of timers neither fired nor cancelled."""
+        return self._live
+
+    def _now(self, loop: AbstractEventLoop) -> int:
+        return int(loop.time() / self._resolution)
+
+    def call_later(self, delay: float, callback: T.Callable[..., T.Any], *args: T.Any) -> Timer:
+        """Schedule callback to be called with args after delay seconds.
+
+        Arguments:
+            delay: Time, in seconds, to wait before calling callback.
+            callback: Callable to be called.
+            args: Positional arguments for callback.
+
+        Returns:
+            Timer that can be used to cancel the call.
+
+        """
+        loop = get_running_loop()
+
+        if self._handle is None:
+            # Wheel was idle, any timer left behind was cancelled
+            if self._live == 0:
+                for slot in self._slots:
+                    slot.clear()
+
+            self._current = self._now(loop)
+            self._handle = loop.call_at((self._current + 1) * self._resolution, self._advance)
+
+        # Round up, plus one, so timers never fire early
+        tick = self._now(loop) + int(ceil(delay / self._resolution)) + 1
+        timer = Timer(self, tick, callback, args)
+        self._slots[tick % self._size].append(timer)
+        self._live += 1
+
+        return timer
+
+    def _advance(self) -> None:
+        loop = get_running_loop()
+        now = self._now(loop)
+        size = self._size
+
+        # When lagging behind for more than a revolution, visiting each slot once is enough
+        for tick in range(max(self._current + 1, now - size + 1), now + 1):
+            slot = self._slots[tick % size]
+            if not slot:
+                continue
+
+            due = [timer for timer in slot if timer._tick <= now or timer.cancelled]
+            if not due:
+                continue
+
+            slot[:] = [timer for timer in slot if not (timer._tick <= now or timer.cancelled)]
+            for timer in due:
+                if timer.cancelled:
+                    continue
+
+                timer.fired = True
+                self._live -= 1
+                try:
+                    timer._callback(*timer._args)
+                except Exception as exc:
+                    loop.call_exception_handler(
+                        {"message": "Exception in timing wheel callback", "exception": exc}
+                    )
+
+        self._current = now
+
+        if self._live > 0:
+            self._handle = loop.call_at((now + 1) * self._resolution, self._advance)
+        else:
+            self._handle = None
+
+
+def get_timing_wheel() -> TimingWheel:
+    """Retrieve the timing wheel shared by everything running in the current event loop."""
+    loop = get_running_loop()
+
+    wheel = _wheels.get(loop)
+    if wheel is None:
+        wheel = _wheels[loop] = TimingWheel()
+
+    return wheel
+
+
+__all__ = ("Timer", "TimingWheel", "get_timing_wheel")
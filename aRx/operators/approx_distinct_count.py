@@ -0,0 +1,50 @@
+"""ApproxDistinctCount
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Project
+from ._internal.hyperloglog import HyperLogLog
+from ._internal.stable_hash import Hashable
+from ._internal.periodic_estimate import PeriodicEstimate
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class ApproxDistinctCount(PeriodicEstimate[int, K]):
+    """Estimate the number of distinct values received, using a HyperLogLog sketch.
+
+    The estimate is emitted on close and, when every is given, after each every values. The
+    sketch is available as :attr:`sketch`, so estimates of sharded pipelines can be merged.
+    """
+
+    __slots__ = ("_key", "sketch")
+
+    def __init__(
+        self,
+        precision: int = 14,
+        *,
+        key: T.Optional[T.Callable[[K], Hashable]] = None,
+        every: T.Optional[int] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        super().__init__(every=every, **kwargs)
+
+        self.sketch = HyperLogLog(precision)
+
+        self._key = key
+
+    def _add(self, value: K) -> None:
+        self.sketch.add(T.cast(Hashable, value) if self._key is None else self._key(value))
+
+    def _estimate(self) -> int:
+        return self.sketch.count()
+
+
+__all__ = ("ApproxDistinctCount",)
@@ -0,0 +1,54 @@
+"""ApproxQuantiles
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Project
+from ._internal.kll import KLLSketch
+from ._internal.periodic_estimate import PeriodicEstimate
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class ApproxQuantiles(PeriodicEstimate[T.Dict[float, K], K]):
+    """Estimate quantiles of the values received, using a KLL sketch.
+
+    A dict mapping each requested quantile to its estimated value is emitted on close and, when
+    every is given, after each every values. The sketch is available as :attr:`sketch`, so
+    estimates of sharded pipelines can be merged.
+    """
+
+    __slots__ = ("_quantiles", "sketch")
+
+    def __init__(
+        self,
+        quantiles: T.Sequence[float] = (0.5, 0.99),
+        *,
+        k: int = 200,
+        seed: T.Any = None,
+        every: T.Optional[int] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        if not all(0.0 <= quantile <= 1.0 for quantile in quantiles):
+            raise ValueError("ApproxQuantiles quantiles must be between 0 and 1")
+
+        super().__init__(every=every, **kwargs)
+
+        self.sketch: KLLSketch[K] = KLLSketch(k, seed=seed)
+
+        self._quantiles = tuple(quantiles)
+
+    def _add(self, value: K) -> None:
+        self.sketch.add(value)
+
+    def _estimate(self) -> T.Dict[float, K]:
+        return dict(zip(self._quantiles, self.sketch.quantiles(self._quantiles)))
+
+
+__all__ = ("ApproxQuantiles",)
@@ -7,9 +7,7 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 # Internal
 import typing as T
-
-# External
-from async_tools import attempt_await
+from inspect import isawaitable
 
 # Project
 from ..streams import SingleStream
@@ -24,6 +22,8 @@ K = T.TypeVar("K")
 
 
 class Assert(SingleStream[K]):
+    __slots__ = ("_exc", "_asend_predicate")
+
     def __init__(
         self,
         asend_predicate: T.Callable[[K], T.Union[T.Awaitable[bool], bool]],
@@ -35,16 +35,24 @@ class Assert(SingleStream[K]):
         self._exc = exc
         self._asend_predicate = asend_predicate
 
-    async def _asend(self, value: K, namespace: "Namespace") -> None:
-        if not await attempt_await(self._asend_predicate(value)):
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        valid = self._asend_predicate(value)
+
+        if isawaitable(valid):
+            return self._assert_awaited(valid, value, namespace)
+
+        if not valid:
             raise self._exc
 
-        awaitable = super()._asend(value, namespace)
+        return self._redirect(value, namespace)
 
-        # Remove reference early to avoid keeping large objects in memory
-        del value
+    async def _assert_awaited(
+        self, valid: T.Awaitable[bool], value: K, namespace: "Namespace"
+    ) -> None:
+        if not await valid:
+            raise self._exc
 
-        await awaitable
+        await self._aredirect(value, namespace)
 
 
 __all__ = ("Assert",)
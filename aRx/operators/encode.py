@@ -0,0 +1,55 @@
+"""Encode
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Project
+from ..codecs import Codec, PickleCodec
+from ..streams.single_stream import SingleStreamBase
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Encode(SingleStreamBase[T.Any, K]):
+    """Serialize values with codec, a :class:`~aRx.codecs.PickleCodec` by default.
+
+    With batch, each value received must be a batch of values, such as the lists emitted by
+    :func:`~aRx.operations.batches`, which is encoded together into a single contiguous buffer.
+    """
+
+    __slots__ = ("_batch", "_codec")
+
+    def __init__(
+        self, codec: T.Optional[Codec] = None, *, batch: bool = False, **kwargs: T.Any
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self._batch = batch
+        self._codec = PickleCodec() if codec is None else codec
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        codec = self._codec
+        result = (
+            codec.encode_many(T.cast(T.Iterable[T.Any], value))
+            if self._batch
+            else codec.encode(value)
+        )
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        return self._redirect(result, namespace)
+
+
+__all__ = ("Encode",)
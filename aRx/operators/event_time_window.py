@@ -0,0 +1,203 @@
+"""EventTimeWindow
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from heapq import heappop, heappush
+
+# Project
+from .sliding_window import AGGREGATES
+from ..streams.single_stream import SingleStreamBase
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+DEFAULT_MAX_OPEN_WINDOWS: T.Final = 1024
+
+
+class WindowResult(T.NamedTuple):
+    """Aggregate of the values whose timestamp lies within [start, end)."""
+
+    start: float
+    end: float
+    value: T.Any
+
+
+class EventTimeWindow(SingleStreamBase[WindowResult, K]):
+    """Aggregate values in tumbling, or hopping, windows of event time.
+
+    Windows span size units of the timestamps extracted from values, and start every slide units,
+    slide defaults to size for tumbling windows. The watermark trails the greatest timestamp seen
+    by allowed_lateness, and once it passes the end of a window the window aggregate is emitted.
+    Values that only belong to windows already emitted are late and dropped. On close all open
+    windows are emitted.
+
+    Each open window only holds the running state of its aggregate, instead of its values. When
+    more than max_open_windows are open the oldest one is emitted early.
+    """
+
+    __slots__ = (
+        "_key",
+        "_late",
+        "_size",
+        "_open",
+        "_slide",
+        "_starts",
+        "_max_open",
+        "_lateness",
+        "_aggregate",
+        "_namespace",
+        "_timestamp",
+        "_watermark",
+        "_closed_until",
+    )
+
+    def __init__(
+        self,
+        aggregate: str,
+        size: float,
+        *,
+        timestamp: T.Callable[[K], float],
+        slide: T.Optional[float] = None,
+        key: T.Optional[T.Callable[[K], T.Any]] = None,
+        allowed_lateness: float = 0.0,
+        max_open_windows: int = DEFAULT_MAX_OPEN_WINDOWS,
+        **kwargs: T.Any,
+    ) -> None:
+        if aggregate not in AGGREGATES:
+            raise ValueError(
+                f"EventTimeWindow aggregate must be one of {', '.join(sorted(AGGREGATES))}"
+            )
+
+        if size <= 0 or (slide is not None and slide <= 0):
+            raise ValueError("EventTimeWindow size and slide must be positive")
+
+        if allowed_lateness < 0:
+            raise ValueError("EventTimeWindow allowed_lateness can't be negative")
+
+        if max_open_windows < 1:
+            raise ValueError("EventTimeWindow max_open_windows must be positive")
+
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._late = 0
+        self._size = size
+        # Running state of each open window, indexed by start: [count, accumulator]
+        self._open: T.Dict[float, T.List[T.Any]] = {}
+        self._slide = size if slide is None else slide
+        self._starts: T.List[float] = []
+        self._max_open = max_open_windows
+        self._lateness = allowed_lateness
+        self._aggregate = aggregate
+        self._namespace: T.Optional["Namespace"] = None
+        self._timestamp = timestamp
+        self._watermark = float("-inf")
+        # Every window ending at or before this was already emitted
+        self._closed_until = float("-inf")
+
+    @property
+    def late(self) -> int:
+        """Number of values dropped for arriving after all their windows were emitted."""
+        return self._late
+
+    @property
+    def watermark(self) -> float:
+        """Event time up to which all data is assumed to have been received."""
+        return self._watermark
+
+    def _result(self, start: float) -> WindowResult:
+        count, accumulator = self._open.pop(start)
+
+        aggregate = self._aggregate
+        if aggregate == "count":
+            value = count
+        elif aggregate == "mean":
+            value = accumulator / count
+        else:
+            value = accumulator
+
+        return WindowResult(start, start + self._size, value)
+
+    def _add(self, start: float, item: T.Any) -> None:
+        state = self._open.get(start)
+        if state is None:
+            self._open[start] = [1, item]
+            heappush(self._starts, start)
+            return
+
+        state[0] += 1
+
+        aggregate = self._aggregate
+        if aggregate == "sum" or aggregate == "mean":
+            state[1] += item
+        elif aggregate == "min":
+            if item < state[1]:
+                state[1] = item
+        elif aggregate == "max":
+            if item > state[1]:
+                state[1] = item
+
+    def _ready(self, limit: float) -> T.List[WindowResult]:
+        """Retrieve the results of all windows ending up to limit, and of any excess window."""
+        results = []
+        starts = self._starts
+        while starts and (starts[0] + self._size <= limit or len(starts) > self._max_open):
+            start = heappop(starts)
+            self._closed_until = max(self._closed_until, start + self._size)
+            results.append(self._result(start))
+
+        return results
+
+    async def _emit(self, results: T.List[WindowResult], namespace: "Namespace") -> None:
+        for result in results:
+            await self._aredirect(result, namespace)
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        time = self._timestamp(value)
+        item = value if self._key is None else self._key(value)
+
+        size = self._size
+        slide = self._slide
+        closed_until = self._closed_until
+
+        # Assign value to every window that contains it and wasn't emitted yet
+        start = time - time % slide
+        if start + size <= closed_until:
+            self._late += 1
+        else:
+            while start > time - size and start + size > closed_until:
+                self._add(start, item)
+                start -= slide
+
+        self._namespace = namespace
+
+        watermark = time - self._lateness
+        if watermark > self._watermark:
+            self._watermark = watermark
+            self._closed_until = max(self._closed_until, watermark)
+
+        results = self._ready(self._watermark)
+        return self._emit(results, namespace) if results else None
+
+    async def _aclose(self) -> None:
+        results = self._ready(float("inf"))
+        if results:
+            assert self._namespace is not None
+            await self._emit(results, self._namespace)
+
+        self._namespace = None
+
+        await super()._aclose()
+
+
+__all__ = ("EventTimeWindow", "WindowResult")
@@ -7,12 +7,14 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 # Internal
 import typing as T
+from inspect import isawaitable
 
 # External
 from async_tools import attempt_await
 
 # Project
 from ..streams import SingleStream
+from ..predicates import Predicate
 
 if T.TYPE_CHECKING:
     # Project
@@ -43,6 +45,14 @@ class FilterCallableWithIndex(T.Protocol[M]):
 
 
 class Filter(SingleStream[K]):
+    """Forward only the values, and errors, accepted by the given predicates.
+
+    When asend_predicate is a declarative :class:`~aRx.predicates.Predicate`, a MultiStream
+    observed by this filter indexes it, and only delivers the values it may accept.
+    """
+
+    __slots__ = ("_index", "_asend_predicate", "_athrow_predicate")
+
     @T.overload
     def __init__(
         self,
@@ -93,30 +103,46 @@ class Filter(SingleStream[K]):
         self._asend_predicate = asend_predicate
         self._athrow_predicate = athrow_predicate
 
-    async def _asend(self, value: K, namespace: "Namespace") -> None:
+    @property
+    def predicate(self) -> T.Optional[Predicate]:
+        """Declarative predicate applied to values, if any."""
+        predicate = self._asend_predicate
+        return predicate if self._index is None and isinstance(predicate, Predicate) else None
+
+    def snapshot(self) -> T.Optional[int]:
+        return self._index
+
+    def restore(self, state: T.Optional[int]) -> None:
+        if self._index is not None and state is not None:
+            self._index = state
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
         if self._asend_predicate is None:
-            awaitable: T.Union[T.Awaitable[bool], bool] = True
+            keep: T.Union[T.Awaitable[bool], bool] = True
         elif self._index is None:
             if T.TYPE_CHECKING:
                 # Workaround type system due to class bad design.
                 # TODO: Indexed operations should be a different class
                 assert not (isinstance(self._asend_predicate, FilterCallableWithIndex))
-            awaitable = self._asend_predicate(value)
+            keep = self._asend_predicate(value)
         else:
             if T.TYPE_CHECKING:
                 # Workaround type system due to class bad design.
                 # TODO: Indexed operations should be a different class
                 assert not (isinstance(self._asend_predicate, FilterCallable))
-            awaitable = self._asend_predicate(value, self._index)
+            keep = self._asend_predicate(value, self._index)
             self._index += 1
 
-        if await attempt_await(awaitable):
-            result = super()._asend(value, namespace)
+        if isawaitable(keep):
+            return self._filter_awaited(keep, value, namespace)
 
-            # Remove reference early to avoid keeping large objects in memory
-            del value
+        return self._redirect(value, namespace) if keep else None
 
-            await result
+    async def _filter_awaited(
+        self, keep: T.Awaitable[bool], value: K, namespace: "Namespace"
+    ) -> None:
+        if await keep:
+            await self._aredirect(value, namespace)
 
     async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
         if self._athrow_predicate is None or await attempt_await(self._athrow_predicate(exc)):
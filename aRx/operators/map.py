@@ -7,6 +7,7 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 # Internal
 import typing as T
+from inspect import isawaitable
 
 # External
 from async_tools import attempt_await
@@ -57,6 +58,8 @@ class MapperAwaitableCallableWithIndex(T.Protocol[M, N]):
 
 
 class Map(SingleStreamBase[K, L]):
+    __slots__ = ("_index", "_asend_mapper", "_athrow_mapper")
+
     @T.overload
     def __init__(
         self,
@@ -136,9 +139,16 @@ class Map(SingleStreamBase[K, L]):
         self._asend_mapper = asend_mapper
         self._athrow_mapper = athrow_mapper
 
-    async def _asend_impl(self, value: L) -> K:
+    def snapshot(self) -> T.Optional[int]:
+        return self._index
+
+    def restore(self, state: T.Optional[int]) -> None:
+        if self._index is not None and state is not None:
+            self._index = state
+
+    def _send(self, value: L, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
         if self._asend_mapper is None:
-            awaitable: T.Union[T.Awaitable[K], K] = T.cast(K, value)
+            result: T.Union[T.Awaitable[K], K] = T.cast(K, value)
         elif self._index is None:
             if T.TYPE_CHECKING:
                 # Workaround type system due to class bad design.
@@ -147,7 +157,7 @@ class Map(SingleStreamBase[K, L]):
                     isinstance(self._asend_mapper, MapperCallableWithIndex)
                     or isinstance(self._asend_mapper, MapperAwaitableCallableWithIndex)
                 )
-            awaitable = self._asend_mapper(value)
+            result = self._asend_mapper(value)
         else:
             if T.TYPE_CHECKING:
                 # Workaround type system due to class bad design.
@@ -156,15 +166,16 @@ class Map(SingleStreamBase[K, L]):
                     isinstance(self._asend_mapper, MapperCallable)
                     or isinstance(self._asend_mapper, MapperAwaitableCallable)
                 )
-            awaitable = self._asend_mapper(value, self._index)
+            result = self._asend_mapper(value, self._index)
             self._index += 1
 
-        result = attempt_await(awaitable)
-
         # Remove reference early to avoid keeping large objects in memory
         del value
 
-        return await result
+        if isawaitable(result):
+            return self._aredirect_awaited(T.cast(T.Awaitable[K], result), namespace)
+
+        return self._redirect(result, namespace)
 
     async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
         if self._athrow_mapper:
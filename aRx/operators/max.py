@@ -10,10 +10,7 @@ import typing as T
 
 # Project
 from ..streams import SingleStream
-
-if T.TYPE_CHECKING:
-    # Project
-    from ..namespace import Namespace
+from ..namespace import Namespace
 
 
 class Comparable(T.Protocol):
@@ -27,12 +24,22 @@ _NOT_PROVIDED = object()
 
 
 class Max(SingleStream[K]):
+    __slots__ = ("_max", "_namespace")
+
     def __init__(self, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
         self._max: K = _NOT_PROVIDED  # type: ignore
         self._namespace: T.Optional["Namespace"] = None
 
-    async def _asend(self, value: K, namespace: "Namespace") -> None:
+    def snapshot(self) -> T.Optional[T.Tuple[K]]:
+        return None if self._max == _NOT_PROVIDED else (self._max,)
+
+    def restore(self, state: T.Optional[T.Tuple[K]]) -> None:
+        if state is not None:
+            (self._max,) = state
+            self._namespace = Namespace(self, "restore")
+
+    def _send(self, value: K, namespace: "Namespace") -> None:
         if self._max == _NOT_PROVIDED or value > self._max:
             self._max = value
             self._namespace = namespace
@@ -41,7 +48,7 @@ class Max(SingleStream[K]):
         if self._max != _NOT_PROVIDED:
             assert self._namespace is not None
 
-            awaitable = super()._asend(self._max, self._namespace)
+            awaitable = self._aredirect(self._max, self._namespace)
 
             self._max = _NOT_PROVIDED  # type: ignore
             self._namespace = None
@@ -10,11 +10,7 @@ import typing as T
 
 # Project
 from ..streams import SingleStream
-
-if T.TYPE_CHECKING:
-    # Project
-    from ..namespace import Namespace
-
+from ..namespace import Namespace
 
 # Generic Types
 K = T.TypeVar("K")
@@ -30,12 +26,22 @@ _NOT_PROVIDED: T.Final = object()
 
 
 class Min(SingleStream[M]):
+    __slots__ = ("_min", "_namespace")
+
     def __init__(self, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
         self._min: M = _NOT_PROVIDED  # type: ignore
         self._namespace: T.Optional["Namespace"] = None
 
-    async def _asend(self, value: M, namespace: "Namespace") -> None:
+    def snapshot(self) -> T.Optional[T.Tuple[M]]:
+        return None if self._min == _NOT_PROVIDED else (self._min,)
+
+    def restore(self, state: T.Optional[T.Tuple[M]]) -> None:
+        if state is not None:
+            (self._min,) = state
+            self._namespace = Namespace(self, "restore")
+
+    def _send(self, value: M, namespace: "Namespace") -> None:
         if self._min == _NOT_PROVIDED or value < self._min:
             self._min = value
             self._namespace = namespace
@@ -44,7 +50,7 @@ class Min(SingleStream[M]):
         if self._min != _NOT_PROVIDED:
             assert self._namespace is not None
 
-            awaitable = super()._asend(self._min, self._namespace)
+            awaitable = self._aredirect(self._min, self._namespace)
 
             self._min = _NOT_PROVIDED  # type: ignore
             self._namespace = None
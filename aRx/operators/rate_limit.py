@@ -0,0 +1,122 @@
+"""RateLimit
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from time import monotonic
+from asyncio import sleep
+
+# Project
+from ..streams import SingleStream
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class RateLimit(SingleStream[K]):
+    """Limit the rate at which values are forwarded, using a token bucket.
+
+    The bucket holds up to burst tokens and is refilled at rate tokens per second. Each forwarded
+    value takes a token. When none is available, the value either waits, suspending upstream, or
+    is dropped. Waits are computed from the token deficit, so no polling happens, and concurrent
+    values are queued in arrival order by reserving tokens ahead of time.
+
+    Time is read from the monotonic clock, the default event loop clock, so tokens are accounted
+    without requiring a running event loop.
+    """
+
+    __slots__ = (
+        "_drop",
+        "_rate",
+        "_burst",
+        "_start",
+        "_tokens",
+        "_updated",
+        "_dropped",
+        "_forwarded",
+        "_throttled",
+    )
+
+    def __init__(
+        self, rate: float, burst: int = 1, *, drop: bool = False, **kwargs: T.Any
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("RateLimit rate must be positive")
+
+        if burst < 1:
+            raise ValueError("RateLimit burst must be positive")
+
+        super().__init__(**kwargs)
+
+        self._drop = drop
+        self._rate = rate
+        self._burst = burst
+        self._start: T.Optional[float] = None
+        self._tokens = float(burst)
+        self._updated = 0.0
+        self._dropped = 0
+        self._forwarded = 0
+        self._throttled = 0.0
+
+    @property
+    def dropped(self) -> int:
+        """Number of values dropped for lack of tokens."""
+        return self._dropped
+
+    @property
+    def throttled_time(self) -> float:
+        """Total time, in seconds, values were made to wait for tokens."""
+        return self._throttled
+
+    @property
+    def observed_rate(self) -> float:
+        """Values forwarded per second, since the first value was received."""
+        if self._start is None:
+            return 0.0
+
+        elapsed = monotonic() - self._start
+        return self._forwarded / elapsed if elapsed > 0 else 0.0
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        now = monotonic()
+        if self._start is None:
+            self._start = self._updated = now
+
+        # Refill bucket with the tokens accrued since last update
+        tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+        if tokens >= 1:
+            self._tokens = tokens - 1
+            self._forwarded += 1
+            return self._redirect(value, namespace)
+
+        if self._drop:
+            self._tokens = tokens
+            self._dropped += 1
+            return None
+
+        # Reserve a token ahead of time, a negative amount of tokens signals a queue of waiters
+        self._tokens = tokens - 1
+        delay = -self._tokens / self._rate
+        self._throttled += delay
+
+        return self._throttle(delay, value, namespace)
+
+    async def _throttle(self, delay: float, value: K, namespace: "Namespace") -> None:
+        await sleep(delay)
+
+        self._forwarded += 1
+        await self._aredirect(value, namespace)
+
+
+__all__ = ("RateLimit",)
@@ -0,0 +1,84 @@
+"""ReservoirSample
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from math import exp, log, floor
+from random import Random
+
+# Project
+from ..streams import SingleStream
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class ReservoirSample(SingleStream[K]):
+    """Keep an uniform sample of size values, which is emitted, in arrival order, on close.
+
+    Uses Algorithm L, which draws random numbers only for the values that end up in the sample,
+    instead of one per value received.
+    """
+
+    __slots__ = ("_size", "_seen", "_next", "_random", "_weight", "_reservoir")
+
+    def __init__(self, size: int, *, seed: T.Any = None, **kwargs: T.Any) -> None:
+        if size < 1:
+            raise ValueError("ReservoirSample size must be positive")
+
+        super().__init__(**kwargs)
+
+        self._size = size
+        self._seen = 0
+        self._next = size - 1
+        self._random = Random(seed)
+        self._weight = 1.0
+        self._reservoir: T.List[T.Tuple[int, K, "Namespace"]] = []
+
+    def _uniform(self) -> float:
+        # Uniform in (0, 1), as both log(0) and log(1 - 1) are undefined
+        value = 0.0
+        while value == 0.0:
+            value = self._random.random()
+
+        return value
+
+    def _advance(self) -> None:
+        self._weight *= exp(log(self._uniform()) / self._size)
+        self._next += floor(log(self._uniform()) / log(1.0 - self._weight)) + 1
+
+    def _send(self, value: K, namespace: "Namespace") -> None:
+        index = self._seen
+        self._seen = index + 1
+
+        if index < self._size:
+            self._reservoir.append((index, value, namespace))
+            if index == self._next:
+                self._advance()
+        elif index == self._next:
+            self._reservoir[self._random.randrange(self._size)] = (index, value, namespace)
+            self._advance()
+
+    async def _aclose(self) -> None:
+        reservoir = self._reservoir
+        reservoir.sort(key=lambda entry: entry[0])
+        self._reservoir = []
+
+        for _, value, namespace in reservoir:
+            await self._aredirect(value, namespace)
+
+        del reservoir
+
+        await super()._aclose()
+
+
+__all__ = ("ReservoirSample",)
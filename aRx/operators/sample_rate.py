@@ -0,0 +1,82 @@
+"""SampleRate
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from math import inf, log
+from random import Random
+from hashlib import blake2b
+
+# Project
+from ..streams import SingleStream
+from ._internal.stable_hash import HASH_SPACE, Hashable, stable_hash
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class SampleRate(SingleStream[K]):
+    """Forward each value with probability rate.
+
+    By default values are sampled at random. Instead of drawing a random number per value, the
+    number of values to skip until the next sampled one is drawn from a geometric distribution.
+
+    When key is given, sampling is deterministic: a value is forwarded if the hash of its key falls
+    within rate of the hash space, so the same subset of keys is sampled on every run.
+    """
+
+    __slots__ = ("_key", "_gap", "_rate", "_secret", "_random", "_threshold")
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        key: T.Optional[T.Callable[[K], Hashable]] = None,
+        seed: T.Any = None,
+        **kwargs: T.Any,
+    ) -> None:
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("SampleRate rate must be between 0 and 1")
+
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._rate = rate
+        self._random = Random(seed)
+        self._secret = b"" if seed is None else blake2b(repr(seed).encode()).digest()
+        self._threshold = int(rate * HASH_SPACE)
+        self._gap = self._next_gap()
+
+    def _next_gap(self) -> float:
+        rate = self._rate
+        if rate >= 1.0:
+            return 0
+        elif rate <= 0.0:
+            return inf
+
+        # 1 - random() lies in (0, 1], as log(0) is undefined
+        return int(log(1.0 - self._random.random()) / log(1.0 - rate))
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        if self._key is not None:
+            if stable_hash(self._key(value), self._secret) >= self._threshold:
+                return None
+        elif self._gap > 0:
+            self._gap -= 1
+            return None
+        else:
+            self._gap = self._next_gap()
+
+        return self._redirect(value, namespace)
+
+
+__all__ = ("SampleRate",)
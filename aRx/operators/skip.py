@@ -7,10 +7,10 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 # Internal
 import typing as T
-from collections import deque
 
 # Project
 from ..streams import SingleStream
+from ._internal.tail_buffer import EMPTY, TailBuffer
 
 if T.TYPE_CHECKING:
     # Project
@@ -22,36 +22,43 @@ K = T.TypeVar("K")
 
 
 class Skip(SingleStream[K]):
+    __slots__ = ("_tail", "_count")
+
     # TODO: Implement Skip athrow
     def __init__(self, count: int, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
 
         self._count = abs(count)
-        self._reverse_queue: T.Optional[T.Deque[K]] = (
-            deque(maxlen=self._count) if count < 0 else None
-        )
-
-    async def _asend(self, value: K, namespace: "Namespace") -> None:
-        if self._reverse_queue is not None:
-            # Skip values from end
-            _value = self._reverse_queue[0]
-            self._reverse_queue.append(value)
-            value = _value
+        self._tail: T.Optional[TailBuffer[K]] = TailBuffer(self._count) if count < 0 else None
+
+    def snapshot(self) -> T.Tuple[int, T.Optional[T.List[K]]]:
+        return self._count, None if self._tail is None else self._tail.values()
+
+    def restore(self, state: T.Tuple[int, T.Optional[T.List[K]]]) -> None:
+        self._count, values = state
+        if self._tail is not None and values is not None:
+            for value in values:
+                self._tail.push(value)
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        if self._tail is not None:
+            # Skip values from end, only values pushed out of the tail are forwarded
+            evicted = self._tail.push(value)
+            if evicted is EMPTY:
+                return None
+
+            value = T.cast(K, evicted)
+            del evicted
         elif self._count > 0:
             # Skip values from start
             self._count -= 1
-            return
-
-        awaitable = super()._asend(value, namespace)
-
-        # Remove reference early to avoid keeping large objects in memory
-        del value
+            return None
 
-        await awaitable
+        return self._redirect(value, namespace)
 
     async def _aclose(self) -> None:
-        if self._reverse_queue is not None:
-            self._reverse_queue.clear()
+        if self._tail is not None:
+            self._tail.clear()
 
         await super()._aclose()
 
@@ -0,0 +1,159 @@
+"""SlidingWindow
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from time import monotonic
+from collections import deque
+
+# Project
+from ..streams.single_stream import SingleStreamBase
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+AGGREGATES: T.Final = frozenset(("min", "max", "sum", "mean", "count"))
+
+
+class SlidingWindow(SingleStreamBase[T.Any, K]):
+    """Emit an aggregate over the window of most recent values, for each value received.
+
+    The window holds either the last size values or the values received in the last duration
+    seconds. Aggregates are updated incrementally, in amortised constant time, as values arrive
+    and expire: sum, mean and count keep running totals, while min and max keep a monotonic
+    deque of the values that may still become the window extreme. Counting only keeps the stamps
+    of values when windowing by duration, and nothing at all when windowing by size.
+
+    Durations are measured with the monotonic clock, the default event loop clock, so no running
+    event loop is required.
+    """
+
+    __slots__ = (
+        "_key",
+        "_size",
+        "_count",
+        "_total",
+        "_stamps",
+        "_entries",
+        "_duration",
+        "_extremes",
+        "_aggregate",
+    )
+
+    def __init__(
+        self,
+        aggregate: str,
+        size: T.Optional[int] = None,
+        *,
+        duration: T.Optional[float] = None,
+        key: T.Optional[T.Callable[[K], T.Any]] = None,
+        **kwargs: T.Any,
+    ) -> None:
+        if aggregate not in AGGREGATES:
+            raise ValueError(
+                f"SlidingWindow aggregate must be one of {', '.join(sorted(AGGREGATES))}"
+            )
+
+        if (size is None) == (duration is None):
+            raise ValueError("SlidingWindow requires either size or duration")
+
+        if (size is not None and size < 1) or (duration is not None and duration <= 0):
+            raise ValueError("SlidingWindow size and duration must be positive")
+
+        super().__init__(**kwargs)
+
+        self._key = key
+        self._size = size
+        # Values received, used to stamp values when windowing by size
+        self._count = 0
+        self._total: T.Any = 0
+        # Stamp of every value in the window, only kept for counting when windowing by duration
+        self._stamps: T.Deque[float] = deque()
+        # Stamp and value of every value in the window, only kept for running totals
+        self._entries: T.Deque[T.Tuple[float, T.Any]] = deque()
+        self._duration = duration
+        # Stamp and value of the candidates for extreme, only kept for min and max
+        self._extremes: T.Deque[T.Tuple[float, T.Any]] = deque()
+        self._aggregate = aggregate
+
+    def _expire(self, threshold: float) -> None:
+        extremes = self._extremes
+        while extremes and extremes[0][0] <= threshold:
+            extremes.popleft()
+
+        stamps = self._stamps
+        while stamps and stamps[0] <= threshold:
+            stamps.popleft()
+
+        entries = self._entries
+        while entries and entries[0][0] <= threshold:
+            self._total -= entries.popleft()[1]
+
+        if not entries:
+            # Reset to avoid accumulating rounding errors
+            self._total = 0
+
+    def _push_extreme(self, stamp: float, value: T.Any) -> None:
+        extremes = self._extremes
+        if self._aggregate == "max":
+            while extremes and extremes[-1][1] <= value:
+                extremes.pop()
+        else:
+            while extremes and extremes[-1][1] >= value:
+                extremes.pop()
+
+        extremes.append((stamp, value))
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        item = value if self._key is None else self._key(value)
+
+        if self._duration is None:
+            assert self._size is not None
+
+            stamp: float = self._count
+            threshold = stamp - self._size
+        else:
+            stamp = monotonic()
+            threshold = stamp - self._duration
+
+        self._count += 1
+        self._expire(threshold)
+
+        aggregate = self._aggregate
+        if aggregate == "min" or aggregate == "max":
+            self._push_extreme(stamp, item)
+            result = self._extremes[0][1]
+        else:
+            if aggregate == "count":
+                # Don't keep values alive, they aren't needed to count
+                if self._size is not None:
+                    result = min(self._count, self._size)
+                else:
+                    self._stamps.append(stamp)
+                    result = len(self._stamps)
+            else:
+                self._entries.append((stamp, item))
+                self._total += item
+                result = self._total if aggregate == "sum" else self._total / len(self._entries)
+
+        return self._redirect(result, namespace)
+
+    async def _aclose(self) -> None:
+        self._stamps.clear()
+        self._entries.clear()
+        self._extremes.clear()
+        self._total = 0
+
+        await super()._aclose()
+
+
+__all__ = ("SlidingWindow",)
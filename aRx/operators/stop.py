@@ -7,12 +7,12 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 # Internal
 import typing as T
+from inspect import isawaitable
 
 # External
 from async_tools import attempt_await
 
 # Project
-from ..errors import ObserverClosedError
 from ..streams import SingleStream
 
 if T.TYPE_CHECKING:
@@ -28,11 +28,9 @@ def noop(_: T.Any) -> bool:
     return False
 
 
-class _StopMark(ObserverClosedError):
-    pass
-
-
 class Stop(SingleStream[K]):
+    __slots__ = ("_index", "_asend_predicate", "_athrow_predicate")
+
     @T.overload
     def __init__(
         self,
@@ -86,26 +84,42 @@ class Stop(SingleStream[K]):
         self._asend_predicate = noop if asend_predicate is None else asend_predicate
         self._athrow_predicate = noop if athrow_predicate is None else athrow_predicate
 
-    async def _asend(self, value: K, namespace: "Namespace") -> None:
+    def snapshot(self) -> T.Optional[int]:
+        return self._index
+
+    def restore(self, state: T.Optional[int]) -> None:
+        if self._index is not None and state is not None:
+            self._index = state
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
         if self._index is None:
-            stop_awaitable = self._asend_predicate(value)
+            stop = self._asend_predicate(value)
         else:
-            stop_awaitable = self._asend_predicate(value, self._index)
+            stop = self._asend_predicate(value, self._index)
             self._index += 1
 
-        if await attempt_await(stop_awaitable):
-            raise _StopMark(self)
+        if isawaitable(stop):
+            return self._stop_awaited(stop, value, namespace)
 
-        awaitable = super()._asend(value, namespace)
+        if stop:
+            self._complete()
+            return None
 
-        # Remove reference early to avoid keeping large objects in memory
-        del value
+        return self._redirect(value, namespace)
 
-        await awaitable
+    async def _stop_awaited(
+        self, stop: T.Awaitable[bool], value: K, namespace: "Namespace"
+    ) -> None:
+        if await stop:
+            self._complete()
+        else:
+            await self._aredirect(value, namespace)
 
     async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
-        if isinstance(exc, _StopMark) or await attempt_await(self._athrow_predicate(exc)):
-            return True
+        if await attempt_await(self._athrow_predicate(exc)):
+            self._complete()
+            return False
+
         return await super()._athrow(exc, namespace)
 
 
@@ -7,57 +7,82 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 # Internal
 import typing as T
-from collections import deque
 
 # Project
-from ..errors import ObserverClosedError
 from ..streams import SingleStream
-
-if T.TYPE_CHECKING:
-    # Project
-    from ..namespace import Namespace
-
+from ..namespace import Namespace
+from ._internal.tail_buffer import TailBuffer
 
 # Generic Types
 K = T.TypeVar("K")
 
 
-class _TakeMark(ObserverClosedError):
-    pass
-
-
 class Take(SingleStream[K]):
+    __slots__ = ("_tail", "_count", "_namespace")
+
     def __init__(self, count: int, **kwargs: T.Any) -> None:
         super().__init__(**kwargs)
 
         self._count = abs(count)
-        self._reverse_queue: T.Optional[T.Deque[T.Tuple[K, "Namespace"]]] = (
-            deque(maxlen=self._count) if count < 0 else None
-        )
+        self._tail: T.Optional[TailBuffer[K]] = TailBuffer(self._count) if count < 0 else None
+        # Only the namespace of the last value is kept, as it is shared by all values in the tail
+        self._namespace: T.Optional["Namespace"] = None
+
+    def snapshot(self) -> T.Tuple[int, T.Optional[T.List[K]]]:
+        return self._count, None if self._tail is None else self._tail.values()
+
+    def restore(self, state: T.Tuple[int, T.Optional[T.List[K]]]) -> None:
+        self._count, values = state
+        if self._tail is not None and values:
+            for value in values:
+                self._tail.push(value)
+
+            self._namespace = Namespace(self, "restore")
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        if self._tail is not None:
+            self._tail.push(value)
+            self._namespace = namespace
+            return None
+
+        if self._count <= 0:
+            self._complete()
+            return None
+
+        self._count -= 1
+        awaitable = self._redirect(value, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        if self._count > 0:
+            return awaitable
+        elif awaitable is None:
+            # Close right away instead of waiting for a value that would be discarded
+            self._complete()
+            return None
+        else:
+            return self._complete_awaited(awaitable)
 
-    async def _asend(self, value: K, namespace: "Namespace") -> None:
-        if self._reverse_queue is None:
-            if self._count <= 0:
-                raise _TakeMark(self)
+    async def _complete_awaited(self, awaitable: T.Awaitable[T.Any]) -> None:
+        await awaitable
+        self._complete()
 
-            self._count -= 1
-            awaitable: T.Awaitable[T.Any] = super()._asend(value, namespace)
+    async def _aclose(self) -> None:
+        if self._tail:
+            assert self._namespace is not None
 
-            # Remove reference early to avoid keeping large objects in memory
-            del value
+            values = self._tail.drain()
+            namespace = self._namespace
+            self._namespace = None
 
-            await awaitable
-        else:
-            self._reverse_queue.append((value, namespace))
+            # Flush in a single pass, only waiting on values the observer doesn't handle right away
+            for value in values:
+                awaitable = self._redirect(value, namespace)
+                if awaitable is not None:
+                    await awaitable
 
-    async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
-        if isinstance(exc, _TakeMark):
-            return True
-        return await super()._athrow(exc, namespace)
-
-    async def _aclose(self) -> None:
-        while self._reverse_queue:
-            await super()._asend(*self._reverse_queue.popleft())
+            del values
 
         return await super()._aclose()
 
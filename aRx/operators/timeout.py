@@ -0,0 +1,189 @@
+"""Timeout
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import (
+    FIRST_COMPLETED,
+    Task,
+    Future,
+    wait,
+    current_task,
+    ensure_future,
+    get_running_loop,
+)
+
+# Project
+from ..errors import ObserverClosedError, ObservationTimeoutError
+from ..streams import SingleStream
+from ._internal.timing_wheel import Timer, get_timing_wheel
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+    from ..protocols import ObserverProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+_NOT_PROVIDED: T.Any = object()
+
+
+class Timeout(SingleStream[K]):
+    """Bound the time upstream may stay idle and the time downstream may take to handle a value.
+
+    When upstream doesn't emit for idle seconds, or downstream takes longer than per_element
+    seconds to handle a value, either fallback is emitted or an
+    :class:`~aRx.errors.ObservationTimeoutError` is thrown. Downstream handling that exceeds its
+    deadline is cancelled.
+
+    Timers are kept in a timing wheel shared by the event loop, so each costs constant time to
+    schedule and cancel. Downstream handling that doesn't complete synchronously is raced against
+    its deadline in a task of its own. The idle timer isn't rescheduled per value, instead it is
+    only postponed when it expires before the idle time actually elapsed.
+
+    Values are always handled in the event loop, where the timers run, so Timeout is never driven
+    synchronously, not even by :func:`~aRx.operations.run_sync`.
+    """
+
+    __slots__ = ("_idle", "_fallback", "_last_time", "_idle_task", "_idle_timer", "_per_element")
+
+    def __init__(
+        self,
+        per_element: T.Optional[float] = None,
+        idle: T.Optional[float] = None,
+        *,
+        fallback: T.Any = _NOT_PROVIDED,
+        **kwargs: T.Any,
+    ) -> None:
+        if per_element is None and idle is None:
+            raise ValueError("Timeout requires per_element or idle")
+
+        if (per_element is not None and per_element <= 0) or (idle is not None and idle <= 0):
+            raise ValueError("Timeout durations must be positive")
+
+        super().__init__(**kwargs)
+
+        self._idle = idle
+        self._fallback = fallback
+        self._last_time = 0.0
+        self._idle_task: T.Optional["Task[None]"] = None
+        self._idle_timer: T.Optional[Timer] = None
+        self._per_element = per_element
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        if self._idle is not None:
+            self._last_time = get_running_loop().time()
+
+        awaitable = self._redirect(value, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        if awaitable is None:
+            return
+
+        if self._per_element is None:
+            await awaitable
+        else:
+            await self._await_deadline(awaitable, namespace)
+
+    async def _await_deadline(self, awaitable: T.Awaitable[T.Any], namespace: "Namespace") -> None:
+        assert self._per_element is not None
+
+        handling = ensure_future(awaitable)
+        deadline: "Future[None]" = get_running_loop().create_future()
+        timer = get_timing_wheel().call_later(self._per_element, _expire, deadline)
+        try:
+            await wait((handling, deadline), return_when=FIRST_COMPLETED)
+        except BaseException:
+            handling.cancel()
+            raise
+        finally:
+            timer.cancel()
+
+        if not handling.done():
+            # Deadline passed first, wait for downstream to unwind before emitting anything else
+            handling.cancel()
+            await wait((handling,))
+
+        if not (handling.cancelled() and deadline.done()):
+            # Value was handled, possibly in the same loop iteration the deadline passed
+            handling.result()
+            return
+
+        if self._fallback is _NOT_PROVIDED:
+            raise ObservationTimeoutError(
+                f"Value wasn't handled within {self._per_element} seconds"
+            )
+
+        await self._aredirect(self._fallback, namespace)
+
+    def _arm_idle(self, delay: float) -> None:
+        self._idle_timer = get_timing_wheel().call_later(delay, self._idle_expired)
+
+    def _idle_expired(self) -> None:
+        assert self._idle is not None
+
+        self._idle_timer = None
+        if self.closed:
+            return
+
+        remaining = self._last_time + self._idle - get_running_loop().time()
+        if remaining > 0:
+            # Data arrived meanwhile, postpone until idle time elapses since the last value
+            self._arm_idle(remaining)
+        elif self._idle_task is None or self._idle_task.done():
+            self._idle_task = get_running_loop().create_task(self._handle_idle())
+        else:
+            # Previous idle handling still running, check again later
+            self._arm_idle(self._idle)
+
+    async def _handle_idle(self) -> None:
+        assert self._idle is not None
+
+        # Restart idle time count
+        self._last_time = get_running_loop().time()
+        self._arm_idle(self._idle)
+
+        try:
+            if self._fallback is _NOT_PROVIDED:
+                await self.athrow(
+                    ObservationTimeoutError(f"No data was received within {self._idle} seconds")
+                )
+            else:
+                await self.asend(self._fallback)
+        except ObserverClosedError:
+            # Closed meanwhile, nothing to report to
+            pass
+
+    async def __observe__(self, observer: "ObserverProtocol[K]") -> None:
+        await super().__observe__(observer)
+
+        if self._idle is not None and self._idle_timer is None and not self.closed:
+            self._last_time = get_running_loop().time()
+            self._arm_idle(self._idle)
+
+    async def _aclose(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+        idle_task = self._idle_task
+        self._idle_task = None
+        if idle_task is not None and not (idle_task.done() or idle_task is current_task()):
+            idle_task.cancel()
+
+        await super()._aclose()
+
+
+def _expire(deadline: "Future[None]") -> None:
+    if not deadline.done():
+        deadline.set_result(None)
+
+
+__all__ = ("Timeout",)
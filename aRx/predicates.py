@@ -0,0 +1,148 @@
+"""Predicates
+
+Declarative predicates, for use with :class:`~aRx.operators.Filter`.
+
+Unlike arbitrary callables, these describe the condition they check, which allows a
+:class:`~aRx.streams.MultiStream` to index the Filters observing it and only deliver each value to
+the ones whose predicate may match, instead of evaluating every predicate for every value.
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Fields are either accessed by name, as an item or attribute, or extracted by a callable
+Field = T.Union[str, T.Callable[[T.Any], T.Any]]
+
+# Errors that signal a value doesn't have the requested field
+FIELD_ERRORS: T.Final = (KeyError, IndexError, TypeError, AttributeError)
+
+
+def field_getter(field: Field) -> T.Callable[[T.Any], T.Any]:
+    """Create function to access field in values.
+
+    Arguments:
+        field: Name of an item, or attribute, or a callable that extracts the field.
+
+    Returns:
+        Function that extracts field from a value, raising one of FIELD_ERRORS if missing.
+
+    """
+    if callable(field):
+        return field
+
+    def getter(value: T.Any) -> T.Any:
+        try:
+            return value[field]
+        except (KeyError, IndexError, TypeError):
+            return getattr(value, field)
+
+    return getter
+
+
+class Predicate:
+    """Base class for declarative predicates."""
+
+    __slots__ = ()
+
+    def __call__(self, value: T.Any) -> bool:
+        raise NotImplementedError
+
+    def __and__(self, other: "Predicate") -> "All":
+        return All(self, other)
+
+    @property
+    def atoms(self) -> T.Tuple["Atom", ...]:
+        """Conditions that must all hold for this predicate to match."""
+        raise NotImplementedError
+
+
+class Atom(Predicate):
+    """Base class for predicates that check a single field."""
+
+    __slots__ = ("field", "getter")
+
+    def __init__(self, field: Field) -> None:
+        self.field = field
+        self.getter = field_getter(field)
+
+    def __call__(self, value: T.Any) -> bool:
+        try:
+            return self.check(self.getter(value))
+        except FIELD_ERRORS:
+            return False
+
+    @property
+    def atoms(self) -> T.Tuple["Atom", ...]:
+        return (self,)
+
+    def check(self, field_value: T.Any) -> bool:
+        """Check field value against this condition."""
+        raise NotImplementedError
+
+
+class Eq(Atom):
+    """Match values whose field is equal to value."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, field: Field, value: T.Hashable) -> None:
+        super().__init__(field)
+        self.value = value
+
+    def check(self, field_value: T.Any) -> bool:
+        return bool(field_value == self.value)
+
+
+class In(Atom):
+    """Match values whose field is one of values."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, field: Field, values: T.Iterable[T.Hashable]) -> None:
+        super().__init__(field)
+        self.values = frozenset(values)
+
+    def check(self, field_value: T.Any) -> bool:
+        return field_value in self.values
+
+
+class Range(Atom):
+    """Match values whose field lies within [low, high), a missing bound is unlimited."""
+
+    __slots__ = ("low", "high")
+
+    def __init__(self, field: Field, low: T.Any = None, high: T.Any = None) -> None:
+        if low is None and high is None:
+            raise ValueError("Range requires at least one bound")
+
+        super().__init__(field)
+        self.low = low
+        self.high = high
+
+    def check(self, field_value: T.Any) -> bool:
+        return (self.low is None or self.low <= field_value) and (
+            self.high is None or field_value < self.high
+        )
+
+
+class All(Predicate):
+    """Match values that satisfy all predicates."""
+
+    __slots__ = ("_atoms",)
+
+    def __init__(self, *predicates: Predicate) -> None:
+        self._atoms = tuple(atom for predicate in predicates for atom in predicate.atoms)
+
+    def __call__(self, value: T.Any) -> bool:
+        return all(atom(value) for atom in self._atoms)
+
+    @property
+    def atoms(self) -> T.Tuple[Atom, ...]:
+        return self._atoms
+
+
+__all__ = ("Predicate", "Atom", "Eq", "In", "Range", "All", "Field", "field_getter")
@@ -8,7 +8,33 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+# Internal
+import typing as T
+
 # Project
-from .observer_protocol import ObserverProtocol
-from .observable_protocol import ObservableProtocol, ObservableProtocolWithOperators
-from .transformer_protocol import TransformerProtocol, TransformerProtocolWithOperators
+from .._lazy import lazy_exports
+
+if T.TYPE_CHECKING:
+    # Project
+    from .observer_protocol import ObserverProtocol
+    from .observable_protocol import ObservableProtocol, ObservableProtocolWithOperators
+    from .transformer_protocol import TransformerProtocol, TransformerProtocolWithOperators
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ObserverProtocol": ".observer_protocol",
+        "ObservableProtocol": ".observable_protocol",
+        "ObservableProtocolWithOperators": ".observable_protocol",
+        "TransformerProtocol": ".transformer_protocol",
+        "TransformerProtocolWithOperators": ".transformer_protocol",
+    },
+)
+
+__all__ = (
+    "ObserverProtocol",
+    "ObservableProtocol",
+    "ObservableProtocolWithOperators",
+    "TransformerProtocol",
+    "TransformerProtocolWithOperators",
+)
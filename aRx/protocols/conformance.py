@@ -0,0 +1,39 @@
+"""Conformance
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Types are kept alive by the cache, which is fine as protocols are only checked against the
+# handful of classes used to compose pipelines
+_cache: T.Dict[T.Tuple[type, type], bool] = {}
+
+
+def conforms(obj: object, protocol: type) -> bool:
+    """Check whether obj implements a runtime checkable protocol.
+
+    A runtime protocol check inspects every protocol member on each call, so the result is cached
+    per type, assuming all instances of a type conform equally.
+
+    Arguments:
+        obj: Object to be checked.
+        protocol: Runtime checkable protocol.
+
+    Returns:
+        Whether obj implements the protocol.
+
+    """
+    key = (protocol, type(obj))
+
+    try:
+        return _cache[key]
+    except KeyError:
+        result = _cache[key] = isinstance(obj, protocol)
+        return result
+
+
+__all__ = ("conforms",)
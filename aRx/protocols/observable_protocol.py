@@ -8,6 +8,9 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Internal
 import typing as T
 
+# Project
+from .conformance import conforms
+
 if T.TYPE_CHECKING:
     # Project
     from ..operations import pipe, sink
@@ -38,28 +41,48 @@ class ObservableProtocolWithOperators(ObservableProtocol[L], T.Protocol[L]):
         ...
 
 
-def add_operators(transformer: ObservableProtocol[L]) -> ObservableProtocolWithOperators[L]:
-    # Internal
-    from copy import copy
-    from types import MethodType
+class _ObservableWithOperators(T.Generic[L]):
+    """Thin wrapper that adds the operators to an object that only implements the protocol."""
 
-    # Project
-    from ..observables import Observable
+    __slots__ = ("_wrapped",)
+
+    def __init__(self, wrapped: ObservableProtocol[L]) -> None:
+        self._wrapped = wrapped
+
+    def __observe__(self, observer: "ObserverProtocol[L]") -> T.Awaitable[None]:
+        return self._wrapped.__observe__(observer)
+
+    def __dispose__(self, observer: "ObserverProtocol[L]") -> T.Awaitable[None]:
+        return self._wrapped.__dispose__(observer)
+
+    def __getattr__(self, name: str) -> T.Any:
+        if name == "_wrapped":
+            # Not initialized yet, avoid infinite recursion
+            raise AttributeError(name)
 
-    if isinstance(transformer, ObservableProtocolWithOperators):
-        return transformer
-    else:
-        # Don't change the original object
-        new = copy(transformer)
+        return getattr(self._wrapped, name)
 
-        # Warning:
-        #   This should implement all the operators defined in TransformerProtocolWithOperators
-        new.__gt__ = MethodType(Observable.__gt__, new)  # type: ignore
-        new.__or__ = MethodType(Observable.__or__, new)  # type: ignore
+    # Warning:
+    #   This should implement all the operators defined in ObservableProtocolWithOperators
+    def __gt__(self, observer: "ObserverProtocol[L]") -> "sink[L]":
+        # Project
+        from ..observables import Observable
+
+        return Observable.__gt__(self, observer)  # type: ignore
+
+    def __or__(self, transformer: "TransformerProtocol[L, M]") -> "pipe[L, M]":
+        # Project
+        from ..observables import Observable
 
-        assert isinstance(new, ObservableProtocolWithOperators)
+        return Observable.__or__(self, transformer)  # type: ignore
+
+
+def add_operators(transformer: ObservableProtocol[L]) -> ObservableProtocolWithOperators[L]:
+    if conforms(transformer, ObservableProtocolWithOperators):
+        return T.cast(ObservableProtocolWithOperators[L], transformer)
 
-        return new
+    # Wrap instead of copying to avoid changing, or duplicating, the original object
+    return T.cast(ObservableProtocolWithOperators[L], _ObservableWithOperators(transformer))
 
 
 __all__ = ("ObservableProtocol", "ObservableProtocolWithOperators", "add_operators")
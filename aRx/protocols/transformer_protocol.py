@@ -10,13 +10,19 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import typing as T
 
 # Project
+from .conformance import conforms
 from .observer_protocol import ObserverProtocol
 from .observable_protocol import (
     ObservableProtocol,
     ObservableProtocolWithOperators,
-    add_operators as observable_add_operators,
+    _ObservableWithOperators,
 )
 
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+
+
 # Generic Types
 K = T.TypeVar("K", contravariant=True)
 L = T.TypeVar("L", covariant=True)
@@ -42,12 +48,45 @@ class TransformerProtocolWithOperators(
     pass
 
 
+class _TransformerWithOperators(_ObservableWithOperators[N], T.Generic[M, N]):
+    """Thin wrapper that adds the operators to an object that only implements the protocol."""
+
+    __slots__ = ()
+
+    _wrapped: TransformerProtocol[M, N]
+
+    @property
+    def keep_alive(self) -> bool:
+        return self._wrapped.keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value: bool) -> None:
+        self._wrapped.keep_alive = value
+
+    @property
+    def closed(self) -> bool:
+        return self._wrapped.closed
+
+    def asend(self, data: M, namespace: T.Optional["Namespace"] = None) -> T.Awaitable[None]:
+        return self._wrapped.asend(data, namespace)
+
+    def athrow(
+        self, main_exc: Exception, namespace: T.Optional["Namespace"] = None
+    ) -> T.Awaitable[None]:
+        return self._wrapped.athrow(main_exc, namespace)
+
+    def aclose(self) -> T.Awaitable[bool]:
+        return self._wrapped.aclose()
+
+
 def add_operators(
     transformer: TransformerProtocol[M, N]
 ) -> TransformerProtocolWithOperators[M, N]:
-    new = observable_add_operators(transformer)
-    assert isinstance(new, TransformerProtocolWithOperators)
-    return new
+    if conforms(transformer, TransformerProtocolWithOperators):
+        return T.cast(TransformerProtocolWithOperators[M, N], transformer)
+
+    # Wrap instead of copying to avoid changing, or duplicating, the original object
+    return T.cast(TransformerProtocolWithOperators[M, N], _TransformerWithOperators(transformer))
 
 
 __all__ = ("TransformerProtocol", "TransformerProtocolWithOperators", "add_operators")
@@ -9,6 +9,29 @@ License, v. 2.0. If a copy of the MPL was not distributed with this
 file, You can obtain one at https://mozilla.org/MPL/2.0/.
 """
 
+# Internal
+import typing as T
+
 # Project
-from .multi_stream import MultiStream
-from .single_stream import SingleStream
+from .._lazy import lazy_exports
+
+if T.TYPE_CHECKING:
+    # Project
+    from .log_stream import LogStream
+    from .multi_stream import MultiStream
+    from .topic_stream import TopicStream
+    from .single_stream import SingleStream
+    from .priority_multi_stream import PriorityMultiStream
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "LogStream": ".log_stream",
+        "TopicStream": ".topic_stream",
+        "MultiStream": ".multi_stream",
+        "SingleStream": ".single_stream",
+        "PriorityMultiStream": ".priority_multi_stream",
+    },
+)
+
+__all__ = ("LogStream", "TopicStream", "MultiStream", "SingleStream", "PriorityMultiStream")
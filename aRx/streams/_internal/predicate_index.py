@@ -0,0 +1,244 @@
+"""PredicateIndex
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from bisect import bisect_left, bisect_right
+
+# Project
+from ...predicates import FIELD_ERRORS, Eq, In, Atom, Range, Predicate
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class _FieldIndex(T.Generic[K]):
+    """Index of the conditions over a single field.
+
+    Range bounds split the domain in segments, each holding the members whose ranges cover it.
+    Segments are updated in place as ranges are added or removed, so only the segments covered by
+    the range change.
+    """
+
+    __slots__ = ("equal", "ranges", "getter", "_points", "_counts", "_segments")
+
+    def __init__(self, getter: T.Callable[[T.Any], T.Any]) -> None:
+        self.equal: T.Dict[T.Hashable, T.Set[K]] = {}
+        self.ranges: T.Dict[K, T.Tuple[T.Any, T.Any]] = {}
+        self.getter = getter
+
+        # Internal
+        self._points: T.List[T.Any] = []
+        # Number of ranges bounded by each point
+        self._counts: T.List[int] = []
+        # Segment i spans from point i - 1, inclusive, to point i, exclusive
+        self._segments: T.List[T.Set[K]] = [set()]
+
+    def __bool__(self) -> bool:
+        return bool(self.equal or self.ranges)
+
+    def _span(self, low: T.Any, high: T.Any) -> range:
+        """Positions of the segments covered by a range whose bounds are points."""
+        points = self._points
+        return range(
+            0 if low is None else bisect_left(points, low) + 1,
+            len(points) + 1 if high is None else bisect_left(points, high) + 1,
+        )
+
+    def _insert_point(self, point: T.Any) -> None:
+        points = self._points
+        position = bisect_left(points, point)
+        if position < len(points) and points[position] == point:
+            self._counts[position] += 1
+            return
+
+        points.insert(position, point)
+        self._counts.insert(position, 1)
+        # Split the segment containing point in two, both covered by the same ranges
+        self._segments.insert(position, set(self._segments[position]))
+
+    def _remove_point(self, point: T.Any) -> None:
+        position = bisect_left(self._points, point)
+        self._counts[position] -= 1
+        if self._counts[position]:
+            return
+
+        # No range is bounded by point anymore, so the segments around it are covered alike
+        del self._points[position]
+        del self._counts[position]
+        del self._segments[position + 1]
+
+    def add_range(self, member: K, low: T.Any, high: T.Any) -> None:
+        """Index member under range [low, high).
+
+        Raises:
+            TypeError: If a bound isn't comparable with the bounds already indexed.
+
+        """
+        if low is not None:
+            self._insert_point(low)
+
+        if high is not None:
+            try:
+                self._insert_point(high)
+            except TypeError:
+                if low is not None:
+                    self._remove_point(low)
+                raise
+
+        segments = self._segments
+        for position in self._span(low, high):
+            segments[position].add(member)
+
+        self.ranges[member] = (low, high)
+
+    def remove_range(self, member: K) -> None:
+        """Remove member range from the index."""
+        low, high = self.ranges.pop(member)
+
+        segments = self._segments
+        for position in self._span(low, high):
+            segments[position].discard(member)
+
+        # Remove greatest bound first, so the position of the other is unchanged
+        for bound in (high, low):
+            if bound is not None:
+                self._remove_point(bound)
+
+    def match(self, field_value: T.Any, matched: T.Set[K]) -> None:
+        equal = self.equal
+        if equal:
+            try:
+                members = equal.get(field_value)
+            except TypeError:
+                # Unhashable
+                members = None
+
+            if members:
+                matched.update(members)
+
+        if self.ranges:
+            try:
+                position = bisect_right(self._points, field_value)
+            except TypeError:
+                # Not comparable with range bounds
+                return
+
+            matched.update(self._segments[position])
+
+
+def _equal_values(anchor: Atom) -> T.Iterable[T.Hashable]:
+    if isinstance(anchor, Eq):
+        return (anchor.value,)
+
+    assert isinstance(anchor, In)
+    return anchor.values
+
+
+class PredicateIndex(T.Generic[K]):
+    """Index members by declarative predicate, to find the ones matching a value in sublinear time.
+
+    Each member is indexed by one condition of its predicate, preferring equality over ranges, so
+    selected members are only known to possibly match and must still check the whole predicate.
+    Members without a predicate are always selected.
+    """
+
+    __slots__ = ("_fields", "_anchors", "_unindexed")
+
+    def __init__(self) -> None:
+        # Internal
+        self._fields: T.Dict[T.Any, _FieldIndex[K]] = {}
+        self._anchors: T.Dict[K, Atom] = {}
+        self._unindexed: T.Set[K] = set()
+
+    @property
+    def indexed(self) -> int:
+        """Number of members indexed by predicate."""
+        return len(self._anchors)
+
+    def add(self, member: K, predicate: T.Optional[Predicate] = None) -> None:
+        """Add member to the index, replacing any previous entry for it.
+
+        Arguments:
+            member: Member to be indexed.
+            predicate: Declarative predicate that values must match to select member.
+
+        """
+        self.remove(member)
+
+        atoms = () if predicate is None else predicate.atoms
+        anchor: T.Optional[Atom] = next(
+            (atom for atom in atoms if isinstance(atom, (Eq, In))), None
+        )
+        if anchor is None:
+            anchor = next((atom for atom in atoms if isinstance(atom, Range)), None)
+
+        if anchor is None:
+            self._unindexed.add(member)
+            return
+
+        field_index = self._fields.get(anchor.field)
+        if field_index is None:
+            field_index = self._fields[anchor.field] = _FieldIndex(anchor.getter)
+
+        if isinstance(anchor, Range):
+            try:
+                field_index.add_range(member, anchor.low, anchor.high)
+            except TypeError:
+                if not field_index:
+                    del self._fields[anchor.field]
+                raise
+        else:
+            for value in _equal_values(anchor):
+                field_index.equal.setdefault(value, set()).add(member)
+
+        self._anchors[member] = anchor
+
+    def remove(self, member: K) -> None:
+        """Remove member from the index, if present."""
+        self._unindexed.discard(member)
+
+        anchor = self._anchors.pop(member, None)
+        if anchor is None:
+            return
+
+        field_index = self._fields[anchor.field]
+        if isinstance(anchor, Range):
+            field_index.remove_range(member)
+        else:
+            for value in _equal_values(anchor):
+                members = field_index.equal[value]
+                members.discard(member)
+                if not members:
+                    del field_index.equal[value]
+
+        if not field_index:
+            del self._fields[anchor.field]
+
+    def select(self, value: T.Any) -> T.Set[K]:
+        """Select the members whose predicate may match value.
+
+        Arguments:
+            value: Value to be matched.
+
+        Returns:
+            Members that may match value.
+
+        """
+        selected = set(self._unindexed)
+        for field_index in self._fields.values():
+            try:
+                field_value = field_index.getter(value)
+            except FIELD_ERRORS:
+                continue
+
+            field_index.match(field_value, selected)
+
+        return selected
+
+
+__all__ = ("PredicateIndex",)
@@ -0,0 +1,205 @@
+"""SegmentLog
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import os
+import typing as T
+from mmap import ACCESS_READ, mmap
+from array import array
+from bisect import bisect_right
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+
+# Default size, in bytes, after which a new segment is started
+DEFAULT_SEGMENT_SIZE: T.Final = 64 * 1024 * 1024
+
+# Default amount of records retrieved by each read
+DEFAULT_READ_BATCH: T.Final = 256
+
+_LOG_SUFFIX = ".log"
+_INDEX_SUFFIX = ".index"
+
+
+class _Segment:
+    """Part of the log, holding the records from base offset onwards.
+
+    Records are stored back to back in the log file, while the index file holds the end position
+    of each record, so record i spans from the end of record i - 1 to ends[i]. Records are always
+    written before their index entry, so a record whose write was interrupted is discarded when
+    the segment is opened.
+    """
+
+    __slots__ = ("map", "base", "ends", "path", "log_file", "index_file")
+
+    def __init__(self, directory: str, base: int) -> None:
+        self.map: T.Optional[mmap] = None
+        self.base = base
+        self.ends = array("Q")
+        self.path = os.path.join(directory, f"{base:020d}")
+        self.log_file: T.Optional[T.BinaryIO] = None
+        self.index_file: T.Optional[T.BinaryIO] = None
+
+        index_path = self.path + _INDEX_SUFFIX
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as index_file:
+                data = index_file.read()
+
+            # Ignore an incomplete index entry
+            self.ends.frombytes(data[: len(data) - len(data) % self.ends.itemsize])
+
+    @property
+    def size(self) -> int:
+        return self.ends[-1] if self.ends else 0
+
+    @property
+    def next_offset(self) -> int:
+        return self.base + len(self.ends)
+
+    def open(self) -> None:
+        """Open segment for appending records."""
+        size = self.size
+        self.log_file = T.cast(T.BinaryIO, open(self.path + _LOG_SUFFIX, "ab", buffering=0))
+        self.log_file.truncate(size)
+        self.index_file = T.cast(T.BinaryIO, open(self.path + _INDEX_SUFFIX, "ab", buffering=0))
+        self.index_file.truncate(len(self.ends) * self.ends.itemsize)
+
+    def append(self, payload: bytes) -> None:
+        assert self.log_file is not None and self.index_file is not None
+
+        self.log_file.write(payload)
+        self.ends.append(self.size + len(payload))
+        self.index_file.write(self.ends[-1:].tobytes())
+
+    def read(self, offset: int, count: int) -> T.List[T.Any]:
+        """Unpickle count records, from offset, directly from the mapped log file."""
+        index = offset - self.base
+        stop = min(index + count, len(self.ends))
+        if index >= stop:
+            return []
+
+        size = self.ends[stop - 1]
+        if self.map is None or len(self.map) < size:
+            # The active segment grew since it was mapped
+            self.release()
+            with open(self.path + _LOG_SUFFIX, "rb") as log_file:
+                self.map = mmap(log_file.fileno(), self.size, access=ACCESS_READ)
+
+        ends = self.ends
+        start = ends[index - 1] if index else 0
+        with memoryview(self.map) as view:
+            records = []
+            for end in ends[index:stop]:
+                records.append(loads(view[start:end]))
+                start = end
+
+        return records
+
+    def release(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    def close(self) -> None:
+        self.release()
+
+        for file in (self.log_file, self.index_file):
+            if file is not None:
+                file.close()
+
+        self.log_file = self.index_file = None
+
+
+class SegmentLog:
+    """Append only log of pickled records, split into segments of memory mapped files.
+
+    Each record is identified by its offset, the amount of records appended before it. A new
+    segment is started when the active one exceeds segment_size, and segments are named after the
+    offset of their first record, so any offset is located by a binary search on the segment
+    bases plus a lookup in the segment index. Existing segments in directory are resumed.
+    """
+
+    __slots__ = ("_bases", "_segments", "_directory", "_segment_size")
+
+    def __init__(self, directory: str, segment_size: int = DEFAULT_SEGMENT_SIZE) -> None:
+        """SegmentLog constructor.
+
+        Arguments:
+            directory: Directory holding the segment files, created if missing.
+            segment_size: Size, in bytes, after which a new segment is started.
+
+        """
+        if segment_size < 1:
+            raise ValueError("SegmentLog segment_size must be positive")
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory = directory
+        self._segment_size = segment_size
+
+        bases = sorted(
+            int(name[: -len(_LOG_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(_LOG_SUFFIX) and name[: -len(_LOG_SUFFIX)].isdigit()
+        )
+
+        self._segments = [_Segment(directory, base) for base in bases] or [_Segment(directory, 0)]
+        self._segments[-1].open()
+        self._bases = [segment.base for segment in self._segments]
+
+    @property
+    def first_offset(self) -> int:
+        """Offset of the oldest record held."""
+        return self._bases[0]
+
+    @property
+    def next_offset(self) -> int:
+        """Offset the next record appended will have."""
+        return self._segments[-1].next_offset
+
+    def append(self, record: T.Any) -> int:
+        """Pickle record to the end of the log.
+
+        Returns:
+            Offset of record.
+
+        """
+        active = self._segments[-1]
+        if active.size >= self._segment_size:
+            active.close()
+            active = _Segment(self._directory, active.next_offset)
+            active.open()
+            self._segments.append(active)
+            self._bases.append(active.base)
+
+        offset = active.next_offset
+        active.append(dumps(record, protocol=HIGHEST_PROTOCOL))
+        return offset
+
+    def read(self, offset: int, count: int = DEFAULT_READ_BATCH) -> T.List[T.Any]:
+        """Retrieve up to count records, in order, starting at offset.
+
+        Records are only read from a single segment, so less than count records may be returned
+        even when more are available.
+
+        Raises:
+            IndexError: If offset precedes the oldest record held.
+
+        Returns:
+            Records retrieved, empty if there is no record at offset.
+
+        """
+        if offset < self.first_offset:
+            raise IndexError(f"SegmentLog offset {offset} precedes the oldest record")
+
+        segment = self._segments[bisect_right(self._bases, offset) - 1]
+        return segment.read(offset, count)
+
+    def close(self) -> None:
+        for segment in self._segments:
+            segment.close()
+
+
+__all__ = ("SegmentLog", "DEFAULT_READ_BATCH", "DEFAULT_SEGMENT_SIZE")
@@ -0,0 +1,56 @@
+"""Subscription
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+
+# Project
+from ...operations import observe
+
+if T.TYPE_CHECKING:
+    # Project
+    from ...protocols import ObserverProtocol, ObservableProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class Subscription(observe[K]):
+    """Observation that registers its observer along with subscription options.
+
+    Options are given as keyword arguments to the observable :meth:`__observe__`, so nothing is
+    kept by the observable for observations that are never awaited or entered.
+    """
+
+    __slots__ = ("_options",)
+
+    def __init__(
+        self,
+        observable: "ObservableProtocol[K]",
+        observer: "ObserverProtocol[K]",
+        **options: T.Any,
+    ) -> None:
+        """Subscription constructor.
+
+        Arguments:
+            observable: Observable to be observed.
+            observer: Observer to be registered.
+            options: Keyword parameters for the observable __observe__.
+
+        """
+        super().__init__(observable, observer)
+
+        # Internal
+        self._options = options
+
+    def _register(self) -> T.Awaitable[None]:
+        observable: T.Any = self._observable
+        return T.cast(T.Awaitable[None], observable.__observe__(self._observer, **self._options))
+
+
+__all__ = ("Subscription",)
@@ -0,0 +1,149 @@
+"""LogStream
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import Task, current_task, get_running_loop
+
+# External
+from async_tools import wait_with_care
+
+# Project
+from ..errors import ObserverClosedError
+from ..namespace import Namespace
+from ..operations import observe
+from .multi_stream import MultiStream
+from ._internal.segment_log import DEFAULT_READ_BATCH, DEFAULT_SEGMENT_SIZE, SegmentLog
+from ._internal.subscription import Subscription
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..protocols import ObserverProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class LogStream(MultiStream[K]):
+    """Hot stream that persists all data it receives to a log, so it can later be replayed.
+
+    Data is pickled to a segmented, memory mapped log in directory, and identified by its offset.
+    Observers subscribed through :meth:`subscribe` from an offset first receive the logged data,
+    read directly from the mapped segments, and are only then switched to live data, without
+    missing or repeating anything. Observers observing the stream directly only receive live data.
+    Logs left in directory, by a previous process, are resumed.
+    """
+
+    __slots__ = ("_log", "_replays", "_namespace")
+
+    def __init__(
+        self, directory: str, *, segment_size: int = DEFAULT_SEGMENT_SIZE, **kwargs: T.Any
+    ) -> None:
+        """LogStream constructor.
+
+        Arguments:
+            directory: Directory holding the log segments.
+            segment_size: Size, in bytes, after which a new log segment is started.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        # Internal
+        self._log = SegmentLog(directory, segment_size)
+        self._replays: T.Dict["ObserverProtocol[K]", "Task[None]"] = {}
+        self._namespace = Namespace(self, "_replay")
+
+    @property
+    def offset(self) -> int:
+        """Offset the next data received will have."""
+        return self._log.next_offset
+
+    @property
+    def first_offset(self) -> int:
+        """Offset of the oldest data logged."""
+        return self._log.first_offset
+
+    def subscribe(self, observer: "ObserverProtocol[K]", offset: int = 0) -> observe[K]:
+        """Create the observation of this stream by observer, starting from offset.
+
+        Arguments:
+            observer: Observer to be registered.
+            offset: Offset of the first data observer will receive, offsets before the oldest
+                data logged start from it.
+
+        Returns:
+            Observation, that must be awaited or entered to take effect.
+
+        """
+        return Subscription(self, observer, offset=offset)
+
+    async def _replay(self, observer: "ObserverProtocol[K]", offset: int) -> None:
+        log = self._log
+        loop = get_running_loop()
+
+        try:
+            while not observer.closed:
+                values = log.read(offset, DEFAULT_READ_BATCH)
+                if not values:
+                    # Caught up, nothing is logged until this is registered to live data
+                    await super().__observe__(observer)
+                    break
+
+                for value in values:
+                    offset += 1
+                    await observer.asend(value, self._namespace)
+        except ObserverClosedError:
+            # Same as MultiStream, observer closure is handled lazily
+            pass
+        except Exception as exc:
+            loop.call_exception_handler(
+                {
+                    "message": f"{self}: Unhandled exception while attempting to replay data",
+                    "exception": exc,
+                }
+            )
+        finally:
+            self._replays.pop(observer, None)
+
+        if observer.closed:
+            self._schedule_clearing(loop)
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        self._log.append(value)
+        await super()._asend(value, namespace)
+
+    async def _aclose(self) -> None:
+        # Let replays catch up, as nothing else will be logged
+        await wait_with_care(*self._replays.values())
+
+        await super()._aclose()
+
+        self._log.close()
+
+    async def __observe__(
+        self, observer: "ObserverProtocol[K]", offset: T.Optional[int] = None
+    ) -> None:
+        if offset is None or offset >= self._log.next_offset or observer in self._observers:
+            await super().__observe__(observer)
+            return
+
+        if observer not in self._replays:
+            self._replays[observer] = get_running_loop().create_task(
+                self._replay(observer, max(offset, self._log.first_offset))
+            )
+
+    async def __dispose__(self, observer: "ObserverProtocol[K]") -> None:
+        await super().__dispose__(observer)
+
+        replay = self._replays.pop(observer, None)
+        if replay is not None and replay is not current_task():
+            replay.cancel()
+
+
+__all__ = ("LogStream",)
@@ -17,7 +17,9 @@ from async_tools import wait_with_care
 from ..errors import ObserverClosedError
 from ..observers import Observer
 from ..operations import observe
+from ..predicates import Predicate
 from ..observables import Observable
+from ._internal.predicate_index import PredicateIndex
 
 if T.TYPE_CHECKING:
     # Project
@@ -37,8 +39,13 @@ class MultiStream(Observer[K], Observable[K]):
         The AsyncMultiStream is hot in the sense that it will drop events if there are currently no
         observers running, and all redirection only enqueue the observers action, not waiting for
         it's execution.
+
+    Filters with a declarative predicate (see :mod:`aRx.predicates`) observing the stream are
+    indexed, so each value is only delivered to the ones whose predicate may match it.
     """
 
+    __slots__ = ("_index", "_observers", "_disposables")
+
     def __init__(self, **kwargs: T.Any) -> None:
         """MultiStream constructor.
 
@@ -49,6 +56,7 @@ class MultiStream(Observer[K], Observable[K]):
         super().__init__(**kwargs)
 
         # Internal
+        self._index: T.Optional[PredicateIndex["ObserverProtocol[K]"]] = None
         self._observers: T.Set["ObserverProtocol[K]"] = set()
         self._disposables: T.Optional[T.Awaitable[T.Any]] = None
 
@@ -58,26 +66,58 @@ class MultiStream(Observer[K], Observable[K]):
         )
         self._disposables = None
 
-    def _process_done(self, loop: AbstractEventLoop, done: T.Set["Future[T.Any]"]) -> None:
+    def _process_done(self, loop: AbstractEventLoop, done: T.AbstractSet["Future[T.Any]"]) -> None:
         for fut in done:
             exc = fut.exception()
             # Ignore ObserverClosedError in multi-stream as it's occurrence is natural due to the
             # lazy way observers closure is handled
             if isinstance(exc, Exception) and not isinstance(exc, ObserverClosedError):
-                loop.call_exception_handler(
-                    {
-                        "future": fut,
-                        "message": (
-                            f"{self}: Unhandled exception while attempting to propagate data "
-                            "through observers"
-                        ),
-                        "exception": exc,
-                    }
-                )
+                self._report(loop, exc, future=fut)
             elif exc is not None:
                 # BaseException
                 raise exc
 
+        self._schedule_clearing(loop)
+
+    async def _propagate(
+        self,
+        loop: AbstractEventLoop,
+        observer: "ObserverProtocol[K]",
+        is_error: bool,
+        value: T.Any,
+        namespace: "Namespace",
+    ) -> None:
+        """Propagate data, or an exception, to a single observer, without creating a task.
+
+        Errors are handled the same way as by :meth:`_process_done`.
+        """
+        try:
+            if is_error:
+                await observer.athrow(value, namespace)
+            else:
+                await observer.asend(value, namespace)
+        except ObserverClosedError:
+            # Observer closure is handled lazily
+            pass
+        except Exception as exc:
+            self._report(loop, exc)
+
+        if observer.closed:
+            self._schedule_clearing(loop)
+
+    def _report(self, loop: AbstractEventLoop, exc: Exception, **context: T.Any) -> None:
+        loop.call_exception_handler(
+            {
+                **context,
+                "message": (
+                    f"{self}: Unhandled exception while attempting to propagate data "
+                    "through observers"
+                ),
+                "exception": exc,
+            }
+        )
+
+    def _schedule_clearing(self, loop: AbstractEventLoop) -> None:
         if not self._disposables:
             # Enqueue clearing
             self._disposables = loop.create_task(self._clear_closed_observers())
@@ -86,41 +126,47 @@ class MultiStream(Observer[K], Observable[K]):
         if not self._observers:
             return
 
+        observers = self._observers if self._index is None else self._index.select(value)
+        if not observers:
+            return
+
         loop = get_running_loop()
 
-        awaitable = wait(
-            tuple(
-                loop.create_task(obv.asend(value, namespace))
-                for obv in self._observers
-                if not obv.closed
-            ),
-            return_when=ALL_COMPLETED,
+        tasks = tuple(
+            loop.create_task(obv.asend(value, namespace)) for obv in observers if not obv.closed
         )
 
         # Remove reference early to avoid keeping large objects in memory
         del value
 
-        done, pending = await awaitable
+        if not tasks:
+            # All observers closed, they are cleared lazily
+            self._schedule_clearing(loop)
+            return
+
+        done, pending = await wait(tasks, return_when=ALL_COMPLETED)
 
         assert not pending
 
-        self._process_done(get_running_loop(), done)
+        self._process_done(loop, done)
 
     async def _athrow(self, main_exc: Exception, namespace: "Namespace") -> bool:
-        if self._observers:
-            loop = get_running_loop()
-            done, pending = await wait(
-                tuple(
-                    loop.create_task(obv.athrow(main_exc, namespace))
-                    for obv in self._observers
-                    if not obv.closed
-                ),
-                return_when=ALL_COMPLETED,
-            )
+        loop = get_running_loop()
+        tasks = tuple(
+            loop.create_task(obv.athrow(main_exc, namespace))
+            for obv in self._observers
+            if not obv.closed
+        )
+
+        if tasks:
+            done, pending = await wait(tasks, return_when=ALL_COMPLETED)
 
             assert not pending
 
-            self._process_done(get_running_loop(), done)
+            self._process_done(loop, done)
+        elif self._observers:
+            # All observers closed, they are cleared lazily
+            self._schedule_clearing(loop)
 
         # A MultiStream never closes on athrow
         return False
@@ -132,6 +178,20 @@ class MultiStream(Observer[K], Observable[K]):
         await wait_with_care(*(observe(self, observer).dispose() for observer in self._observers))
 
     async def __observe__(self, observer: "ObserverProtocol[K]") -> None:
+        predicate = getattr(observer, "predicate", None)
+        if not isinstance(predicate, Predicate):
+            predicate = None
+
+        index = self._index
+        if index is None and predicate is not None:
+            # Start indexing, with all current observers always selected
+            index = self._index = PredicateIndex()
+            for obv in self._observers:
+                index.add(obv)
+
+        if index is not None:
+            index.add(observer, predicate)
+
         # Add observers to internal observation set
         self._observers.add(observer)
 
@@ -139,5 +199,12 @@ class MultiStream(Observer[K], Observable[K]):
         with suppress(KeyError):
             self._observers.remove(observer)
 
+        index = self._index
+        if index is not None:
+            index.remove(observer)
+            if not index.indexed:
+                # No predicate left, stop indexing
+                self._index = None
+
 
 __all__ = ("MultiStream",)
@@ -0,0 +1,269 @@
+"""PriorityMultiStream
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import typing as T
+from asyncio import ALL_COMPLETED, Task, Future, wait, get_running_loop
+from collections import deque
+
+# External
+from async_tools import wait_with_care
+
+# Project
+from ..operations import observe
+from .multi_stream import MultiStream
+from ._internal.subscription import Subscription
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+    from ..protocols import ObserverProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+
+class _Subscriber(T.Generic[K]):
+    __slots__ = ("queue", "values", "worker", "wakeup", "closing", "observer", "priority")
+
+    def __init__(self, observer: "ObserverProtocol[K]", priority: int) -> None:
+        self.queue: T.Deque[T.Tuple[bool, T.Any, "Namespace"]] = deque()
+        # Number of values, as opposed to errors, in queue
+        self.values = 0
+        self.worker: T.Optional["Task[None]"] = None
+        self.wakeup: T.Optional["Future[None]"] = None
+        self.closing = False
+        self.observer = observer
+        self.priority = priority
+
+    def notify(self) -> None:
+        wakeup = self.wakeup
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+
+    def shed(self) -> None:
+        """Drop the oldest value in queue, errors are never dropped."""
+        queue = self.queue
+        for index, (is_error, _, _) in enumerate(queue):
+            if not is_error:
+                del queue[index]
+                self.values -= 1
+                return
+
+
+class PriorityMultiStream(MultiStream[K]):
+    """Hot stream that delivers data to its observers in order of priority.
+
+    Observers are registered with a priority through :meth:`subscribe`, or priority 0 when
+    observing the stream directly. Observers of the same priority are served concurrently, and
+    each priority is only served once all higher priorities were.
+
+    In bounded mode, when maxsize is given, each observer has a queue served by its own task, so
+    sending data doesn't wait for observers to handle it. When maxsize values are queued in total,
+    the oldest value queued to the lowest priority observers is shed to make room.
+    """
+
+    __slots__ = ("_shed", "_tiers", "_queued", "_maxsize", "_subscribers")
+
+    def __init__(self, *, maxsize: T.Optional[int] = None, **kwargs: T.Any) -> None:
+        """PriorityMultiStream constructor.
+
+        Arguments:
+            maxsize: Maximum number of values queued for all observers, enables bounded mode.
+            kwargs: Keyword parameters for super.
+
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("PriorityMultiStream maxsize must be positive")
+
+        super().__init__(**kwargs)
+
+        # Internal
+        self._shed = 0
+        self._tiers: T.Optional[T.List[T.List[_Subscriber[K]]]] = None
+        self._queued = 0
+        self._maxsize = maxsize
+        self._subscribers: T.Dict["ObserverProtocol[K]", _Subscriber[K]] = {}
+
+    @property
+    def shed(self) -> int:
+        """Number of values dropped in bounded mode to make room for new ones."""
+        return self._shed
+
+    def subscribe(self, observer: "ObserverProtocol[K]", priority: int = 0) -> observe[K]:
+        """Create the observation of this stream by observer, with the given priority.
+
+        Arguments:
+            observer: Observer to be registered.
+            priority: Priority of observer, greater values are served first.
+
+        Returns:
+            Observation, that must be awaited or entered to take effect.
+
+        """
+        return Subscription(self, observer, priority=priority)
+
+    def _sorted_tiers(self) -> T.List[T.List[_Subscriber[K]]]:
+        tiers = self._tiers
+        if tiers is None:
+            grouped: T.Dict[int, T.List[_Subscriber[K]]] = {}
+            for subscriber in self._subscribers.values():
+                grouped.setdefault(subscriber.priority, []).append(subscriber)
+
+            tiers = self._tiers = [grouped[priority] for priority in sorted(grouped, reverse=True)]
+
+        return tiers
+
+    def _enqueue(
+        self, subscriber: _Subscriber[K], is_error: bool, value: T.Any, namespace: "Namespace"
+    ) -> None:
+        if not is_error:
+            assert self._maxsize is not None
+
+            if self._queued >= self._maxsize:
+                self._shed += 1
+
+                victim = self._shed_candidate(subscriber.priority)
+                if victim is None:
+                    # Every queued value has higher priority than the new one
+                    return
+
+                victim.shed()
+                self._queued -= 1
+
+            subscriber.values += 1
+            self._queued += 1
+
+        subscriber.queue.append((is_error, value, namespace))
+        subscriber.notify()
+
+    def _shed_candidate(self, priority: int) -> T.Optional[_Subscriber[K]]:
+        for tier in reversed(self._sorted_tiers()):
+            if tier[0].priority > priority:
+                break
+
+            for subscriber in tier:
+                if subscriber.values:
+                    return subscriber
+
+        return None
+
+    async def _deliver(self, subscriber: _Subscriber[K]) -> None:
+        loop = get_running_loop()
+        queue = subscriber.queue
+        observer = subscriber.observer
+
+        while not observer.closed:
+            if not queue:
+                if subscriber.closing:
+                    break
+
+                subscriber.wakeup = loop.create_future()
+                await subscriber.wakeup
+                continue
+
+            is_error, value, namespace = queue.popleft()
+            if not is_error:
+                subscriber.values -= 1
+                self._queued -= 1
+
+            await self._propagate(loop, observer, is_error, value, namespace)
+
+        # Release whatever is left, as no one will consume it
+        self._queued -= subscriber.values
+        subscriber.values = 0
+        queue.clear()
+
+        if observer.closed:
+            self._schedule_clearing(loop)
+
+    async def _dispatch(self, is_error: bool, value: T.Any, namespace: "Namespace") -> None:
+        if self._maxsize is not None:
+            for tier in self._sorted_tiers():
+                for subscriber in tier:
+                    if not subscriber.observer.closed:
+                        self._enqueue(subscriber, is_error, value, namespace)
+
+            return
+
+        loop = get_running_loop()
+        for tier in self._sorted_tiers():
+            tasks = tuple(
+                loop.create_task(
+                    subscriber.observer.athrow(value, namespace)
+                    if is_error
+                    else subscriber.observer.asend(value, namespace)
+                )
+                for subscriber in tier
+                if not subscriber.observer.closed
+            )
+
+            if tasks:
+                done, pending = await wait(tasks, return_when=ALL_COMPLETED)
+
+                assert not pending
+
+                self._process_done(loop, done)
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        await self._dispatch(False, value, namespace)
+
+    async def _athrow(self, main_exc: Exception, namespace: "Namespace") -> bool:
+        await self._dispatch(True, main_exc, namespace)
+
+        # A MultiStream never closes on athrow
+        return False
+
+    async def _aclose(self) -> None:
+        # Let workers finish delivering what was queued
+        workers = []
+        for subscriber in self._subscribers.values():
+            if subscriber.worker is not None:
+                subscriber.closing = True
+                subscriber.notify()
+                workers.append(subscriber.worker)
+
+        await wait_with_care(*workers)
+
+        await super()._aclose()
+
+    async def __observe__(self, observer: "ObserverProtocol[K]", priority: int = 0) -> None:
+        await super().__observe__(observer)
+
+        subscriber = self._subscribers.get(observer)
+        if subscriber is not None:
+            if subscriber.priority != priority:
+                subscriber.priority = priority
+                self._tiers = None
+
+            return
+
+        subscriber = self._subscribers[observer] = _Subscriber(observer, priority)
+        self._tiers = None
+
+        if self._maxsize is not None:
+            subscriber.worker = get_running_loop().create_task(self._deliver(subscriber))
+
+    async def __dispose__(self, observer: "ObserverProtocol[K]") -> None:
+        await super().__dispose__(observer)
+
+        subscriber = self._subscribers.pop(observer, None)
+        if subscriber is None:
+            return
+
+        self._tiers = None
+
+        worker = subscriber.worker
+        if worker is not None and not worker.done():
+            worker.cancel()
+            self._queued -= subscriber.values
+            subscriber.values = 0
+            subscriber.queue.clear()
+
+
+__all__ = ("PriorityMultiStream",)
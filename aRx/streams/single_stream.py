@@ -9,6 +9,7 @@ file, You can obtain one at https://mozilla.org/MPL/2.0/.
 # Internal
 import typing as T
 from asyncio import Future, get_running_loop
+from collections import deque
 
 # External
 from async_tools.abstract import AsyncABCMeta
@@ -29,6 +30,8 @@ if T.TYPE_CHECKING:
 K = T.TypeVar("K")
 L = T.TypeVar("L")
 
+DEFAULT_BACKLOG_SIZE: T.Final = 64
+
 
 class SingleStreamBase(Observable[K], Observer[L], metaclass=AsyncABCMeta):
     """Cold streams tightly coupled with a single observers.
@@ -38,70 +41,141 @@ class SingleStreamBase(Observable[K], Observer[L], metaclass=AsyncABCMeta):
         The SingleStream is cold in the sense that it is tightly connected to it's only observers.
         So that it will await until it is observed before redirecting any event, and all redirection
         wait for the observers action to execute.
+
+        Events received before the observer is attached are kept in a bounded backlog, delivered
+        in order on observation. Once the backlog is full, further events wait for the observer,
+        and so does closing while the backlog isn't empty.
     """
 
-    __slots__ = ("__lock", "_observer")
+    __slots__ = ("_observer", "_backlog", "_subscribed", "_subscription", "_backlog_size")
 
-    def __init__(self, **kwargs: T.Any) -> None:
+    def __init__(self, *, backlog_size: int = DEFAULT_BACKLOG_SIZE, **kwargs: T.Any) -> None:
         """SingleStream constructor.
 
         Arguments:
+            backlog_size: Maximum number of events kept while there is no observer.
             kwargs: Super classes named parameters.
 
         """
         super().__init__(**kwargs)
 
         # Internal
-        self.__lock: T.Optional["Future[None]"] = None
         self._observer: T.Optional["ObserverProtocol[K]"] = None
+        self._backlog: T.Optional[T.Deque[T.Tuple[bool, T.Any, "Namespace"]]] = None
+        self._subscribed = False
+        self._subscription: T.Optional["Future[None]"] = None
+        self._backlog_size = backlog_size
 
-    @property
-    def _lock(self) -> "Future[None]":
-        if self.__lock is None:
-            self.__lock = get_running_loop().create_future()
+    async def _wait_observer(
+        self, is_error: bool, value: T.Any, namespace: "Namespace"
+    ) -> T.Optional["ObserverProtocol[K]"]:
+        """Slow path for events received before an observer is attached.
 
-        return self.__lock
+        Returns:
+            Observer to which the event must be redirected, None if the event was kept in backlog.
 
-    async def _asend(self, value: L, namespace: "Namespace") -> None:
+        """
+        backlog = self._backlog
+        if backlog is None:
+            backlog = self._backlog = deque()
+
+        if len(backlog) < self._backlog_size:
+            backlog.append((is_error, value, namespace))
+            return None
+
+        if self._subscription is None:
+            self._subscription = get_running_loop().create_future()
+
+        await self._subscription
+
+        return self._observer
+
+    async def _redirect_pending(self, value: K, namespace: "Namespace") -> None:
+        if self._subscribed:
+            # Observer was already disposed, so there is no one to receive this value
+            return
+
+        observer = await self._wait_observer(False, value, namespace)
+        if observer is not None:
+            await observer.asend(value, namespace)
+
+    def _redirect(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        """Redirect value to the observer, synchronously whenever possible.
+
+        Returns:
+            None if the observer handled the value, otherwise an awaitable that resolves when the
+            observer finishes handling it.
+
+        """
+        observer = self._observer
+        if observer is None:
+            return self._redirect_pending(value, namespace)
 
-        # Wait for observers
-        await self._lock
+        if isinstance(observer, Observer):
+            return observer.send(value, namespace)
 
-        # _observer must be available at this point
-        assert self._observer
+        return observer.asend(value, namespace)
 
-        awaitable = self._observer.asend(await self._asend_impl(value), namespace)
+    async def _aredirect(self, value: K, namespace: "Namespace") -> None:
+        """Redirect value to the observer and wait for it to be handled."""
+        awaitable = self._redirect(value, namespace)
 
         # Remove reference early to avoid keeping large objects in memory
         del value
 
-        await awaitable
+        if awaitable is not None:
+            await awaitable
+
+    async def _aredirect_awaited(self, awaitable: T.Awaitable[K], namespace: "Namespace") -> None:
+        """Redirect the result of awaitable to the observer and wait for it to be handled."""
+        await self._aredirect(await awaitable, namespace)
+
+    def _send(self, value: L, namespace: "Namespace") -> T.Optional[T.Awaitable[None]]:
+        return self._aredirect_awaited(self._asend_impl(value), namespace)
+
+    async def _asend(self, value: L, namespace: "Namespace") -> None:
+        awaitable = self._send(value, namespace)
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        if awaitable is not None:
+            await awaitable
 
     async def _asend_impl(self, value: L) -> K:
         raise NotImplementedError
 
     async def _athrow(self, exc: Exception, namespace: "Namespace") -> bool:
+        observer = self._observer
+        if observer is None:
+            if self._subscribed:
+                # Observer was already disposed, close stream
+                return True
 
-        # Wait for observers
-        await self._lock
-
-        # _observer must be available at this point
-        assert self._observer
+            observer = await self._wait_observer(True, exc, namespace)
+            if observer is None:
+                return False
 
-        if self._observer.closed:
+        if observer.closed:
             # close stream
             return True
 
-        await self._observer.athrow(exc, namespace)
+        await observer.athrow(exc, namespace)
 
         # SingleStream doesn't close on raise
         return False
 
     async def _aclose(self) -> None:
+        if self._backlog and not self._subscribed:
+            # Events kept in backlog were already acknowledged, wait for an observer to get them
+            if self._subscription is None:
+                self._subscription = get_running_loop().create_future()
+
+            await self._subscription
 
         # Cancel all awaiting event in the case we weren't subscribed
-        if not self._lock.done():
-            self._lock.set_exception(ObserverClosedError(self))
+        if self._subscription is not None and not self._subscription.done():
+            self._subscription.set_exception(ObserverClosedError(self))
 
         if self._observer:
             # Dispose observer
@@ -120,11 +194,28 @@ class SingleStreamBase(Observable[K], Observer[L], metaclass=AsyncABCMeta):
 
             raise SingleStreamError("Can't assign multiple observers to a SingleStream")
 
+        if self._subscribed:
+            raise SingleStreamError("Can't reassign observer to a SingleStream")
+
+        # Deliver events received until now, any event arriving meanwhile joins the backlog
+        backlog = self._backlog
+        while backlog:
+            is_error, value, namespace = backlog.popleft()
+            if observer.closed:
+                break
+            elif is_error:
+                await observer.athrow(value, namespace)
+            else:
+                await observer.asend(value, namespace)
+
         # Set streams observers
+        self._backlog = None
         self._observer = observer
+        self._subscribed = True
 
         # Release any awaiting event
-        self._lock.set_result(None)
+        if self._subscription is not None:
+            self._subscription.set_result(None)
 
     async def __dispose__(self, observer: "ObserverProtocol[K]") -> None:
         if observer is not self._observer:
@@ -135,6 +226,11 @@ class SingleStreamBase(Observable[K], Observer[L], metaclass=AsyncABCMeta):
 
 
 class SingleStream(SingleStreamBase[K, K]):
+    __slots__ = ()
+
+    def _send(self, value: K, namespace: "Namespace") -> T.Optional[T.Awaitable[T.Any]]:
+        return self._redirect(value, namespace)
+
     async def _asend_impl(self, value: K) -> K:
         return value
 
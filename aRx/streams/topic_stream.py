@@ -0,0 +1,169 @@
+"""TopicStream
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+
+# Internal
+import re
+import typing as T
+from asyncio import ALL_COMPLETED, wait, get_running_loop
+from fnmatch import translate
+
+# Project
+from ..operations import observe
+from .multi_stream import MultiStream
+from ._internal.subscription import Subscription
+
+if T.TYPE_CHECKING:
+    # Project
+    from ..namespace import Namespace
+    from ..protocols import ObserverProtocol
+
+
+# Generic Types
+K = T.TypeVar("K")
+
+# Maximum number of keys whose resolved observers are kept
+ROUTES_CACHE_SIZE: T.Final = 4096
+
+_WILDCARDS = re.compile(r"[*?\[]")
+
+
+class TopicStream(MultiStream[K]):
+    """Hot stream that routes each value only to the observers subscribed to its key.
+
+    Observers subscribe to keys through :meth:`subscribe`. Topics that are strings containing
+    shell style wildcards (``*``, ``?``, ``[...]``) are matched as patterns against string keys,
+    any other topic must be equal to the key. Observers observing the stream directly receive all
+    values. Exceptions are always delivered to all observers.
+
+    The observers matching each key are resolved once and cached, so routing a value is a single
+    dict lookup regardless of the number of observers.
+    """
+
+    __slots__ = ("_key", "_exact", "_routes", "_topics", "_patterns", "_catch_all")
+
+    def __init__(self, key: T.Callable[[K], T.Hashable], **kwargs: T.Any) -> None:
+        """TopicStream constructor.
+
+        Arguments:
+            key: Function extracting the routing key of each value.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        # Internal
+        self._key = key
+        self._exact: T.Dict[T.Hashable, T.Set["ObserverProtocol[K]"]] = {}
+        self._routes: T.Dict[T.Hashable, T.Tuple["ObserverProtocol[K]", ...]] = {}
+        self._topics: T.Dict["ObserverProtocol[K]", T.Tuple[T.Hashable, ...]] = {}
+        self._patterns: T.List[
+            T.Tuple[T.Callable[[str], T.Optional[T.Match[str]]], "ObserverProtocol[K]"]
+        ] = []
+        self._catch_all: T.Set["ObserverProtocol[K]"] = set()
+
+    def subscribe(self, observer: "ObserverProtocol[K]", *topics: T.Hashable) -> observe[K]:
+        """Create the observation of this stream by observer, restricted to the given topics.
+
+        Arguments:
+            observer: Observer to be registered.
+            topics: Keys, or wildcard patterns, observer is interested in.
+
+        Raises:
+            ValueError: If no topic is given.
+
+        Returns:
+            Observation, that must be awaited or entered to take effect.
+
+        """
+        if not topics:
+            raise ValueError("TopicStream subscription requires at least one topic")
+
+        return Subscription(self, observer, topics=topics)
+
+    def _route(self, key: T.Hashable) -> T.Tuple["ObserverProtocol[K]", ...]:
+        route = self._routes.get(key)
+        if route is None:
+            # Use a dict, instead of a set, to keep delivery order stable
+            matched = dict.fromkeys(self._catch_all)
+            matched.update(dict.fromkeys(self._exact.get(key, ())))
+            if isinstance(key, str):
+                matched.update(
+                    dict.fromkeys(observer for match, observer in self._patterns if match(key))
+                )
+
+            if len(self._routes) >= ROUTES_CACHE_SIZE:
+                self._routes.clear()
+
+            route = self._routes[key] = tuple(matched)
+
+        return route
+
+    def _unindex(self, observer: "ObserverProtocol[K]") -> None:
+        self._catch_all.discard(observer)
+
+        for topic in self._topics.pop(observer, ()):
+            observers = self._exact.get(topic)
+            if observers is not None:
+                observers.discard(observer)
+                if not observers:
+                    del self._exact[topic]
+
+        self._patterns = [entry for entry in self._patterns if entry[1] is not observer]
+        self._routes.clear()
+
+    async def _asend(self, value: K, namespace: "Namespace") -> None:
+        observers = tuple(obv for obv in self._route(self._key(value)) if not obv.closed)
+        if not observers:
+            return
+
+        loop = get_running_loop()
+
+        if len(observers) == 1:
+            # Avoid a task when there is a single destination
+            await self._propagate(loop, observers[0], False, value, namespace)
+            return
+
+        awaitable = wait(
+            tuple(loop.create_task(obv.asend(value, namespace)) for obv in observers),
+            return_when=ALL_COMPLETED,
+        )
+
+        # Remove reference early to avoid keeping large objects in memory
+        del value
+
+        done, pending = await awaitable
+
+        assert not pending
+
+        self._process_done(loop, done)
+
+    async def __observe__(
+        self, observer: "ObserverProtocol[K]", topics: T.Optional[T.Tuple[T.Hashable, ...]] = None
+    ) -> None:
+        await super().__observe__(observer)
+
+        # Replace any previous subscription of the same observer
+        self._unindex(observer)
+
+        if topics is None:
+            self._catch_all.add(observer)
+            return
+
+        self._topics[observer] = topics
+        for topic in topics:
+            if isinstance(topic, str) and _WILDCARDS.search(topic):
+                self._patterns.append((re.compile(translate(topic)).match, observer))
+            else:
+                self._exact.setdefault(topic, set()).add(observer)
+
+    async def __dispose__(self, observer: "ObserverProtocol[K]") -> None:
+        await super().__dispose__(observer)
+
+        self._unindex(observer)
+
+
+__all__ = ("TopicStream",)
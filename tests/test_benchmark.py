@@ -0,0 +1,187 @@
+# Internal
+import gc
+import asyncio
+import unittest
+import tracemalloc
+from time import perf_counter
+from contextlib import contextmanager
+
+# External
+import asynctest
+
+from aRx.streams import SingleStream
+from aRx.observers import AnonymousObserver
+from aRx.operators import Map
+
+STAGES = 10
+ELEMENTS = 100
+PIPELINES = 1000
+# Dispatch benchmark size, runs are repeated and only the best one is kept to reduce noise
+BENCHMARK_ELEMENTS = 2000
+BENCHMARK_REPEAT = 5
+# Upper bound on the memory held by each pipeline stage, in bytes
+STAGE_MEMORY_BUDGET = 320
+
+
+def identity(value):
+    return value
+
+
+@asynctest.strict
+class TestPropagationTracking(asynctest.TestCase, unittest.TestCase):
+    async def test_propagation_counts(self):
+        stages = [Map(identity) for _ in range(STAGES)]
+        in_flight = []
+
+        def probe(value):
+            in_flight.append(tuple(stage._propagation_count for stage in stages))
+            return value
+
+        source = SingleStream()
+        pipeline = source
+        for stage in stages:
+            pipeline = pipeline | stage
+
+        async with pipeline | Map(probe) > AnonymousObserver():
+            for x in range(ELEMENTS):
+                await source.asend(x)
+
+            # Nothing is left tracked once the values went through
+            self.assertEqual([stage._propagation_count for stage in stages], [0] * STAGES)
+
+        # Every stage tracks exactly one propagation while its value is in flight downstream
+        self.assertEqual(in_flight, [(1,) * STAGES] * ELEMENTS)
+
+    async def test_failed_send_releases_propagation(self):
+        errors = []
+
+        def fail(value):
+            raise ValueError(value)
+
+        stage = Map(fail)
+        await (stage > AnonymousObserver(athrow=lambda e, _: errors.append(e)))
+
+        awaitable = stage.send(1)
+
+        # Propagation is released right away, the returned awaitable only reports the error
+        self.assertEqual(stage._propagation_count, 0)
+        await awaitable
+
+        self.assertEqual(stage._propagation_count, 0)
+        self.assertEqual([type(error) for error in errors], [ValueError])
+
+        await stage.aclose()
+
+    async def test_aclose_waits_propagation(self):
+        release = self.loop.create_future()
+
+        async def blocked(value):
+            await release
+            return value
+
+        received = []
+        stage = Map(blocked)
+        await (stage > AnonymousObserver(asend=lambda d, _: received.append(d)))
+
+        sending = self.loop.create_task(stage.asend(1))
+        await asyncio.sleep(0)
+        closing = self.loop.create_task(stage.aclose())
+        await asyncio.sleep(0)
+
+        self.assertEqual(stage._propagation_count, 1)
+        self.assertFalse(closing.done())
+
+        release.set_result(None)
+        await closing
+
+        self.assertTrue(sending.done())
+        self.assertEqual(stage._propagation_count, 0)
+        self.assertEqual(received, [1])
+
+
+class ContextManagerMap(Map):
+    """Map that also tracks propagations with a generator context manager, as Observer once did."""
+
+    __slots__ = ("_cm_count",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cm_count = 0
+
+    @contextmanager
+    def _propagating(self):
+        self._cm_count += 1
+        try:
+            yield
+        finally:
+            self._cm_count -= 1
+
+    def send(self, data, namespace=None):
+        with self._propagating():
+            return super().send(data, namespace)
+
+
+@asynctest.strict
+class TestPropagationBenchmark(asynctest.TestCase, unittest.TestCase):
+    async def run_pipe(self, map_type):
+        source = SingleStream()
+
+        pipeline = source
+        for _ in range(STAGES):
+            pipeline = pipeline | map_type(identity)
+
+        async with pipeline > AnonymousObserver():
+            start = perf_counter()
+            for x in range(BENCHMARK_ELEMENTS):
+                await source.asend(x)
+
+            return perf_counter() - start
+
+    async def test_propagation_tracking(self):
+        # Interleave runs, so both pipes are equally affected by any slowdown of the machine
+        tracked = context_managed = float("inf")
+        for _ in range(BENCHMARK_REPEAT):
+            tracked = min(tracked, await self.run_pipe(Map))
+            context_managed = min(context_managed, await self.run_pipe(ContextManagerMap))
+
+        # Only the relative cost is checked, absolute timings depend on the machine
+        self.assertLess(tracked, context_managed, (tracked, context_managed))
+
+
+class TestMemoryBenchmark(unittest.TestCase):
+    @staticmethod
+    def build_pipe():
+        pipeline = SingleStream() | Map(identity)
+        for _ in range(STAGES - 1):
+            pipeline = pipeline | Map(identity)
+
+        return pipeline > AnonymousObserver()
+
+    def test_slotted_layout(self):
+        stage = self.build_pipe()
+        while stage is not None:
+            for obj in (stage, stage._observer, stage._observable):
+                for cls in type(obj).__mro__:
+                    if cls.__module__.startswith("aRx."):
+                        self.assertIn("__slots__", vars(cls), cls)
+
+                self.assertFalse(hasattr(obj, "__dict__"), type(obj))
+
+            stage = stage._previous
+
+    def test_memory_per_stage(self):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            pipelines = [self.build_pipe() for _ in range(PIPELINES)]
+            end, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(len(pipelines), PIPELINES)
+        self.assertLess((end - start) / PIPELINES / STAGES, STAGE_MEMORY_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,24 @@
 # Internal
+import sys
 import unittest
+import subprocess
+from pathlib import Path
+
+# Maximum time, in seconds, that a bare `import aRx` may take. A lazy import takes a few
+# milliseconds, the budget is generous so loaded CI machines don't make the test flaky
+IMPORT_BUDGET = 0.5
+# Modules that are slow to import, and must not be loaded by a bare `import aRx`
+HEAVY_MODULES = ("asyncio", "async_tools", "importlib.metadata")
+
+MEASURE_IMPORT = """
+import sys
+from time import perf_counter
+
+start = perf_counter()
+import aRx
+print(perf_counter() - start)
+print(",".join(sorted(sys.modules)))
+"""
 
 
 class TestImport(unittest.TestCase):
@@ -7,6 +26,25 @@ class TestImport(unittest.TestCase):
         # External
         import aRx
 
+    def test_lazy_import(self) -> None:
+        output = subprocess.run(
+            (sys.executable, "-c", MEASURE_IMPORT),
+            cwd=Path(__file__).parent.parent,
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout.splitlines()
+
+        self.assertLess(float(output[0]), IMPORT_BUDGET)
+
+        modules = set(output[1].split(","))
+
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, modules)
+
+        # Subpackages must only be loaded on first access
+        self.assertEqual([name for name in modules if name.startswith("aRx.")], [])
+
 
 if __name__ == "__main__":
     unittest.main()
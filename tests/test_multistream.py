@@ -1,13 +1,18 @@
 # Internal
 import unittest
+from tempfile import TemporaryDirectory
 
 # External
 import asynctest
 from async_tools import expires
 
-from aRx.streams import MultiStream
-from aRx.observers import AnonymousObserver
+from aRx.streams import LogStream, MultiStream, TopicStream, PriorityMultiStream
+from aRx.observers import IteratorObserver, AnonymousObserver
 from aRx.operators import Map, Filter
+from aRx.operations import join
+from aRx.predicates import Eq, In, Range
+from aRx.observers._internal.spill_buffer import SpillBuffer
+from aRx.streams._internal.predicate_index import PredicateIndex
 
 
 def r(_):
@@ -39,3 +44,201 @@ class TestMultiStream(asynctest.TestCase, unittest.TestCase):
             await a.aclose()
 
         self.assertFalse(timeout.expired)
+
+    async def test_priority_order(self):
+        order = []
+
+        stream = PriorityMultiStream()
+        low = AnonymousObserver(asend=lambda d, _: order.append(("low", d)))
+        high = AnonymousObserver(asend=lambda d, _: order.append(("high", d)))
+
+        async with stream, stream.subscribe(low), stream.subscribe(high, 10):
+            await stream.asend(1)
+            await stream.asend(2)
+
+        self.assertEqual(order, [("high", 1), ("low", 1), ("high", 2), ("low", 2)])
+
+    async def test_priority_unused_subscription(self):
+        order = []
+
+        stream = PriorityMultiStream()
+        low = AnonymousObserver(asend=lambda d, _: order.append(("low", d)))
+        high = AnonymousObserver(asend=lambda d, _: order.append(("high", d)))
+
+        # Priority only takes effect when the subscription itself is entered
+        stream.subscribe(low, 20)
+
+        async with stream, stream > low, stream.subscribe(high, 10):
+            await stream.asend(1)
+
+        self.assertEqual(order, [("high", 1), ("low", 1)])
+
+    async def test_priority_shedding(self):
+        received = []
+
+        stream = PriorityMultiStream(maxsize=2)
+        low = AnonymousObserver(asend=lambda d, _: received.append(("low", d)))
+        high = AnonymousObserver(asend=lambda d, _: received.append(("high", d)))
+
+        async with stream.subscribe(low), stream.subscribe(high, 10):
+            # Values are only queued, delivery happens once the workers get to run
+            for x in range(3):
+                await stream.asend(x)
+
+            await stream.aclose()
+
+        self.assertEqual(received, [("high", 1), ("high", 2)])
+        self.assertEqual(stream.shed, 4)
+
+    async def test_topic_routing(self):
+        exact = []
+        pattern = []
+        everything = []
+
+        stream = TopicStream(lambda x: x[0])
+        exact_listener = AnonymousObserver(asend=lambda d, _: exact.append(d))
+        pattern_listener = AnonymousObserver(asend=lambda d, _: pattern.append(d))
+        everything_listener = AnonymousObserver(asend=lambda d, _: everything.append(d))
+
+        async with stream, stream.subscribe(exact_listener, "user.login"), stream.subscribe(
+            pattern_listener, "user.*"
+        ), stream > everything_listener:
+            await stream.asend(("user.login", 1))
+            await stream.asend(("user.logout", 2))
+            await stream.asend(("system", 3))
+
+        self.assertEqual(exact, [("user.login", 1)])
+        self.assertEqual(pattern, [("user.login", 1), ("user.logout", 2)])
+        self.assertEqual(everything, [("user.login", 1), ("user.logout", 2), ("system", 3)])
+
+    async def test_indexed_filters(self):
+        received = {"eq": [], "in": [], "range": []}
+
+        stream = MultiStream()
+        filters = {"eq": Eq("k", "a"), "in": In("k", ("b", "c")), "range": Range("v", 10, 20)}
+
+        async with stream:
+            for name, predicate in filters.items():
+                await (
+                    stream | Filter(predicate)
+                    > AnonymousObserver(asend=lambda d, _, name=name: received[name].append(d))
+                )
+
+            await stream.asend({"k": "a", "v": 15})
+            await stream.asend({"k": "c", "v": 5})
+            await stream.asend({"k": "d", "v": 20})
+
+        self.assertEqual(received["eq"], [{"k": "a", "v": 15}])
+        self.assertEqual(received["in"], [{"k": "c", "v": 5}])
+        self.assertEqual(received["range"], [{"k": "a", "v": 15}])
+
+    async def test_range_index_updates(self):
+        index = PredicateIndex()
+        ranges = {
+            "a": Range("v", 0, 10),
+            "b": Range("v", 5, 15),
+            "c": Range("v", 5),
+            "d": Range("v", high=5),
+        }
+
+        for name, predicate in ranges.items():
+            index.add(name, predicate)
+
+        index.remove("b")
+        index.add("a", Range("v", 10, 20))
+
+        for value in range(-5, 25):
+            expected = {name for name, predicate in ranges.items() if predicate({"v": value})}
+            expected.discard("b")
+            expected.discard("a")
+            if 10 <= value < 20:
+                expected.add("a")
+
+            self.assertEqual(index.select({"v": value}), expected)
+
+        for name in ranges:
+            index.remove(name)
+
+        self.assertEqual(index.indexed, 0)
+        self.assertEqual(index.select({"v": 7}), set())
+
+    async def test_windowed_join(self):
+        pairs = []
+
+        left, right = MultiStream(), MultiStream()
+        joined = await join(left, right, key=lambda x: x[0], window=10)
+
+        async with joined > AnonymousObserver(asend=lambda d, _: pairs.append(d)):
+            await left.asend(("a", 1))
+            await right.asend(("a", 2))
+            await right.asend(("b", 3))
+            await left.asend(("b", 4))
+            await left.aclose()
+            await right.aclose()
+
+        self.assertTrue(joined.closed)
+        self.assertEqual(pairs, [(("a", 1), ("a", 2)), (("b", 4), ("b", 3))])
+
+    async def test_iterator_spill(self):
+        stream = MultiStream()
+        iterator = IteratorObserver(spill_threshold=4, spill_chunk_size=3)
+
+        await (stream > iterator)
+
+        for x in range(20):
+            await stream.asend(x)
+
+        # Values are written in chunks of 3, the last one is still waiting for its chunk
+        self.assertEqual(iterator.spilled, 15)
+
+        await stream.aclose()
+
+        self.assertEqual([x async for x in iterator], list(range(20)))
+        self.assertEqual(iterator.spilled, 0)
+
+    async def test_spill_unpicklable(self):
+        spill = SpillBuffer(chunk_size=2)
+
+        spill.append(1)
+        with self.assertRaises(Exception):
+            spill.append(lambda: None)
+
+        for x in range(2, 6):
+            spill.append(x)
+
+        self.assertEqual(len(spill), 5)
+        self.assertEqual(spill.written, 4)
+
+        values = []
+        while spill:
+            values.extend(spill.popchunk())
+
+        spill.close()
+
+        self.assertEqual(values, [1, 2, 3, 4, 5])
+        self.assertEqual(spill.written, 0)
+
+    async def test_log_replay(self):
+        live = []
+        late = []
+        restarted = []
+
+        with TemporaryDirectory() as directory:
+            stream = LogStream(directory, segment_size=32)
+            async with stream, stream > AnonymousObserver(asend=lambda d, _: live.append(d)):
+                for x in range(5):
+                    await stream.asend(x)
+
+                await stream.subscribe(AnonymousObserver(asend=lambda d, _: late.append(d)), 2)
+
+                await stream.asend(5)
+
+            stream = LogStream(directory)
+            async with stream:
+                self.assertEqual(stream.offset, 6)
+
+                await stream.subscribe(AnonymousObserver(asend=lambda d, _: restarted.append(d)))
+
+        self.assertEqual(live, list(range(6)))
+        self.assertEqual(late, list(range(2, 6)))
+        self.assertEqual(restarted, list(range(6)))
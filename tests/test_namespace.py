@@ -0,0 +1,75 @@
+# Internal
+import unittest
+
+# External
+from aRx.namespace import Namespace
+
+
+class Source:
+    pass
+
+
+class Sink:
+    pass
+
+
+class TestNamespace(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = Source()
+        self.sink = Sink()
+        self.other = Source()
+
+        self.root = Namespace(self.source, "_worker")
+        self.middle = Namespace(self.sink, "asend", self.root)
+        self.leaf = Namespace(self.other, "athrow", self.middle)
+
+    def test_search_action(self) -> None:
+        self.assertIs(self.leaf.search("athrow"), self.leaf)
+        self.assertIs(self.leaf.search("asend"), self.middle)
+        self.assertIs(self.leaf.search("_worker"), self.root)
+        self.assertIsNone(self.middle.search("athrow"))
+
+    def test_search_type(self) -> None:
+        self.assertIs(self.leaf.search(Source), self.leaf)
+        self.assertIs(self.middle.search(Source), self.root)
+        self.assertIs(self.leaf.search(Sink), self.middle)
+        self.assertIsNone(self.root.search(Sink))
+
+    def test_search_ref(self) -> None:
+        self.assertIs(self.leaf.search(self.source), self.root)
+        self.assertIs(self.leaf.search(self.sink), self.middle)
+        self.assertIsNone(self.middle.search(self.other))
+        self.assertIsNone(self.leaf.search(object()))
+
+    def test_search_branched_chain(self) -> None:
+        self.assertIs(self.leaf.search("asend"), self.middle)
+
+        branch = Namespace(self.source, "asend", self.middle)
+
+        self.assertIs(branch.search("asend"), branch)
+        self.assertIs(branch.search(self.source), branch)
+        self.assertIs(self.leaf.search("asend"), self.middle)
+        self.assertIs(self.leaf.search(self.source), self.root)
+
+    def test_branch_index_shared(self) -> None:
+        self.assertIs(self.leaf.search("_worker"), self.root)
+
+        branch = Namespace(self.sink, "asend", self.leaf)
+        index = branch._chain_index()
+
+        # Only the namespaces since the closest indexed one are held by the branch index
+        self.assertIs(index.base, self.leaf._chain_index())
+        self.assertEqual(list(index.actions.values()), [branch])
+        self.assertIs(branch.search("athrow"), self.leaf)
+        self.assertIs(branch.search(self.source), self.root)
+
+    def test_contains(self) -> None:
+        self.assertIn("asend", self.leaf)
+        self.assertIn(Sink, self.leaf)
+        self.assertIn(self.sink, self.leaf)
+        self.assertNotIn("aclose", self.leaf)
+        self.assertNotIn(self.sink, self.root)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,36 @@
 # Internal
+import asyncio
 import unittest
+from os import path
+from pickle import PickleBuffer
+from tempfile import TemporaryDirectory
 
 # External
 import asynctest
 
-from aRx.streams import MultiStream
+from aRx.codecs import Encoded, PickleCodec, StructCodec
+from aRx.streams import MultiStream, SingleStream
 from aRx.namespace import Namespace
 from aRx.observers import AnonymousObserver
-from aRx.operators import Map, Assert, Filter
+from aRx.operators import (
+    Map,
+    Skip,
+    Take,
+    Assert,
+    Decode,
+    Encode,
+    Filter,
+    Timeout,
+    RateLimit,
+    SampleRate,
+    SlidingWindow,
+    ApproxQuantiles,
+    EventTimeWindow,
+    ReservoirSample,
+    ApproxDistinctCount,
+)
+from aRx.operations import checkpoint, merge_sorted
+from aRx.observables import FromIterable
 
 
 # noinspection PyAttributeOutsideInit
@@ -37,6 +60,44 @@ class TestOperators(asynctest.TestCase, unittest.TestCase):
         self.assertTrue(listener.closed)
         self.assertEqual(results, ["test", 10, 1.000, {}, []])
 
+    async def test_single_stream_backlog(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        stream = SingleStream()
+        await stream.asend(1)
+        await stream.asend(2)
+
+        async with stream > listener:
+            await stream.asend(3)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [1, 2, 3])
+
+    async def test_single_stream_close_before_subscribe(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        stream = SingleStream()
+        await stream.asend(1)
+        await stream.asend(2)
+
+        closing = asyncio.ensure_future(stream.aclose())
+        await asyncio.sleep(0)
+        self.assertFalse(closing.done())
+
+        await (stream > listener)
+        self.assertTrue(await closing)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [1, 2])
+
     async def test_stream_filter_observation(self):
         listener = AnonymousObserver(asend=lambda d, _: self.assertTrue(bool(d % 2)))
 
@@ -87,6 +148,383 @@ class TestOperators(asynctest.TestCase, unittest.TestCase):
         self.assertTrue(stream.closed)
         self.assertTrue(listener.closed)
 
+    async def test_stream_take_observation(self):
+        results = []
+
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async with MultiStream() as stream, stream | Take(2) > listener:
+            await stream.asend(1)
+            self.assertFalse(listener.closed)
+            await stream.asend(2)
+            self.assertTrue(listener.closed)
+            await stream.asend(3)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(stream.closed)
+        self.assertEqual(results, [1, 2])
+
+    async def test_stream_tail_observation(self):
+        taken = []
+        skipped = []
+
+        namespaces = []
+
+        take_listener = AnonymousObserver(
+            asend=lambda d, n: (taken.append(d), namespaces.append(n.previous))
+        )
+        skip_listener = AnonymousObserver(asend=lambda d, _: skipped.append(d))
+
+        async with MultiStream() as stream:
+            async with stream | Take(-3) > take_listener, stream | Skip(-3) > skip_listener:
+                for x in range(10):
+                    await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertTrue(take_listener.closed)
+        self.assertTrue(skip_listener.closed)
+        self.assertEqual(taken, [7, 8, 9])
+        # Values in the tail share a single namespace, rather than retaining one each
+        self.assertEqual(len({id(namespace) for namespace in namespaces}), 1)
+        self.assertEqual(skipped, [0, 1, 2, 3, 4, 5, 6])
+
+    async def test_stream_sample_observation(self):
+        sampled = []
+        hashed = []
+
+        sample_listener = AnonymousObserver(asend=lambda d, _: sampled.append(d))
+        hash_listener = AnonymousObserver(asend=lambda d, _: hashed.append(d))
+
+        async with MultiStream() as stream:
+            async with stream | ReservoirSample(5, seed=0) > sample_listener, stream | SampleRate(
+                0.5, key=str, seed=0
+            ) > hash_listener:
+                for x in range(100):
+                    await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(len(sampled), 5)
+        self.assertEqual(sampled, sorted(set(sampled)))
+        self.assertTrue(0 < len(hashed) < 100)
+
+        # Deterministic sampling always selects the same keys
+        async with MultiStream() as stream:
+            rerun = []
+            async with stream | SampleRate(0.5, key=str, seed=0) > AnonymousObserver(
+                asend=lambda d, _: rerun.append(d)
+            ):
+                for x in range(100):
+                    await stream.asend(x)
+
+        self.assertEqual(rerun, hashed)
+
+    async def test_stream_approx_observation(self):
+        counts = []
+        quantiles = []
+
+        count_listener = AnonymousObserver(asend=lambda d, _: counts.append(d))
+        quantiles_listener = AnonymousObserver(asend=lambda d, _: quantiles.append(d))
+
+        async with MultiStream() as stream:
+            async with stream | ApproxDistinctCount() > count_listener, stream | ApproxQuantiles(
+                (0.5,)
+            ) > quantiles_listener:
+                for x in range(1000):
+                    await stream.asend(x % 100)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(len(counts), 1)
+        self.assertAlmostEqual(counts[0], 100, delta=5)
+        self.assertEqual(len(quantiles), 1)
+        self.assertAlmostEqual(quantiles[0][0.5], 50, delta=5)
+
+        typed_counts = []
+        typed_listener = AnonymousObserver(asend=lambda d, _: typed_counts.append(d))
+
+        async with MultiStream() as stream:
+            async with stream | ApproxDistinctCount(every=200) > typed_listener:
+                for x in range(100):
+                    # Values of different types are distinct, even if they look the same
+                    await stream.asend(x)
+                    await stream.asend(str(x))
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(len(typed_counts), 1)
+        self.assertAlmostEqual(typed_counts[0], 200, delta=2)
+
+    async def test_stream_timeout_observation(self):
+        results = []
+        errors = []
+
+        fallback_listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+        error_listener = AnonymousObserver(athrow=lambda e, _: errors.append(e))
+
+        async with MultiStream() as stream, stream | Timeout(
+            idle=0.05, fallback=None
+        ) > fallback_listener:
+            await stream.asend(1)
+            await asyncio.sleep(0.2)
+            await stream.asend(2)
+
+        async with MultiStream() as stream, stream | Timeout(idle=0.05) > error_listener:
+            await asyncio.sleep(0.1)
+
+        # Let the shared timing wheel go idle
+        await asyncio.sleep(0.05)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results[0], 1)
+        self.assertEqual(results[-1], 2)
+        self.assertIn(None, results)
+        self.assertIsInstance(errors[0], TimeoutError)
+
+    async def test_stream_timeout_per_element(self):
+        results = []
+
+        async def handle(value, _):
+            if value == 1:
+                await asyncio.sleep(1)
+            results.append(value)
+
+        listener = AnonymousObserver(asend=handle)
+
+        async with MultiStream() as stream, stream | Timeout(0.05, fallback=0) > listener:
+            await stream.asend(1)
+            await stream.asend(2)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [0, 2])
+
+    async def test_stream_timeout_handled_in_time(self):
+        results = []
+
+        async def handle(value, _):
+            await asyncio.sleep(0)
+            results.append(value)
+
+        listener = AnonymousObserver(asend=handle)
+
+        async with MultiStream() as stream, stream | Timeout(1, fallback=0) > listener:
+            for x in range(3):
+                await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [0, 1, 2])
+
+    async def test_stream_rate_limit_observation(self):
+        waited = []
+        dropped = []
+
+        wait_limit = RateLimit(50)
+        drop_limit = RateLimit(1, 2, drop=True)
+
+        wait_listener = AnonymousObserver(asend=lambda d, _: waited.append(d))
+        drop_listener = AnonymousObserver(asend=lambda d, _: dropped.append(d))
+
+        async with MultiStream() as stream:
+            async with stream | wait_limit > wait_listener, stream | drop_limit > drop_listener:
+                for x in range(3):
+                    await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(waited, [0, 1, 2])
+        self.assertAlmostEqual(wait_limit.throttled_time, 0.04, delta=0.01)
+        self.assertEqual(dropped, [0, 1])
+        self.assertEqual(drop_limit.dropped, 1)
+
+    async def test_stream_sliding_window_observation(self):
+        maxima = []
+        means = []
+
+        max_listener = AnonymousObserver(asend=lambda d, _: maxima.append(d))
+        mean_listener = AnonymousObserver(asend=lambda d, _: means.append(d))
+
+        async with MultiStream() as stream:
+            async with stream | SlidingWindow("max", 3) > max_listener, stream | SlidingWindow(
+                "mean", 2
+            ) > mean_listener:
+                for x in (1, 3, 2, 5, 1):
+                    await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(maxima, [1, 3, 3, 5, 5])
+        self.assertEqual(means, [1, 2, 2.5, 3.5, 3])
+
+        counts = []
+
+        async with MultiStream() as stream:
+            async with stream | SlidingWindow("count", 2) > AnonymousObserver(
+                asend=lambda d, _: counts.append(d)
+            ):
+                # Counting works for values that can't be summed
+                for x in ("a", "b", "c"):
+                    await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(counts, [1, 2, 2])
+
+    async def test_stream_event_time_window_observation(self):
+        tumbling = []
+        hopping = []
+
+        tumbling_listener = AnonymousObserver(asend=lambda d, _: tumbling.append(tuple(d)))
+        hopping_listener = AnonymousObserver(asend=lambda d, _: hopping.append(tuple(d)))
+
+        tumbling_window = EventTimeWindow(
+            "sum", 10, timestamp=lambda x: x[0], key=lambda x: x[1], allowed_lateness=2
+        )
+
+        async with MultiStream() as stream:
+            async with stream | tumbling_window > tumbling_listener, stream | EventTimeWindow(
+                "max", 10, slide=5, timestamp=lambda x: x[0], key=lambda x: x[1]
+            ) > hopping_listener:
+                for x in ((1, 1), (4, 2), (11, 3), (9, 4), (13, 5), (3, 6), (25, 7)):
+                    await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(tumbling, [(0, 10, 7), (10, 20, 8), (20, 30, 7)])
+        self.assertEqual(tumbling_window.late, 1)
+        self.assertEqual(
+            hopping, [(-5, 5, 2), (0, 10, 2), (5, 15, 5), (10, 20, 5), (20, 30, 7), (25, 35, 7)]
+        )
+
+    async def test_checkpoint_restore(self):
+        first = []
+        second = []
+
+        with TemporaryDirectory() as directory:
+            state_path = path.join(directory, "checkpoint")
+
+            take, index_map = Take(3), Map(lambda x, i: (x, i), with_index=True)
+            saver = checkpoint(state_path, {"take": take, "map": index_map})
+            async with MultiStream() as stream:
+                async with stream | index_map | take > AnonymousObserver(
+                    asend=lambda d, _: first.append(d)
+                ):
+                    await stream.asend("a")
+                    await stream.asend("b")
+                    saver.save()
+
+            take, index_map = Take(3), Map(lambda x, i: (x, i), with_index=True)
+            restorer = checkpoint(state_path, {"take": take, "map": index_map})
+            async with restorer, MultiStream() as stream:
+                async with stream | index_map | take > AnonymousObserver(
+                    asend=lambda d, _: second.append(d)
+                ):
+                    for x in "cde":
+                        await stream.asend(x)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(first, [("a", 0), ("b", 1)])
+        self.assertEqual(second, [("c", 2)])
+
+    async def test_stream_codec_observation(self):
+        decoded = []
+        batches = []
+
+        codec = StructCodec("<ih")
+
+        async with MultiStream() as stream:
+            async with stream | Encode() | Decode() > AnonymousObserver(
+                asend=lambda d, _: decoded.append(d)
+            ), stream | Encode(codec, batch=True) | Decode(codec, batch=True) > AnonymousObserver(
+                asend=lambda d, _: batches.append(d)
+            ):
+                await stream.asend([(1, 2), (3, 4)])
+                await stream.asend([(5, 6)])
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(decoded, [[(1, 2), (3, 4)], [(5, 6)]])
+        self.assertEqual(batches, [[(1, 2), (3, 4)], [(5, 6)]])
+
+    async def test_stream_codec_out_of_band(self):
+        encoded = []
+        decoded = []
+
+        payload = bytearray(b"payload" * 128)
+        codec = PickleCodec()
+
+        async with MultiStream() as stream:
+            async with stream | Encode(codec) > AnonymousObserver(
+                asend=lambda d, _: encoded.append(d)
+            ), stream | Encode(codec) | Decode(codec) > AnonymousObserver(
+                asend=lambda d, _: decoded.append(bytes(d))
+            ):
+                await stream.asend(PickleBuffer(payload))
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(decoded, [bytes(payload)])
+
+        (value,) = encoded
+        self.assertIsInstance(value, Encoded)
+        # Payload is kept out of the pickled data
+        self.assertNotIn(b"payload", value.data)
+        self.assertLess(len(value.data), len(payload))
+
+        # Buffer shares the payload memory, instead of holding a copy of it
+        (buffer,) = value.buffers
+        view = memoryview(buffer)
+        payload[0] = ord("P")
+        self.assertEqual(view[0], ord("P"))
+
+    async def test_pipe_iteration(self):
+        results = [value async for value in FromIterable(range(10)) | Map(lambda x: x * 2)]
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, list(range(0, 20, 2)))
+
+    async def test_pipe_batches(self):
+        results = []
+
+        async for batch in (FromIterable(range(10)) | Map(lambda x: x * 2)).batches(3, 0.01):
+            self.assertLessEqual(len(batch), 3)
+            results.extend(batch)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, list(range(0, 20, 2)))
+
+    async def test_merge_sorted(self):
+        merged = await merge_sorted(
+            FromIterable([1, 4, 7, 9]), FromIterable([2, 3, 8]), FromIterable([5]), lookahead=1
+        )
+
+        results = [value async for value in merged]
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [1, 2, 3, 4, 5, 7, 8, 9])
+
+    async def test_merge_sorted_exhaustion(self):
+        merged = await merge_sorted(
+            FromIterable([]), FromIterable(range(0, 50, 2)), FromIterable([-3, 5]), key=abs
+        )
+
+        results = []
+        async with merged > AnonymousObserver(asend=lambda d, _: results.append(d)) as listener:
+            # Merge closes by itself once every source is exhausted
+            while not listener.closed:
+                await asyncio.sleep(0.01)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [0, 2, -3, 4, 5] + list(range(6, 50, 2)))
+
+    async def test_merge_sorted_key_error(self):
+        merged = await merge_sorted(FromIterable([1, None, 4]), FromIterable([2, 3]), key=abs)
+
+        results = []
+        errors = []
+        listener = AnonymousObserver(
+            asend=lambda d, _: results.append(d), athrow=lambda e, _: errors.append(e)
+        )
+
+        async with merged > listener:
+            # A value whose key can't be computed is reported, without stalling the merge
+            while not listener.closed:
+                await asyncio.sleep(0.01)
+
+        self.assertIsNone(self.exception_ctx)
+        self.assertEqual(results, [1, 2, 3, 4])
+        self.assertEqual([type(error) for error in errors], [TypeError])
+
     async def test_namespace(self):
 
         listener = AnonymousObserver(
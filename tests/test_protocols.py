@@ -0,0 +1,110 @@
+# Internal
+import typing as T
+import unittest
+
+# External
+from aRx.streams import SingleStream
+from aRx.operators import Map
+from aRx.protocols import TransformerProtocol, ObservableProtocolWithOperators
+from aRx.operations import pipe
+from aRx.protocols.conformance import conforms
+from aRx.protocols.observable_protocol import add_operators as add_observable_operators
+from aRx.protocols.transformer_protocol import add_operators as add_transformer_operators
+
+
+class ProtocolOnlyTransformer:
+    """Transformer that implements the protocol, but none of the operators."""
+
+    def __init__(self):
+        self.stream = SingleStream()
+        self.keep_alive = False
+
+    @property
+    def closed(self):
+        return self.stream.closed
+
+    def asend(self, data, namespace=None):
+        return self.stream.asend(data, namespace)
+
+    def athrow(self, main_exc, namespace=None):
+        return self.stream.athrow(main_exc, namespace)
+
+    def aclose(self):
+        return self.stream.aclose()
+
+    def __observe__(self, observer):
+        return self.stream.__observe__(observer)
+
+    def __dispose__(self, observer):
+        return self.stream.__dispose__(observer)
+
+
+class TestConformance(unittest.TestCase):
+    def test_cached_per_type(self):
+        @T.runtime_checkable
+        class Named(T.Protocol):
+            def name(self) -> str:
+                ...
+
+        class Thing:
+            pass
+
+        self.assertFalse(conforms(Thing(), Named))
+
+        # Conformance is decided once per type, later instances reuse the result
+        thing = Thing()
+        thing.name = lambda: "thing"
+        self.assertTrue(isinstance(thing, Named))
+        self.assertFalse(conforms(thing, Named))
+
+    def test_negative_result(self):
+        self.assertFalse(conforms(object(), TransformerProtocol))
+        # Answered by the cache, negative results are kept as well
+        self.assertFalse(conforms(object(), TransformerProtocol))
+        self.assertTrue(conforms(Map(str), TransformerProtocol))
+
+    def test_protocol_only(self):
+        transformer = ProtocolOnlyTransformer()
+
+        self.assertTrue(conforms(transformer, TransformerProtocol))
+        self.assertFalse(conforms(transformer, ObservableProtocolWithOperators))
+
+        # Wrappers are checked as types of their own
+        wrapped = add_transformer_operators(transformer)
+        self.assertTrue(conforms(wrapped, ObservableProtocolWithOperators))
+
+
+class TestAddOperators(unittest.TestCase):
+    def test_native(self):
+        transformer = Map(str)
+
+        self.assertIs(add_transformer_operators(transformer), transformer)
+        self.assertIs(add_observable_operators(transformer), transformer)
+
+    def test_wrapped(self):
+        transformer = ProtocolOnlyTransformer()
+
+        for add_operators in (add_transformer_operators, add_observable_operators):
+            wrapped = add_operators(transformer)
+
+            # Wrapped without copying, nor changing, the original object
+            self.assertIsNot(wrapped, transformer)
+            self.assertIs(wrapped._wrapped, transformer)
+            self.assertNotIn("__gt__", vars(transformer))
+            self.assertNotIn("__or__", vars(transformer))
+
+            # Wrapper delegates to the original object
+            self.assertIs(wrapped.stream, transformer.stream)
+            self.assertIsInstance(wrapped | Map(str), pipe)
+
+    def test_wrapped_transformer(self):
+        transformer = ProtocolOnlyTransformer()
+        wrapped = add_transformer_operators(transformer)
+
+        wrapped.keep_alive = True
+        self.assertTrue(transformer.keep_alive)
+        self.assertFalse(wrapped.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
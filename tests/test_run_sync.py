@@ -0,0 +1,97 @@
+# Internal
+import asyncio
+import unittest
+
+# External
+from aRx.observers import AnonymousObserver
+from aRx.operators import Map, Take, Filter, Timeout, RateLimit, SlidingWindow
+from aRx.operations import run_sync
+from aRx.observables import FromIterable
+
+
+class TestRunSync(unittest.TestCase):
+    def test_sync_pipeline(self):
+        results = []
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        run_sync(
+            FromIterable(range(10)) | Map(lambda x: x * 2) | Filter(lambda x: x % 3 == 0) | Take(2)
+            > listener
+        )
+
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [0, 6])
+
+    def test_async_fallback(self):
+        results = []
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        async def mapper(value):
+            await asyncio.sleep(0)
+            return value + 1
+
+        run_sync(FromIterable(range(3)) | Map(mapper) > listener)
+
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [1, 2, 3])
+
+    def test_error_propagation(self):
+        listener = AnonymousObserver()
+
+        def mapper(value):
+            if value == 2:
+                raise ValueError(value)
+            return value
+
+        with self.assertRaises(ValueError):
+            run_sync(FromIterable(range(5)) | Map(mapper) > listener)
+
+        self.assertTrue(listener.closed)
+
+    def test_requires_iterable_source(self):
+        with self.assertRaises(TypeError):
+            run_sync(Take(1) > AnonymousObserver())
+
+    def test_loop_bound_operator(self):
+        results = []
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        run_sync(FromIterable(range(5)) | Timeout(idle=1) | Map(lambda x: x * 2) > listener)
+
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [0, 2, 4, 6, 8])
+
+    def test_loop_bound_operator_timeout(self):
+        results = []
+
+        async def handle(value, _):
+            if value == 1:
+                await asyncio.sleep(1)
+            results.append(value)
+
+        listener = AnonymousObserver(asend=handle)
+
+        run_sync(FromIterable(range(3)) | Timeout(0.05, fallback=-1) > listener)
+
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [0, -1, 2])
+
+    def test_rate_limit(self):
+        results = []
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        limit = RateLimit(1000, 10)
+        run_sync(FromIterable(range(20)) | limit > listener)
+
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, list(range(20)))
+        self.assertGreater(limit.observed_rate, 0)
+
+    def test_sliding_window_duration(self):
+        results = []
+        listener = AnonymousObserver(asend=lambda d, _: results.append(d))
+
+        run_sync(FromIterable("abc") | SlidingWindow("count", duration=60) > listener)
+
+        self.assertTrue(listener.closed)
+        self.assertEqual(results, [1, 2, 3])